@@ -1,27 +1,208 @@
 """Pydantic AI Agent for orchestrator with multi-LLM support"""
 
 import asyncio
-from typing import Dict, List, Optional, Any, Union
+import json
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime
+from typing import (
+    Annotated,
+    Any,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Dict,
+    Final,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
+import httpx
 import structlog
+from anthropic.types.beta import BetaMessageParam, BetaTextBlockParam
+from pydantic import Field, TypeAdapter
 from pydantic_ai import Agent, RunContext
-from pydantic_ai.models import Model, infer_model
+from pydantic_ai.messages import ModelMessage
+from pydantic_ai.models import Model
+from pydantic_ai.models.anthropic import AnthropicModel
+from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.providers.anthropic import AnthropicProvider
+from pydantic_ai.providers.openai import OpenAIProvider
+from pydantic_ai.tools import ToolDefinition
+# pydantic requires the typing_extensions versions on Python < 3.12
+from typing_extensions import NotRequired, TypedDict
 
+from .batching import RoutingBatcher
 from .config import get_settings
+from .discovery import UnifiedDiscoveryService, agent_tool_payload
 from .models import (
-    RoutingRequest, RoutingDecision, AgentResponse, 
-    DiscoveredAgent, AgentCapability, ProtocolType,
-    OrchestrationMetrics, LLMProvider
+    AgentResponse,
+    DiscoveredAgent,
+    LLMProvider,
+    OrchestrationMetrics,
+    ProtocolType,
+    RoutingDecision,
+    RoutingRequest,
 )
-from .discovery import UnifiedDiscoveryService
 
 logger = structlog.get_logger(__name__)
 
+# Prepared once at import so routing decisions stashed in response metadata
+# are dumped straight to JSON-ready primitives.
+_ROUTING_DECISION_ADAPTER = TypeAdapter(RoutingDecision)
+
+_SYSTEM_PROMPT: Final[str] = """
+You are an intelligent agent orchestrator responsible for routing user queries to the most appropriate specialized agents.
+
+Your role is to:
+1. Analyze incoming user queries to understand their intent and requirements
+2. Evaluate available specialized agents and their capabilities 
+3. Select the best agent(s) to handle each query
+4. Make routing decisions with confidence scores
+5. Provide clear reasoning for your choices
+
+You have access to a discovery service that maintains a registry of available agents across multiple protocols (ACP, A2A, MCP). Each agent has:
+- Capabilities: What the agent can do (e.g., "greeting", "math", "weather")
+- Protocol: Communication protocol (ACP, A2A, MCP)
+- Health status: Whether the agent is currently available
+- Metadata: Additional information about the agent
+
+Guidelines for routing decisions:
+- Always prefer healthy agents over degraded/unhealthy ones
+- Match query intent to agent capabilities as closely as possible
+- Consider agent specialization (prefer specialized agents over general ones)
+- For complex queries, consider if multiple agents might be needed
+- Provide confidence scores between 0.0 and 1.0
+- Include clear reasoning for your decisions
+
+Be concise but thorough in your analysis. Focus on making the best routing decision for the user's needs.
+""".strip()
+
+# Model used for each provider
+_MODEL_NAMES: Final[Dict[LLMProvider, str]] = {
+    LLMProvider.OPENAI: 'gpt-4o',
+    LLMProvider.ANTHROPIC: 'claude-3-5-sonnet-20241022',
+}
+
+# Pydantic AI agents are stateless between runs (per-request state travels in
+# OrchestratorContext), so one model + agent with registered tools is shared by
+# every OrchestratorAgent built from the same settings instance, provider, model
+# and API key. Each entry holds its settings object so the id in the key cannot
+# be reused by another instance; the cache is a small LRU so replaced settings
+# (config reloads, tests) are released rather than pinned for the process life.
+_AgentCacheKey = Tuple[int, LLMProvider, Optional[str], Optional[str]]
+_AGENT_CACHE: "OrderedDict[_AgentCacheKey, Tuple[Any, Model, Agent]]" = OrderedDict()
+_AGENT_CACHE_SIZE = 4
+
+
+def _agent_cache_key(settings: Any) -> _AgentCacheKey:
+    """Key a shared model + agent by everything that went into building it"""
+    provider = settings.llm_provider
+    api_key = (
+        settings.anthropic_api_key if provider == LLMProvider.ANTHROPIC
+        else settings.openai_api_key
+    )
+    return (id(settings), provider, _MODEL_NAMES.get(provider), api_key)
+
+# Per-request prompts are filled into these fixed templates
+_ROUTING_QUERY_TEMPLATE: Final[str] = """{request}
+
+{agents_section}
+
+Please analyze this query and determine the best agent to handle it. Consider:
+1. What capabilities are needed to answer this query?
+2. Which available agents have those capabilities?
+3. What is the best match based on agent specialization?
+4. How confident are you in this routing decision?
+
+{tools_hint}
+Return a routing decision with the selected agent ID, confidence score, and reasoning."""
+
+_BATCH_ROUTING_QUERY_TEMPLATE: Final[str] = """Route each of the following {count} requests independently.
+
+{requests}
+
+{agents_section}
+
+For every request, determine the best agent to handle it based on the capabilities
+it needs and agent specialization, and how confident you are in that choice.
+
+{tools_hint}
+Return one routing decision per request, each carrying its Request ID as request_id,
+with the selected agent ID, confidence score, and reasoning."""
+
+# Successful LLM decisions are reused for identical requests while the registry
+# is unchanged, bounded in both size and age
+_DECISION_CACHE_SIZE = 1024
+_DECISION_CACHE_TTL_SECONDS = 60.0
+
+# Above this many healthy agents the roster no longer goes into the prompt and
+# the LLM falls back to discovering agents through the get_available_agents tool
+_MAX_PROMPT_AGENTS = 150
+
+# The LLM is skipped only when the query names one of the chosen agent's
+# capabilities; a sole agent gets less confidence than an explicit preference
+_SOLE_AGENT_CONFIDENCE = 0.9
+_QUERY_WORD_PATTERN = re.compile(r"[\w-]+")
+
+
+class _RoutingChoice(TypedDict):
+    """Structured output requested from the LLM
+    
+    Agents are referenced by ID and expanded into full DiscoveredAgent records
+    from discovery afterwards, which keeps the output schema (and the
+    validation of each response) small.
+    """
+    request_id: NotRequired[str]
+    selected_agent_id: Optional[str]
+    reasoning: str
+    confidence: Annotated[float, Field(ge=0.0, le=1.0)]
+    alternative_agent_ids: NotRequired[List[str]]
+
+
+def _truncate(text: str, limit: int = 100) -> str:
+    """Shorten text for log output, marking where it was cut"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+class _PromptCachingAnthropicModel(AnthropicModel):
+    """AnthropicModel that marks the static prompt prefix as cacheable
+    
+    The system prompt and tool schemas are identical on every routing call, so
+    an ephemeral cache breakpoint on the system prompt lets Anthropic reuse
+    that prefix instead of re-processing it. OpenAI caches identical prompt
+    prefixes automatically, which is why _SYSTEM_PROMPT is a fixed constant.
+    
+    pydantic-ai 0.4.11 exposes no public cache setting, so this wraps the
+    private ``_map_message`` hook; a test pins its upstream signature.
+    """
+    
+    # The API accepts text blocks for the system prompt; upstream only ever sends a str
+    async def _map_message(  # type: ignore[override]
+        self,
+        messages: List[ModelMessage]
+    ) -> Tuple[Union[str, List[BetaTextBlockParam]], List[BetaMessageParam]]:
+        system_prompt, anthropic_messages = await super()._map_message(messages)
+        if isinstance(system_prompt, str) and system_prompt:
+            system_prompt = [
+                {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+            ]
+        return system_prompt, anthropic_messages
+
 
 class OrchestratorContext:
     """Context passed to Pydantic AI agent containing orchestrator state"""
     
+    # Allocated once per routed request, so keep it free of a per-instance __dict__
+    __slots__ = (
+        "discovery_service", "request", "available_agents",
+        "agents_in_prompt", "routing_start_time"
+    )
+    
     def __init__(
         self,
         discovery_service: UnifiedDiscoveryService,
@@ -30,30 +211,74 @@ class OrchestratorContext:
         self.discovery_service = discovery_service
         self.request = request
         self.available_agents: List[DiscoveredAgent] = []
-        self.routing_start_time = datetime.utcnow()
+        self.agents_in_prompt = False
+        self.routing_start_time = time.perf_counter()
+
+
+class _MetricsCore:
+    """Plain request counters updated on the routing hot path"""
+    
+    __slots__ = ("total_requests", "successful_requests", "failed_requests")
+    
+    def __init__(self):
+        self.total_requests = 0
+        self.successful_requests = 0
+        self.failed_requests = 0
 
 
 class OrchestratorAgent:
     """Main orchestrator agent using Pydantic AI for intelligent routing"""
     
-    def __init__(self, discovery_service: UnifiedDiscoveryService):
+    def __init__(
+        self,
+        discovery_service: UnifiedDiscoveryService,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         self.discovery_service = discovery_service
         self.settings = get_settings()
-        self.metrics = OrchestrationMetrics()
-        
-        # Initialize the AI model based on configuration
-        self.model = self._create_model()
+        # Pooled client for agent calls, owned by the caller; the A2A client
+        # built on it is created on first use and then reused
+        self._http_client = http_client
+        self._a2a_client = None
+        self._metrics = _MetricsCore()
+        self._agent_table_cache: Optional[Tuple[Tuple[DiscoveredAgent, ...], str]] = None
+        self._batcher: Optional[RoutingBatcher] = None
+        self._decision_cache: "OrderedDict[Tuple, Tuple[float, RoutingDecision]]" = OrderedDict()
+        self._decisions_in_flight: Dict[Tuple, "asyncio.Task[RoutingDecision]"] = {}
         
-        # Create the Pydantic AI agent
-        self.agent = Agent(
-            model=self.model,
-            system_prompt=self._get_system_prompt(),
-            deps_type=OrchestratorContext,
-            output_type=RoutingDecision
-        )
+        cache_key = _agent_cache_key(self.settings)
+        cached = _AGENT_CACHE.get(cache_key)
+        if cached is not None and cached[0] is self.settings:
+            _AGENT_CACHE.move_to_end(cache_key)
+            _, self.model, self.agent = cached
+        else:
+            # Initialize the AI model based on configuration
+            self.model = self._create_model()
+            
+            # Create the Pydantic AI agent
+            self.agent = Agent(
+                model=self.model,
+                system_prompt=_SYSTEM_PROMPT,
+                deps_type=OrchestratorContext,
+                output_type=_RoutingChoice
+            )
+            
+            # Register agent tools/functions
+            self._register_agent_functions()
+            
+            _AGENT_CACHE[cache_key] = (self.settings, self.model, self.agent)
+            if len(_AGENT_CACHE) > _AGENT_CACHE_SIZE:
+                _AGENT_CACHE.popitem(last=False)
         
-        # Register agent tools/functions
-        self._register_agent_functions()
+        # Protocol -> executor dispatch table used by _execute_on_agent
+        self._protocol_executors: Dict[
+            ProtocolType,
+            Callable[[DiscoveredAgent, RoutingRequest], Awaitable[Dict[str, Any]]]
+        ] = {
+            ProtocolType.A2A: self._execute_a2a,
+            ProtocolType.ACP: self._execute_simulated,
+            ProtocolType.MCP: self._execute_simulated,
+        }
         
         logger.info(
             "Orchestrator agent initialized",
@@ -63,102 +288,53 @@ class OrchestratorAgent:
     
     def _create_model(self) -> Model:
         """Create appropriate AI model based on configuration"""
-        import os
-        
         provider = self.settings.llm_provider
         
+        # Credentials are handed to the provider directly rather than via
+        # os.environ, so model creation never touches process-global state.
         if provider == LLMProvider.OPENAI:
             if not self.settings.openai_api_key:
                 raise ValueError("OpenAI API key is required when using OpenAI provider")
             
-            # Set environment variable temporarily for model creation
-            old_key = os.environ.get('OPENAI_API_KEY')
-            os.environ['OPENAI_API_KEY'] = self.settings.openai_api_key
-            try:
-                model = infer_model('openai:gpt-4o')
-            finally:
-                if old_key is not None:
-                    os.environ['OPENAI_API_KEY'] = old_key
-                else:
-                    os.environ.pop('OPENAI_API_KEY', None)
-            return model
+            return OpenAIModel(
+                _MODEL_NAMES[LLMProvider.OPENAI],
+                provider=OpenAIProvider(api_key=self.settings.openai_api_key)
+            )
         
         elif provider == LLMProvider.ANTHROPIC:
             if not self.settings.anthropic_api_key:
                 raise ValueError("Anthropic API key is required when using Anthropic provider")
             
-            # Set environment variable temporarily for model creation
-            old_key = os.environ.get('ANTHROPIC_API_KEY')
-            os.environ['ANTHROPIC_API_KEY'] = self.settings.anthropic_api_key
-            try:
-                model = infer_model('anthropic:claude-3-5-sonnet-20241022')
-            finally:
-                if old_key is not None:
-                    os.environ['ANTHROPIC_API_KEY'] = old_key
-                else:
-                    os.environ.pop('ANTHROPIC_API_KEY', None)
-            return model
+            return _PromptCachingAnthropicModel(
+                _MODEL_NAMES[LLMProvider.ANTHROPIC],
+                provider=AnthropicProvider(api_key=self.settings.anthropic_api_key)
+            )
         
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}")
     
     def _get_system_prompt(self) -> str:
         """Get the system prompt for the orchestrator agent"""
-        return """
-You are an intelligent agent orchestrator responsible for routing user queries to the most appropriate specialized agents.
-
-Your role is to:
-1. Analyze incoming user queries to understand their intent and requirements
-2. Evaluate available specialized agents and their capabilities 
-3. Select the best agent(s) to handle each query
-4. Make routing decisions with confidence scores
-5. Provide clear reasoning for your choices
-
-You have access to a discovery service that maintains a registry of available agents across multiple protocols (ACP, A2A, MCP). Each agent has:
-- Capabilities: What the agent can do (e.g., "greeting", "math", "weather")
-- Protocol: Communication protocol (ACP, A2A, MCP)
-- Health status: Whether the agent is currently available
-- Metadata: Additional information about the agent
-
-Guidelines for routing decisions:
-- Always prefer healthy agents over degraded/unhealthy ones
-- Match query intent to agent capabilities as closely as possible
-- Consider agent specialization (prefer specialized agents over general ones)
-- For complex queries, consider if multiple agents might be needed
-- Provide confidence scores between 0.0 and 1.0
-- Include clear reasoning for your decisions
-
-Be concise but thorough in your analysis. Focus on making the best routing decision for the user's needs.
-        """.strip()
+        return _SYSTEM_PROMPT
     
     def _register_agent_functions(self):
         """Register tools/functions available to the AI agent"""
         
-        @self.agent.tool
-        async def get_available_agents(ctx: RunContext[OrchestratorContext]) -> List[Dict[str, Any]]:
+        async def omit_when_agents_in_prompt(
+            ctx: RunContext[OrchestratorContext],
+            tool_def: ToolDefinition
+        ) -> Optional[ToolDefinition]:
+            # The roster is already in the prompt, so skip the extra round-trip
+            return None if ctx.deps.agents_in_prompt else tool_def
+        
+        @self.agent.tool(prepare=omit_when_agents_in_prompt)
+        async def get_available_agents(ctx: RunContext[OrchestratorContext]) -> str:
             """Get list of currently available and healthy agents"""
             agents = await ctx.deps.discovery_service.get_healthy_agents()
             ctx.deps.available_agents = agents
             
-            result = [
-                {
-                    "agent_id": agent.agent_id,
-                    "name": agent.name,
-                    "protocol": agent.protocol.value,
-                    "capabilities": [
-                        {
-                            "name": cap.name,
-                            "description": cap.description,
-                            "tags": cap.tags
-                        }
-                        for cap in agent.capabilities
-                    ],
-                    "status": agent.status.value,
-                    "endpoint": agent.endpoint,
-                    "metadata": agent.metadata
-                }
-                for agent in agents
-            ]
+            # Pre-serialized JSON is passed to the LLM verbatim, skipping per-call encoding
+            result = await ctx.deps.discovery_service.get_healthy_agents_payload_json()
             
             logger.info(
                 "LLM_TOOL_CALL: get_available_agents",
@@ -178,25 +354,7 @@ Be concise but thorough in your analysis. Focus on making the best routing decis
             """Get agents that have a specific capability"""
             agents = await ctx.deps.discovery_service.get_agents_by_capability(capability)
             
-            result = [
-                {
-                    "agent_id": agent.agent_id,
-                    "name": agent.name,
-                    "protocol": agent.protocol.value,
-                    "capabilities": [
-                        {
-                            "name": cap.name,
-                            "description": cap.description,
-                            "tags": cap.tags
-                        }
-                        for cap in agent.capabilities
-                    ],
-                    "status": agent.status.value,
-                    "endpoint": agent.endpoint,
-                    "metadata": agent.metadata
-                }
-                for agent in agents
-            ]
+            result = [agent_tool_payload(agent) for agent in agents]
             
             logger.info(
                 "LLM_TOOL_CALL: get_agents_by_capability",
@@ -219,25 +377,7 @@ Be concise but thorough in your analysis. Focus on making the best routing decis
                 protocol_type = ProtocolType(protocol.lower())
                 agents = await ctx.deps.discovery_service.get_agents_by_protocol(protocol_type)
                 
-                result = [
-                    {
-                        "agent_id": agent.agent_id,
-                        "name": agent.name,
-                        "protocol": agent.protocol.value,
-                        "capabilities": [
-                            {
-                                "name": cap.name,
-                                "description": cap.description,
-                                "tags": cap.tags
-                            }
-                            for cap in agent.capabilities
-                        ],
-                        "status": agent.status.value,
-                        "endpoint": agent.endpoint,
-                        "metadata": agent.metadata
-                    }
-                    for agent in agents
-                ]
+                result = [agent_tool_payload(agent) for agent in agents]
                 
                 logger.info(
                     "LLM_TOOL_CALL: get_agents_by_protocol",
@@ -260,33 +400,246 @@ Be concise but thorough in your analysis. Focus on making the best routing decis
                 )
                 return []
     
+    def _render_agent_table(self, agents: List[DiscoveredAgent]) -> str:
+        """Render a compact agent roster for the prompt, reusing it while the agent set is unchanged"""
+        key = tuple(agents)
+        if self._agent_table_cache is not None and self._agent_table_cache[0] == key:
+            return self._agent_table_cache[1]
+        
+        if agents:
+            table = "\n".join(
+                f"{agent.agent_id} | {agent.name} | {agent.protocol.value} | "
+                f"{agent.endpoint} | {', '.join(agent.get_capability_names())}"
+                for agent in agents
+            )
+        else:
+            table = "(no healthy agents available)"
+        
+        self._agent_table_cache = (key, table)
+        return table
+    
     async def route_request(self, request: RoutingRequest) -> RoutingDecision:
-        """Route a user request to the most appropriate agent"""
-        start_time = datetime.utcnow()
+        """Route a user request to the most appropriate agent
+        
+        While micro-batching is enabled (see ``start_batching``), concurrent
+        calls are coalesced into shared LLM prompts.
+        """
+        healthy_agents = await self.discovery_service.get_healthy_agents()
+        fast_decision = await self._fast_path_decision(request, healthy_agents)
+        if fast_decision is not None:
+            return fast_decision
+        
+        key = self._decision_cache_key(request)
+        if key is None:
+            return await self._route_with_llm(request, healthy_agents)
+        
+        start_time = time.perf_counter()
+        cached = self._decision_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self._decision_cache.move_to_end(key)
+            return await self._reuse_decision(request, cached[1], start_time)
+        
+        # Identical requests arriving while one is being routed share its LLM call
+        task = self._decisions_in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._route_with_llm(request, healthy_agents))
+            self._decisions_in_flight[key] = task
+            task.add_done_callback(lambda done: self._store_decision(key, done))
+            return await asyncio.shield(task)
+        
+        decision = await asyncio.shield(task)
+        if decision.is_successful():
+            return await self._reuse_decision(request, decision, start_time)
+        return await self._route_with_llm(request, healthy_agents)
+    
+    async def _route_with_llm(
+        self,
+        request: RoutingRequest,
+        healthy_agents: List[DiscoveredAgent]
+    ) -> RoutingDecision:
+        """Route through the LLM, batched with concurrent requests when enabled
+        
+        Batched requests re-read the roster when their batch is flushed.
+        """
+        if self._batcher is not None:
+            return await self._batcher.submit(request)
+        return await self._route_single(request, healthy_agents)
+    
+    def _decision_cache_key(self, request: RoutingRequest) -> Optional[Tuple]:
+        """Key identical requests against the current registry, or None if uncacheable
+        
+        Free-form request context can change the routing, so such requests
+        always go to the LLM.
+        """
+        if request.context:
+            return None
+        return (
+            " ".join(request.query.lower().split()),
+            request.preferred_protocol,
+            request.preferred_agent,
+            self.discovery_service.registry_version
+        )
+    
+    def _store_decision(self, key: Tuple, task: "asyncio.Task[RoutingDecision]") -> None:
+        """Cache the outcome of an in-flight LLM routing once it lands"""
+        self._decisions_in_flight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        
+        decision = task.result()
+        # Timeout fallbacks carry zero confidence and are not worth reusing
+        if not decision.is_successful() or decision.confidence <= 0.0:
+            return
+        
+        self._decision_cache[key] = (time.monotonic() + _DECISION_CACHE_TTL_SECONDS, decision)
+        self._decision_cache.move_to_end(key)
+        if len(self._decision_cache) > _DECISION_CACHE_SIZE:
+            self._decision_cache.popitem(last=False)
+    
+    async def _reuse_decision(
+        self,
+        request: RoutingRequest,
+        decision: RoutingDecision,
+        start_time: float
+    ) -> RoutingDecision:
+        """Answer a request with an earlier decision for an identical one"""
+        routing_decision = decision.model_copy(update={"request_id": request.request_id})
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        return await self._finish_decision(request, routing_decision, duration_ms, cached=True)
+    
+    async def _fast_path_decision(
+        self,
+        request: RoutingRequest,
+        healthy_agents: List[DiscoveredAgent]
+    ) -> Optional[RoutingDecision]:
+        """Decide deterministically, without the LLM, when the roster leaves no choice
+        
+        Applies when the query names a capability of either the healthy
+        preferred agent or the only healthy agent left (speaking the preferred
+        protocol, if any). Returns None for other cases so they go to the LLM,
+        which still sees the preference as a hint.
+        """
+        start_time = time.perf_counter()
+        
+        query_words = _QUERY_WORD_PATTERN.findall(request.query)
+        
+        def handles_query(agent: DiscoveredAgent) -> bool:
+            return any(agent.has_capability(word) for word in query_words)
+        
+        candidates = healthy_agents
+        if request.preferred_protocol:
+            candidates = [agent for agent in candidates if agent.protocol == request.preferred_protocol]
+        
+        selected_agent = None
+        confidence = 1.0
+        if request.preferred_agent:
+            selected_agent = next(
+                (
+                    agent for agent in candidates
+                    if agent.agent_id == request.preferred_agent and handles_query(agent)
+                ),
+                None
+            )
+            reasoning = "Deterministic match: the healthy preferred agent has the requested capability"
+        if selected_agent is None and len(candidates) == 1 and handles_query(candidates[0]):
+            selected_agent = candidates[0]
+            confidence = _SOLE_AGENT_CONFIDENCE
+            reasoning = "Deterministic match: the only healthy agent has the requested capability"
+        if selected_agent is None:
+            return None
+        
+        # Built from registry agents and constants, so validation is skipped
+        routing_decision = RoutingDecision.model_construct(
+            request_id=request.request_id,
+            selected_agent=selected_agent,
+            reasoning=reasoning,
+            confidence=confidence
+        )
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        return await self._finish_decision(request, routing_decision, duration_ms, fast_path=True)
+    
+    async def start_batching(self, max_batch: int = 8, window_ms: float = 20.0) -> None:
+        """Start coalescing concurrent route_request calls into batched LLM calls"""
+        if self._batcher is None:
+            self._batcher = RoutingBatcher(
+                self._route_single,
+                self._route_many,
+                max_batch=max_batch,
+                window_ms=window_ms
+            )
+            await self._batcher.start()
+    
+    async def stop_batching(self) -> None:
+        """Stop micro-batching and go back to one LLM call per request"""
+        if self._batcher is not None:
+            batcher, self._batcher = self._batcher, None
+            await batcher.stop()
+    
+    async def _build_routing_context(
+        self,
+        request: RoutingRequest,
+        healthy_agents: Optional[List[DiscoveredAgent]] = None
+    ) -> Tuple[OrchestratorContext, str, str]:
+        """Create the agent context plus the roster section and tool hint for the prompt
+        
+        The healthy roster is fetched unless the caller already holds it.
+        """
+        context = OrchestratorContext(
+            discovery_service=self.discovery_service,
+            request=request
+        )
+        
+        # Put the healthy roster straight into the prompt when it is small enough,
+        # saving the LLM a get_available_agents tool round-trip
+        if healthy_agents is None:
+            healthy_agents = await self.discovery_service.get_healthy_agents()
+        if len(healthy_agents) <= _MAX_PROMPT_AGENTS:
+            context.available_agents = healthy_agents
+            context.agents_in_prompt = True
+            agents_section = (
+                "Available agents (id | name | protocol | endpoint | capabilities):\n"
+                f"{self._render_agent_table(healthy_agents)}"
+            )
+            tools_hint = (
+                "The healthy agents are listed above. Use the capability or protocol "
+                "tools only if you need more detail about them."
+            )
+        else:
+            agents_section = ""
+            tools_hint = "Use the available tools to get information about agents and their capabilities."
+        
+        return context, agents_section, tools_hint
+    
+    @staticmethod
+    def _describe_request(request: RoutingRequest) -> str:
+        """Render the request fields the LLM routes on, omitting unset ones"""
+        lines = [f'User Query: "{request.query}"']
+        if request.context:
+            lines.append(f"Context: {request.context}")
+        if request.preferred_protocol:
+            lines.append(f"Preferred Protocol: {request.preferred_protocol.value}")
+        if request.preferred_agent:
+            lines.append(f"Preferred Agent: {request.preferred_agent}")
+        return "\n".join(lines)
+    
+    async def _route_single(
+        self,
+        request: RoutingRequest,
+        healthy_agents: Optional[List[DiscoveredAgent]] = None
+    ) -> RoutingDecision:
+        """Route one request with its own LLM call"""
+        start_time = time.perf_counter()
         
         try:
             # Create context for the AI agent
-            context = OrchestratorContext(
-                discovery_service=self.discovery_service,
-                request=request
-            )
+            context, agents_section, tools_hint = await self._build_routing_context(request, healthy_agents)
             
             # Prepare the query for the AI agent
-            query = f"""
-User Query: "{request.query}"
-Context: {request.context or 'None'}
-Preferred Protocol: {request.preferred_protocol or 'Any'}
-Preferred Agent: {request.preferred_agent or 'None'}
-
-Please analyze this query and determine the best agent to handle it. Consider:
-1. What capabilities are needed to answer this query?
-2. Which available agents have those capabilities?
-3. What is the best match based on agent specialization?
-4. How confident are you in this routing decision?
-
-Use the available tools to get information about agents and their capabilities.
-Return a routing decision with the selected agent, confidence score, and reasoning.
-            """.strip()
+            query = _ROUTING_QUERY_TEMPLATE.format(
+                request=self._describe_request(request),
+                agents_section=agents_section,
+                tools_hint=tools_hint
+            )
             
             logger.info(
                 "LLM_REQUEST_START",
@@ -297,91 +650,349 @@ Return a routing decision with the selected agent, confidence score, and reasoni
                 llm_query=query
             )
             
-            # Run the AI agent
-            result = await self.agent.run(query, deps=context)
+            # Run the AI agent, bounding how long a stalled LLM call can hold the request
+            try:
+                async with asyncio.timeout(self.settings.routing_timeout_seconds):
+                    result = await self.agent.run(query, deps=context)
+            except TimeoutError:
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                return await self._timeout_decision(request, context, duration_ms)
             
-            # Extract the routing decision
-            routing_decision = result.data
+            # Expand the LLM's choice into a full routing decision
+            routing_decision = await self._expand_choice(request, result.data, context)
             
-            # Log the LLM's decision in detail
-            logger.info(
-                "LLM_DECISION_RECEIVED",
-                request_id=request.request_id,
-                selected_agent_id=routing_decision.selected_agent.agent_id if routing_decision.selected_agent else None,
-                selected_agent_name=routing_decision.selected_agent.name if routing_decision.selected_agent else None,
-                selected_agent_endpoint=routing_decision.selected_agent.endpoint if routing_decision.selected_agent else None,
-                confidence=routing_decision.confidence,
-                reasoning=routing_decision.reasoning,
-                full_selected_agent=routing_decision.selected_agent.model_dump() if routing_decision.selected_agent else None
-            )
-            
-            # Update metrics
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-            routing_decision.decision_time_ms = duration_ms
-            routing_decision.llm_provider = self.settings.llm_provider
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            return await self._finish_decision(request, routing_decision, duration_ms)
             
-            self.metrics.total_requests += 1
+        except Exception as e:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            return self._failed_decision(request, e, duration_ms)
+    
+    async def _route_many(self, requests: List[RoutingRequest]) -> List[RoutingDecision]:
+        """Route several requests with a single LLM call
+        
+        Falls back to individual routing for the whole batch if the batched
+        call fails, and for any request the LLM left out of its answer.
+        """
+        start_time = time.perf_counter()
+        
+        try:
+            # Tools only read discovery state, so the first request stands in for the batch
+            context, agents_section, tools_hint = await self._build_routing_context(requests[0])
             
-            if routing_decision.selected_agent:
-                self.metrics.successful_requests += 1
-                # Mark the selected agent as used
-                await self.discovery_service.mark_agent_request(routing_decision.selected_agent.agent_id)
-            else:
-                self.metrics.failed_requests += 1
+            queries = "\n\n".join(
+                f"Request ID: {request.request_id}\n{self._describe_request(request)}"
+                for request in requests
+            )
+            query = _BATCH_ROUTING_QUERY_TEMPLATE.format(
+                count=len(requests),
+                requests=queries,
+                agents_section=agents_section,
+                tools_hint=tools_hint
+            )
             
             logger.info(
-                "Request routed successfully",
-                query=request.query[:100] + "..." if len(request.query) > 100 else request.query,
-                selected_agent=routing_decision.selected_agent.agent_id if routing_decision.selected_agent else None,
-                confidence=routing_decision.confidence,
-                duration_ms=duration_ms
+                "LLM_BATCH_REQUEST_START",
+                request_ids=[request.request_id for request in requests],
+                batch_size=len(requests),
+                llm_query=query
             )
             
-            return routing_decision
+            async with asyncio.timeout(self.settings.routing_timeout_seconds):
+                result = await self.agent.run(query, deps=context, output_type=List[_RoutingChoice])
+            choices_by_id = {choice.get("request_id"): choice for choice in result.data}
             
+        except TimeoutError:
+            # Retrying one by one would only stall again, so fall back right away
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            return list(await asyncio.gather(
+                *(self._timeout_decision(request, context, duration_ms) for request in requests)
+            ))
         except Exception as e:
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-            self.metrics.total_requests += 1
-            self.metrics.failed_requests += 1
-            
-            logger.error(
-                "Request routing failed",
-                query=request.query[:100] + "..." if len(request.query) > 100 else request.query,
-                error=str(e),
-                duration_ms=duration_ms
+            logger.warning(
+                "Batched routing failed, routing requests individually",
+                batch_size=len(requests),
+                error=str(e)
             )
-            
-            # Return a fallback decision
-            return RoutingDecision(
-                request_id=request.request_id,
-                selected_agent=None,
-                confidence=0.0,
-                reasoning=f"Routing failed due to error: {str(e)}",
-                alternative_agents=[],
-                error=str(e),
-                decision_time_ms=duration_ms,
-                llm_provider=self.settings.llm_provider
+            return list(await asyncio.gather(*(self._route_single(request) for request in requests)))
+        
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        
+        async def _resolve(request: RoutingRequest) -> RoutingDecision:
+            choice = choices_by_id.get(request.request_id)
+            if choice is None:
+                return await self._route_single(request)
+            try:
+                decision = await self._expand_choice(request, choice, context)
+                return await self._finish_decision(request, decision, duration_ms)
+            except Exception as e:
+                return self._failed_decision(request, e, duration_ms)
+        
+        return list(await asyncio.gather(*(_resolve(request) for request in requests)))
+    
+    async def _expand_choice(
+        self,
+        request: RoutingRequest,
+        choice: _RoutingChoice,
+        context: OrchestratorContext
+    ) -> RoutingDecision:
+        """Turn the LLM's agent IDs into a RoutingDecision with registry records"""
+        known_agents = {agent.agent_id: agent for agent in context.available_agents}
+        
+        async def _lookup(agent_id: str) -> Optional[DiscoveredAgent]:
+            agent = known_agents.get(agent_id)
+            if agent is None:
+                agent = await self.discovery_service.get_agent_by_id(agent_id)
+            return agent
+        
+        selected_agent_id = choice.get("selected_agent_id")
+        selected_agent = await _lookup(selected_agent_id) if selected_agent_id else None
+        
+        alternative_agents = []
+        for agent_id in choice.get("alternative_agent_ids", []):
+            agent = await _lookup(agent_id)
+            if agent is not None:
+                alternative_agents.append(agent)
+        
+        routing_decision = RoutingDecision(
+            request_id=request.request_id,
+            selected_agent=selected_agent,
+            reasoning=choice["reasoning"],
+            confidence=choice["confidence"],
+            alternative_agents=alternative_agents,
+            error=(
+                f"Selected agent {selected_agent_id} is not registered"
+                if selected_agent_id and selected_agent is None else None
+            )
+        )
+        
+        # Log the LLM's decision in detail
+        logger.info(
+            "LLM_DECISION_RECEIVED",
+            request_id=request.request_id,
+            selected_agent_id=routing_decision.selected_agent.agent_id if routing_decision.selected_agent else None,
+            selected_agent_name=routing_decision.selected_agent.name if routing_decision.selected_agent else None,
+            selected_agent_endpoint=routing_decision.selected_agent.endpoint if routing_decision.selected_agent else None,
+            confidence=routing_decision.confidence,
+            reasoning=routing_decision.reasoning,
+            full_selected_agent=routing_decision.selected_agent.model_dump() if routing_decision.selected_agent else None
+        )
+        
+        return routing_decision
+    
+    async def _finish_decision(
+        self,
+        request: RoutingRequest,
+        routing_decision: RoutingDecision,
+        duration_ms: float,
+        fast_path: bool = False,
+        cached: bool = False
+    ) -> RoutingDecision:
+        """Stamp timing and provider on a decision and record it in metrics
+        
+        ``fast_path`` marks deterministic decisions made without the LLM and
+        ``cached`` marks reuse of an earlier LLM decision, so each rate can be
+        read from the logs on its own.
+        """
+        # Update metrics
+        routing_decision.decision_time_ms = duration_ms
+        routing_decision.llm_provider = self.settings.llm_provider
+        
+        self._metrics.total_requests += 1
+        
+        if routing_decision.selected_agent:
+            self._metrics.successful_requests += 1
+            # Mark the selected agent as used
+            await self.discovery_service.mark_agent_request(routing_decision.selected_agent.agent_id)
+        else:
+            self._metrics.failed_requests += 1
+        
+        logger.info(
+            "Request routed successfully",
+            query=_truncate(request.query),
+            selected_agent=routing_decision.selected_agent.agent_id if routing_decision.selected_agent else None,
+            confidence=routing_decision.confidence,
+            duration_ms=duration_ms,
+            fast_path=fast_path,
+            cached=cached
+        )
+        
+        return routing_decision
+    
+    async def _timeout_decision(
+        self,
+        request: RoutingRequest,
+        context: OrchestratorContext,
+        duration_ms: float
+    ) -> RoutingDecision:
+        """Fall back to the first suitable healthy agent when the LLM call times out"""
+        timeout = self.settings.routing_timeout_seconds
+        logger.warning(
+            "LLM routing timed out",
+            request_id=request.request_id,
+            timeout_seconds=timeout,
+            duration_ms=duration_ms
+        )
+        
+        candidates = context.available_agents
+        if request.preferred_protocol:
+            candidates = [agent for agent in candidates if agent.protocol == request.preferred_protocol]
+        preferred = [agent for agent in candidates if agent.agent_id == request.preferred_agent]
+        candidates = preferred or candidates
+        
+        if not self.settings.enable_fallback_routing or not candidates:
+            return self._failed_decision(
+                request,
+                TimeoutError(f"LLM routing timed out after {timeout}s"),
+                duration_ms
             )
+        
+        routing_decision = RoutingDecision.model_construct(
+            request_id=request.request_id,
+            selected_agent=candidates[0],
+            reasoning=f"LLM routing timed out after {timeout}s; fell back to the first suitable healthy agent",
+            confidence=0.0
+        )
+        return await self._finish_decision(request, routing_decision, duration_ms)
+    
+    def _failed_decision(
+        self,
+        request: RoutingRequest,
+        error: Exception,
+        duration_ms: float
+    ) -> RoutingDecision:
+        """Record a routing failure and build the fallback decision"""
+        self._metrics.total_requests += 1
+        self._metrics.failed_requests += 1
+        
+        logger.error(
+            "Request routing failed",
+            query=_truncate(request.query),
+            error=str(error),
+            duration_ms=duration_ms
+        )
+        
+        # Return a fallback decision
+        return RoutingDecision.model_construct(
+            request_id=request.request_id,
+            selected_agent=None,
+            confidence=0.0,
+            reasoning=f"Routing failed due to error: {str(error)}",
+            alternative_agents=[],
+            error=str(error),
+            decision_time_ms=duration_ms,
+            llm_provider=self.settings.llm_provider
+        )
+    
+    async def route_batch(
+        self,
+        requests: List[RoutingRequest],
+        output_jsonl: str,
+        concurrency: int = 50
+    ) -> None:
+        """Route many requests with bounded concurrency, checkpointing to JSONL
+        
+        Each routing decision is appended to ``output_jsonl`` as soon as it is
+        made. Requests whose successful decision is already in the file are
+        skipped, so an interrupted batch resumes by calling this again with
+        the same file. File access runs in worker threads so it never
+        blocks the event loop.
+        """
+        completed = await asyncio.to_thread(self._read_batch_checkpoint, output_jsonl)
+        pending = [request for request in requests if request.request_id not in completed]
+        
+        logger.info(
+            "Starting batch routing",
+            total_requests=len(requests),
+            already_completed=len(requests) - len(pending),
+            concurrency=concurrency,
+            output=output_jsonl
+        )
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        # Appends run in worker threads; one at a time keeps lines from interleaving
+        write_lock = asyncio.Lock()
+        
+        output = await asyncio.to_thread(self._open_batch_checkpoint, output_jsonl)
+        try:
+            async def _route_one(request: RoutingRequest) -> None:
+                async with semaphore:
+                    decision = await self.route_request(request)
+                line = _ROUTING_DECISION_ADAPTER.dump_json(decision) + b"\n"
+                async with write_lock:
+                    await asyncio.to_thread(self._append_batch_line, output, line)
+            
+            await asyncio.gather(*(_route_one(request) for request in pending))
+        finally:
+            await asyncio.to_thread(output.close)
+        
+        logger.info("Batch routing complete", routed=len(pending), output=output_jsonl)
+    
+    @staticmethod
+    def _open_batch_checkpoint(output_jsonl: str) -> BinaryIO:
+        """Open a batch checkpoint for appending, terminating any partial last line"""
+        output = open(output_jsonl, "a+b")
+        # Terminate a partial line left by an interrupted write
+        if output.seek(0, 2) > 0:
+            output.seek(-1, 2)
+            if output.read(1) != b"\n":
+                output.write(b"\n")
+        return output
+    
+    @staticmethod
+    def _append_batch_line(output: BinaryIO, line: bytes) -> None:
+        """Append one decision line to a batch checkpoint and flush it"""
+        output.write(line)
+        output.flush()
+    
+    @staticmethod
+    def _read_batch_checkpoint(output_jsonl: str) -> Set[str]:
+        """Get request IDs with a successful decision already in a batch checkpoint
+        
+        A request retried in an earlier run can appear more than once; its
+        last line decides whether it is complete.
+        """
+        succeeded: Dict[str, bool] = {}
+        try:
+            with open(output_jsonl, "rb") as checkpoint:
+                for line in checkpoint:
+                    try:
+                        decision = json.loads(line)
+                    except ValueError:
+                        # Partial line left by an interrupted write
+                        continue
+                    if not isinstance(decision, dict) or not isinstance(decision.get("request_id"), str):
+                        continue
+                    succeeded[decision["request_id"]] = decision.get("error") is None
+        except FileNotFoundError:
+            pass
+        return {request_id for request_id, ok in succeeded.items() if ok}
     
     async def process_request(self, request: RoutingRequest) -> AgentResponse:
         """Process a complete request: route and execute"""
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
         try:
             # First, route the request
             routing_decision = await self.route_request(request)
             
+            # Serialized once and shared by whichever response is built below
+            routing_decision_data = _ROUTING_DECISION_ADAPTER.dump_python(routing_decision, mode="json")
+            
+            # Responses are assembled from already-typed internal values, so
+            # they are built with model_construct and skip validation
+            
             if not routing_decision.selected_agent:
-                return AgentResponse(
+                return AgentResponse.model_construct(
                     request_id=request.request_id,
                     agent_id="none",
                     protocol=ProtocolType.CUSTOM,
                     response_data=None,
-                    duration_ms=(datetime.utcnow() - start_time).total_seconds() * 1000,
+                    duration_ms=(time.perf_counter() - start_time) * 1000,
                     success=False,
                     error="No suitable agent found for this request",
                     metadata={
-                        "routing_decision": routing_decision.model_dump(),
+                        "routing_decision": routing_decision_data,
                         "reason": "no_agent_selected"
                     }
                 )
@@ -389,34 +1000,36 @@ Return a routing decision with the selected agent, confidence score, and reasoni
             # Use the selected agent from routing decision
             selected_agent = routing_decision.selected_agent
             
-            # Verify agent is still healthy
-            healthy_agents = await self.discovery_service.get_healthy_agents()
-            agent_still_healthy = any(
-                agent.agent_id == selected_agent.agent_id for agent in healthy_agents
-            )
+            # Verify agent is still healthy with a direct registry lookup rather
+            # than re-enumerating the healthy agents
+            registered_agent = await self.discovery_service.get_agent_by_id(selected_agent.agent_id)
             
-            if not agent_still_healthy:
-                return AgentResponse(
+            if registered_agent is None or not registered_agent.is_healthy():
+                return AgentResponse.model_construct(
                     request_id=request.request_id,
                     agent_id=selected_agent.agent_id,
                     protocol=selected_agent.protocol,
                     response_data=None,
-                    duration_ms=(datetime.utcnow() - start_time).total_seconds() * 1000,
+                    duration_ms=(time.perf_counter() - start_time) * 1000,
                     success=False,
                     error=f"Selected agent {selected_agent.agent_id} is no longer available",
                     metadata={
-                        "routing_decision": routing_decision.model_dump(),
+                        "routing_decision": routing_decision_data,
                         "reason": "agent_not_available"
                     }
                 )
             
+            # Execute against the registry's record, not the copy echoed back by the LLM
+            selected_agent = registered_agent
+            
             # Execute the request on the selected agent
             # This is a placeholder - actual implementation would depend on the protocol
             response_data = await self._execute_on_agent(selected_agent, request)
             
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            capability_names = selected_agent.get_capability_names()
             
-            return AgentResponse(
+            return AgentResponse.model_construct(
                 request_id=request.request_id,
                 agent_id=selected_agent.agent_id,
                 protocol=selected_agent.protocol,
@@ -425,14 +1038,14 @@ Return a routing decision with the selected agent, confidence score, and reasoni
                 success=True,
                 error=None,
                 metadata={
-                    "routing_decision": routing_decision.model_dump(),
+                    "routing_decision": routing_decision_data,
                     "agent_protocol": selected_agent.protocol.value,
-                    "agent_capabilities": [cap.name for cap in selected_agent.capabilities]
+                    "agent_capabilities": capability_names
                 }
             )
             
         except Exception as e:
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             
             logger.error(
                 "Request processing failed",
@@ -441,7 +1054,7 @@ Return a routing decision with the selected agent, confidence score, and reasoni
                 duration_ms=duration_ms
             )
             
-            return AgentResponse(
+            return AgentResponse.model_construct(
                 request_id=request.request_id,
                 agent_id="error",
                 protocol=ProtocolType.CUSTOM,
@@ -466,100 +1079,103 @@ Return a routing decision with the selected agent, confidence score, and reasoni
             endpoint=agent.endpoint
         )
         
-        # Protocol-specific execution
-        if agent.protocol == ProtocolType.A2A:
-            # Use A2A client for A2A protocol agents
-            from .protocols.a2a_client import A2AProtocolClient
-            
-            logger.debug("Using A2A protocol client")
-            client = A2AProtocolClient(timeout=10.0)  # 10 second timeout for A2A requests
-            
-            # Send the query to the A2A agent
-            response = await client.send_query(agent.endpoint, request.query)
-            
-            # Check if we got an error
-            if "error" in response:
-                logger.error(
-                    "A2A agent returned error",
-                    error=response["error"],
-                    agent_id=agent.agent_id
-                )
-                return {
-                    "message": response.get("text", "Error from A2A agent"),
-                    "query": request.query,
-                    "agent_id": agent.agent_id,
-                    "protocol": agent.protocol.value,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "simulated": False,
-                    "error": response.get("error"),
-                    "success": False
-                }
-            
-            # Successful response
-            return {
-                "message": response.get("text", "No response text"),
-                "query": request.query,
-                "agent_id": agent.agent_id,
-                "protocol": agent.protocol.value,
-                "timestamp": datetime.utcnow().isoformat(),
-                "simulated": False,  # This is a real response!
-                "raw_response": response.get("raw_result", response.get("raw_response")),
-                "success": True
-            }
-            
-        elif agent.protocol == ProtocolType.ACP:
-            # Placeholder for ACP protocol (still simulated for now)
-            logger.debug("Using simulated ACP response (ACP client not yet implemented)")
-            await asyncio.sleep(0.1)
-            
-            return {
-                "message": f"Response from {agent.name} (ACP protocol)",
-                "query": request.query,
-                "agent_id": agent.agent_id,
-                "protocol": agent.protocol.value,
-                "timestamp": datetime.utcnow().isoformat(),
-                "simulated": True  # Still simulated for ACP
-            }
-            
-        elif agent.protocol == ProtocolType.MCP:
-            # Placeholder for MCP protocol (still simulated for now)
-            logger.debug("Using simulated MCP response (MCP client not yet implemented)")
-            await asyncio.sleep(0.1)
-            
-            return {
-                "message": f"Response from {agent.name} (MCP protocol)",
-                "query": request.query,
-                "agent_id": agent.agent_id,
-                "protocol": agent.protocol.value,
-                "timestamp": datetime.utcnow().isoformat(),
-                "simulated": True  # Still simulated for MCP
-            }
-            
-        else:
+        executor = self._protocol_executors.get(agent.protocol)
+        if executor is None:
             # Unknown protocol - fallback to simulation
             logger.warning(
                 "Unknown protocol, using simulated response",
                 protocol=agent.protocol.value
             )
-            await asyncio.sleep(0.1)
+            executor = self._execute_simulated
+        
+        return await executor(agent, request)
+    
+    async def _execute_a2a(
+        self,
+        agent: DiscoveredAgent,
+        request: RoutingRequest
+    ) -> Dict[str, Any]:
+        """Execute request on an A2A agent using the A2A protocol client"""
+        if self._a2a_client is None:
+            from .protocols.a2a_client import A2AProtocolClient
             
+            # 10 second timeout for A2A requests
+            self._a2a_client = A2AProtocolClient(timeout=10.0, client=self._http_client)
+        
+        logger.debug("Using A2A protocol client")
+        
+        # Send the query to the A2A agent
+        response = await self._a2a_client.send_query(agent.endpoint, request.query)
+        
+        # Check if we got an error
+        if "error" in response:
+            logger.error(
+                "A2A agent returned error",
+                error=response["error"],
+                agent_id=agent.agent_id
+            )
             return {
-                "message": f"Response from {agent.name}",
+                "message": response.get("text", "Error from A2A agent"),
                 "query": request.query,
                 "agent_id": agent.agent_id,
                 "protocol": agent.protocol.value,
                 "timestamp": datetime.utcnow().isoformat(),
-                "simulated": True
+                "simulated": False,
+                "error": response.get("error"),
+                "success": False
             }
+        
+        # Successful response
+        return {
+            "message": response.get("text", "No response text"),
+            "query": request.query,
+            "agent_id": agent.agent_id,
+            "protocol": agent.protocol.value,
+            "timestamp": datetime.utcnow().isoformat(),
+            "simulated": False,  # This is a real response!
+            "raw_response": response.get("raw_result", response.get("raw_response")),
+            "success": True
+        }
+    
+    async def _execute_simulated(
+        self,
+        agent: DiscoveredAgent,
+        request: RoutingRequest
+    ) -> Dict[str, Any]:
+        """Build a simulated response for protocols without a client yet (ACP, MCP)"""
+        message = f"Response from {agent.name}"
+        if agent.protocol in (ProtocolType.ACP, ProtocolType.MCP):
+            protocol_name = agent.protocol.value.upper()
+            logger.debug(
+                f"Using simulated {protocol_name} response "
+                f"({protocol_name} client not yet implemented)"
+            )
+            message = f"{message} ({protocol_name} protocol)"
+        
+        return {
+            "message": message,
+            "query": request.query,
+            "agent_id": agent.agent_id,
+            "protocol": agent.protocol.value,
+            "timestamp": datetime.utcnow().isoformat(),
+            "simulated": True
+        }
     
     def get_metrics(self) -> OrchestrationMetrics:
-        """Get current orchestration metrics"""
-        return self.metrics
+        """Get a snapshot of current orchestration metrics"""
+        return OrchestrationMetrics(
+            total_requests=self._metrics.total_requests,
+            successful_requests=self._metrics.successful_requests,
+            failed_requests=self._metrics.failed_requests
+        )
     
     async def health_check(self) -> Dict[str, Any]:
         """Check the health of the orchestrator agent"""
-        discovery_healthy = await self.discovery_service.is_healthy()
-        agent_count = len(await self.discovery_service.get_healthy_agents())
+        discovery_healthy, healthy_agents = await asyncio.gather(
+            self.discovery_service.is_healthy(),
+            self.discovery_service.get_healthy_agents()
+        )
+        agent_count = len(healthy_agents)
         
         return {
             "orchestrator_healthy": True,
@@ -567,5 +1183,5 @@ Return a routing decision with the selected agent, confidence score, and reasoni
             "available_agents": agent_count,
             "llm_provider": self.settings.llm_provider.value,
             "model": str(type(self.model).__name__),
-            "metrics": self.metrics.model_dump()
+            "metrics": self.get_metrics().model_dump()
         }
\ No newline at end of file
@@ -1,30 +1,64 @@
 """FastAPI application for the Multi-Protocol Agent Orchestrator"""
 
 import asyncio
+import time
 from contextlib import asynccontextmanager
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Annotated, AsyncIterator, Dict, List, Optional, Any, Tuple
+from datetime import UTC, datetime
 
+import httpx
 import structlog
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
+from starlette.routing import Route
 
 from .agent import OrchestratorAgent
-from .discovery import UnifiedDiscoveryService
+from .discovery import UnifiedDiscoveryService, create_http_session
 from .models import (
     RoutingRequest, RoutingDecision, AgentResponse, DiscoveredAgent,
-    HealthCheckResponse, OrchestrationMetrics, ProtocolType
+    HealthCheckResponse, OrchestrationMetrics, ProtocolType, AgentStatus
 )
 from .config import get_settings
 
 logger = structlog.get_logger(__name__)
 
+# Endpoint context is attached once here (and resolved lazily against the
+# structlog configuration), so the hot routing endpoints only pass per-request fields
+_route_logger = structlog.get_logger(__name__, endpoint="route")
+_process_logger = structlog.get_logger(__name__, endpoint="process")
+
+
+def _log_query(query: str) -> str:
+    """Shorten a query for the endpoint request logs"""
+    return query if len(query) <= 50 else f"{query[:50]}..."
+
 # Global instances
 discovery_service: Optional[UnifiedDiscoveryService] = None
 orchestrator_agent: Optional[OrchestratorAgent] = None
 
+# Response envelope timestamp, refreshed once a second while the app is running
+_coarse_timestamp: Optional[str] = None
+
+
+def _timestamp() -> str:
+    """Current UTC timestamp for response envelopes, accurate to about a second"""
+    return _coarse_timestamp or datetime.now(UTC).isoformat()
+
+
+async def _tick_coarse_clock():
+    """Refresh the shared envelope timestamp once a second"""
+    global _coarse_timestamp
+    
+    try:
+        while True:
+            _coarse_timestamp = datetime.now(UTC).isoformat()
+            await asyncio.sleep(1.0)
+    finally:
+        _coarse_timestamp = None
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -32,17 +66,34 @@ async def lifespan(app: FastAPI):
     global discovery_service, orchestrator_agent
     
     logger.info("Starting Multi-Protocol Agent Orchestrator")
+    clock_task = asyncio.create_task(_tick_coarse_clock())
+    http_session = None
+    agent_http_client = None
     
     try:
-        # Initialize discovery service
-        discovery_service = UnifiedDiscoveryService()
+        # One pooled HTTP session serves every agent probe for the app's lifetime
+        http_session = create_http_session()
+        
+        # Initialize discovery service and start background discovery
+        discovery_service = UnifiedDiscoveryService(session=http_session)
         await discovery_service.start()
         
+        # Pooled client reused by every request forwarded to an agent
+        agent_http_client = httpx.AsyncClient(
+            timeout=10.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100)
+        )
+        
         # Initialize orchestrator agent
-        orchestrator_agent = OrchestratorAgent(discovery_service)
+        orchestrator_agent = OrchestratorAgent(discovery_service, http_client=agent_http_client)
         
-        # Start background discovery
-        await discovery_service.start()
+        # Coalesce concurrent /route and /process calls into shared LLM prompts
+        if settings.enable_routing_batching:
+            await orchestrator_agent.start_batching(
+                max_batch=settings.routing_batch_max_size,
+                window_ms=settings.routing_batch_window_ms
+            )
         
         logger.info("Orchestrator initialized successfully")
         
@@ -54,9 +105,25 @@ async def lifespan(app: FastAPI):
     finally:
         logger.info("Shutting down orchestrator")
         
+        # Stop batching so no request is left waiting on the batcher
+        if orchestrator_agent:
+            await orchestrator_agent.stop_batching()
+        
         # Stop discovery service
         if discovery_service:
             await discovery_service.stop()
+        
+        if http_session is not None:
+            await http_session.close()
+        
+        if agent_http_client is not None:
+            await agent_http_client.aclose()
+        
+        clock_task.cancel()
+        try:
+            await clock_task
+        except asyncio.CancelledError:
+            pass
 
 
 # Create FastAPI app
@@ -82,6 +149,8 @@ app.add_middleware(
 
 
 # Dependency injection
+# These stay async def without awaiting anything: FastAPI then calls them inline
+# on the event loop, whereas a plain def would be dispatched to the threadpool
 async def get_discovery_service() -> UnifiedDiscoveryService:
     """Get discovery service instance"""
     if discovery_service is None:
@@ -102,12 +171,26 @@ async def get_orchestrator_agent() -> OrchestratorAgent:
     return orchestrator_agent
 
 
+def _model_response(model: BaseModel) -> Response:
+    """Serialize a model straight to a JSON response
+    
+    The route's response_model still documents the schema, but FastAPI passes
+    a Response through as-is instead of re-validating the model and encoding
+    it through jsonable_encoder.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+DiscoveryServiceDep = Annotated[UnifiedDiscoveryService, Depends(get_discovery_service)]
+OrchestratorAgentDep = Annotated[OrchestratorAgent, Depends(get_orchestrator_agent)]
+
+
 # Request/Response models
 class RouteRequestModel(BaseModel):
     """API model for routing requests"""
     query: str = Field(..., description="User query to route", min_length=1)
     context: Optional[Dict[str, Any]] = Field(None, description="Additional context")
-    preferred_protocol: Optional[str] = Field(None, description="Preferred protocol (acp, a2a, mcp)")
+    preferred_protocol: Optional[ProtocolType] = Field(None, description="Preferred protocol (acp, a2a, mcp)")
     preferred_agent: Optional[str] = Field(None, description="Preferred agent ID")
     timeout_seconds: Optional[float] = Field(None, description="Request timeout", gt=0)
 
@@ -140,10 +223,32 @@ class SystemStatus(BaseModel):
     version: str
 
 
+# Liveness probe
+class _LivenessProbe:
+    """Bare ASGI endpoint for high-frequency liveness probes
+    
+    Starlette runs ASGI apps directly, so /healthz skips dependency injection
+    and response models; the rich report stays at /health.
+    """
+    
+    _BODY = b'{"status":"ok"}'
+    _HEADERS = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_BODY)).encode()),
+    ]
+    
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": self._HEADERS})
+        await send({"type": "http.response.body", "body": self._BODY})
+
+
+app.router.routes.insert(0, Route("/healthz", _LivenessProbe(), methods=["GET"]))
+
+
 # Health check endpoint
 @app.get("/health", response_model=HealthCheckResponse)
 async def health_check(
-    orchestrator: OrchestratorAgent = Depends(get_orchestrator_agent)
+    orchestrator: OrchestratorAgentDep
 ) -> HealthCheckResponse:
     """Get orchestrator health status"""
     try:
@@ -184,27 +289,32 @@ async def health_check(
 # System status endpoint
 @app.get("/status", response_model=SystemStatus)
 async def system_status(
-    discovery: UnifiedDiscoveryService = Depends(get_discovery_service),
-    orchestrator: OrchestratorAgent = Depends(get_orchestrator_agent)
+    discovery: DiscoveryServiceDep,
+    orchestrator: OrchestratorAgentDep
 ) -> SystemStatus:
     """Get comprehensive system status"""
     try:
-        health_data = await orchestrator.health_check()
-        all_agents = await discovery.get_all_agents()
-        healthy_agents = await discovery.get_healthy_agents()
+        health_data, all_agents = await asyncio.gather(
+            orchestrator.health_check(),
+            discovery.get_all_agents()
+        )
         
+        # Count healthy agents and collect protocols in a single pass
+        healthy_count = 0
         protocols = set()
         for agent in all_agents:
+            if agent.status == AgentStatus.HEALTHY:
+                healthy_count += 1
             protocols.add(agent.protocol.value)
         
         return SystemStatus(
             status="healthy" if health_data.get("orchestrator_healthy") else "degraded",
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(UTC),
             orchestrator_healthy=health_data.get("orchestrator_healthy", False),
             discovery_service_healthy=health_data.get("discovery_service_healthy", False),
             total_agents=len(all_agents),
-            healthy_agents=len(healthy_agents),
-            protocols_supported=sorted(list(protocols)),
+            healthy_agents=healthy_count,
+            protocols_supported=sorted(protocols),
             version=settings.app_version
         )
         
@@ -217,48 +327,76 @@ async def system_status(
 
 
 # Agent discovery endpoints
+_AGENT_STREAM_CHUNK_SIZE = 256
+
+
+def _agent_summary(agent: DiscoveredAgent) -> Dict[str, Any]:
+    """Summarize an agent as a plain dict in AgentSummary's shape
+    
+    Registry agents are already validated, so summaries skip model construction.
+    """
+    return {
+        "agent_id": agent.agent_id,
+        "name": agent.name,
+        "protocol": agent.protocol.value,
+        "status": agent.status.value,
+        "capabilities": agent.get_capability_names(),
+        "endpoint": agent.endpoint,
+        "last_seen": agent.discovered_at
+    }
+
+
+async def _stream_agent_summaries(agents: List[DiscoveredAgent]) -> AsyncIterator[bytes]:
+    """Yield agent summaries as a JSON array, serialized one chunk at a time"""
+    yield b"["
+    for start in range(0, len(agents), _AGENT_STREAM_CHUNK_SIZE):
+        chunk = agents[start:start + _AGENT_STREAM_CHUNK_SIZE]
+        # Strip the brackets so each chunk's items splice into the outer array
+        items = to_json([_agent_summary(agent) for agent in chunk])[1:-1]
+        yield b"," + items if start else items
+    yield b"]"
+
+
 @app.get("/agents", response_model=List[AgentSummary])
 async def list_agents(
+    discovery: DiscoveryServiceDep,
     protocol: Optional[str] = None,
     capability: Optional[str] = None,
-    status_filter: Optional[str] = None,
-    discovery: UnifiedDiscoveryService = Depends(get_discovery_service)
-) -> List[AgentSummary]:
+    status_filter: Optional[str] = None
+) -> Response:
     """List discovered agents with optional filtering"""
     try:
-        # Get agents based on filters
-        if capability:
-            agents = await discovery.get_agents_by_capability(capability)
-        elif protocol:
+        protocol_type = None
+        if protocol:
             try:
                 protocol_type = ProtocolType(protocol.lower())
-                agents = await discovery.get_agents_by_protocol(protocol_type)
             except ValueError:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Invalid protocol: {protocol}"
                 )
-        else:
-            agents = await discovery.get_all_agents()
         
-        # Apply status filter
+        agent_status = None
         if status_filter:
-            agents = [agent for agent in agents if agent.status.value == status_filter.lower()]
-        
-        # Convert to summary format
-        summaries = []
-        for agent in agents:
-            summaries.append(AgentSummary(
-                agent_id=agent.agent_id,
-                name=agent.name,
-                protocol=agent.protocol.value,
-                status=agent.status.value,
-                capabilities=[cap.name for cap in agent.capabilities],
-                endpoint=agent.endpoint,
-                last_seen=agent.discovered_at
-            ))
-        
-        return summaries
+            try:
+                agent_status = AgentStatus(status_filter.lower())
+            except ValueError:
+                # No agent can be in an unknown status
+                return Response(content=b"[]", media_type="application/json")
+        
+        # All filters are applied by discovery in one pass over the registry
+        agents = await discovery.get_agents(
+            protocol=protocol_type,
+            capability=capability or None,
+            status=agent_status
+        )
+        
+        # Large registries are streamed chunk by chunk instead of encoded in one piece
+        if len(agents) > _AGENT_STREAM_CHUNK_SIZE:
+            return StreamingResponse(_stream_agent_summaries(agents), media_type="application/json")
+        
+        summaries = [_agent_summary(agent) for agent in agents]
+        return Response(content=to_json(summaries), media_type="application/json")
         
     except HTTPException:
         raise
@@ -273,8 +411,8 @@ async def list_agents(
 @app.get("/agents/{agent_id}", response_model=DiscoveredAgent)
 async def get_agent(
     agent_id: str,
-    discovery: UnifiedDiscoveryService = Depends(get_discovery_service)
-) -> DiscoveredAgent:
+    discovery: DiscoveryServiceDep
+) -> Response:
     """Get detailed information about a specific agent"""
     try:
         agent = await discovery.get_agent_by_id(agent_id)
@@ -283,7 +421,7 @@ async def get_agent(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Agent {agent_id} not found"
             )
-        return agent
+        return _model_response(agent)
         
     except HTTPException:
         raise
@@ -298,7 +436,7 @@ async def get_agent(
 @app.post("/agents/refresh")
 async def refresh_agents(
     background_tasks: BackgroundTasks,
-    discovery: UnifiedDiscoveryService = Depends(get_discovery_service)
+    discovery: DiscoveryServiceDep
 ) -> Dict[str, str]:
     """Trigger immediate agent discovery refresh"""
     try:
@@ -322,15 +460,15 @@ async def refresh_agents(
 @app.post("/route", response_model=RoutingDecision)
 async def route_request(
     request: RouteRequestModel,
-    orchestrator: OrchestratorAgent = Depends(get_orchestrator_agent)
-) -> RoutingDecision:
+    orchestrator: OrchestratorAgentDep
+) -> Response:
     """Route a request to the most appropriate agent"""
     try:
         # Convert API model to internal model
         routing_request = RoutingRequest(
             query=request.query,
             context=request.context,
-            preferred_protocol=ProtocolType(request.preferred_protocol) if request.preferred_protocol else None,
+            preferred_protocol=request.preferred_protocol,
             preferred_agent=request.preferred_agent,
             timeout_seconds=request.timeout_seconds
         )
@@ -338,17 +476,17 @@ async def route_request(
         # Route the request
         decision = await orchestrator.route_request(routing_request)
         
-        logger.info(
+        _route_logger.info(
             "Request routed",
-            query=request.query[:50] + "..." if len(request.query) > 50 else request.query,
+            query=_log_query(request.query),
             selected_agent=decision.selected_agent.agent_id if decision.selected_agent else None,
             confidence=decision.confidence
         )
         
-        return decision
+        return _model_response(decision)
         
     except Exception as e:
-        logger.error("Request routing failed", query=request.query, error=str(e))
+        _route_logger.error("Request routing failed", query=request.query, error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Routing failed: {str(e)}"
@@ -358,15 +496,15 @@ async def route_request(
 @app.post("/process", response_model=AgentResponse)
 async def process_request(
     request: ProcessRequestModel,
-    orchestrator: OrchestratorAgent = Depends(get_orchestrator_agent)
-) -> AgentResponse:
+    orchestrator: OrchestratorAgentDep
+) -> Response:
     """Process a complete request: route and execute"""
     try:
         # Convert API model to internal model
         routing_request = RoutingRequest(
             query=request.query,
             context=request.context,
-            preferred_protocol=ProtocolType(request.preferred_protocol) if request.preferred_protocol else None,
+            preferred_protocol=request.preferred_protocol,
             preferred_agent=request.preferred_agent,
             timeout_seconds=request.timeout_seconds
         )
@@ -374,18 +512,18 @@ async def process_request(
         # Process the complete request
         response = await orchestrator.process_request(routing_request)
         
-        logger.info(
+        _process_logger.info(
             "Request processed",
-            query=request.query[:50] + "..." if len(request.query) > 50 else request.query,
+            query=_log_query(request.query),
             success=response.success,
             agent_id=response.agent_id,
             duration=response.duration_ms
         )
         
-        return response
+        return _model_response(response)
         
     except Exception as e:
-        logger.error("Request processing failed", query=request.query, error=str(e))
+        _process_logger.error("Request processing failed", query=request.query, error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Processing failed: {str(e)}"
@@ -395,11 +533,11 @@ async def process_request(
 # Metrics and monitoring
 @app.get("/metrics", response_model=OrchestrationMetrics)
 async def get_metrics(
-    orchestrator: OrchestratorAgent = Depends(get_orchestrator_agent)
-) -> OrchestrationMetrics:
+    orchestrator: OrchestratorAgentDep
+) -> Response:
     """Get orchestration metrics and statistics"""
     try:
-        return orchestrator.get_metrics()
+        return _model_response(orchestrator.get_metrics())
         
     except Exception as e:
         logger.error("Failed to get metrics", error=str(e))
@@ -410,79 +548,133 @@ async def get_metrics(
 
 
 # Protocol information
+# The protocol list never changes at runtime, so it is serialized once at import
+_PROTOCOLS_JSON: bytes = to_json({
+    "supported_protocols": [
+        {
+            "name": "ACP",
+            "description": "AGNTCY Agent Connect Protocol",
+            "version": "0.1",
+            "status": "implemented"
+        },
+        {
+            "name": "A2A", 
+            "description": "Agent-to-Agent Communication Protocol",
+            "version": "1.0",
+            "status": "discovery_only"
+        },
+        {
+            "name": "MCP",
+            "description": "Model Context Protocol",
+            "version": "0.1",
+            "status": "discovery_only"
+        },
+        {
+            "name": "CUSTOM",
+            "description": "Custom protocol implementations",
+            "version": "any",
+            "status": "template_ready"
+        }
+    ],
+    "total_protocols": 4,
+    "fully_implemented": 1
+})
+
+
 @app.get("/protocols")
-async def list_protocols() -> Dict[str, Any]:
+async def list_protocols() -> Response:
     """List supported protocols and their information"""
-    return {
-        "supported_protocols": [
-            {
-                "name": "ACP",
-                "description": "AGNTCY Agent Connect Protocol",
-                "version": "0.1",
-                "status": "implemented"
-            },
-            {
-                "name": "A2A", 
-                "description": "Agent-to-Agent Communication Protocol",
-                "version": "1.0",
-                "status": "discovery_only"
-            },
-            {
-                "name": "MCP",
-                "description": "Model Context Protocol",
-                "version": "0.1",
-                "status": "discovery_only"
-            },
-            {
-                "name": "CUSTOM",
-                "description": "Custom protocol implementations",
-                "version": "any",
-                "status": "template_ready"
-            }
-        ],
-        "total_protocols": 4,
-        "fully_implemented": 1
-    }
+    return Response(content=_PROTOCOLS_JSON, media_type="application/json")
 
 
 # Capabilities endpoint
+# Aggregated payload is reused for a short window while the registry is unchanged;
+# large aggregates keep only the capability map and are streamed per request
+_CAPABILITIES_TTL_SECONDS = 10.0
+_capabilities_cache: Optional[
+    Tuple[UnifiedDiscoveryService, int, float, Dict[str, Dict[str, Any]], str, Optional[bytes]]
+] = None
+
+
+async def _stream_capabilities(
+    capabilities: Dict[str, Dict[str, Any]],
+    timestamp: str
+) -> AsyncIterator[bytes]:
+    """Yield the /capabilities payload as a JSON object, serialized a chunk of capabilities at a time"""
+    yield b'{"capabilities":{'
+    items = list(capabilities.items())
+    for start in range(0, len(items), _AGENT_STREAM_CHUNK_SIZE):
+        # Strip the braces so each chunk's members splice into the outer object
+        members = to_json(dict(items[start:start + _AGENT_STREAM_CHUNK_SIZE]))[1:-1]
+        yield b"," + members if start else members
+    yield (
+        b'},"total_capabilities":' + to_json(len(capabilities))
+        + b',"timestamp":' + to_json(timestamp) + b"}"
+    )
+
+
 @app.get("/capabilities")
 async def list_capabilities(
-    discovery: UnifiedDiscoveryService = Depends(get_discovery_service)
-) -> Dict[str, Any]:
+    discovery: DiscoveryServiceDep
+) -> Response:
     """List all available capabilities across agents"""
+    global _capabilities_cache
+    
     try:
-        agents = await discovery.get_all_agents()
-        
-        capabilities = {}
-        for agent in agents:
-            for cap in agent.capabilities:
-                if cap.name not in capabilities:
-                    capabilities[cap.name] = {
-                        "description": cap.description,
-                        "agents": [],
-                        "protocols": set(),
-                        "total_agents": 0
-                    }
-                
-                capabilities[cap.name]["agents"].append({
+        registry_version = discovery.registry_version
+        now = time.monotonic()
+        if _capabilities_cache is not None:
+            cached_discovery, cached_version, expires_at, capabilities, timestamp, payload = _capabilities_cache
+            if cached_discovery is discovery and cached_version == registry_version and now < expires_at:
+                if payload is None:
+                    return StreamingResponse(
+                        _stream_capabilities(capabilities, timestamp),
+                        media_type="application/json"
+                    )
+                return Response(content=payload, media_type="application/json")
+        
+        capability_index = await discovery.get_capability_index()
+        
+        capabilities: Dict[str, Dict[str, Any]] = {}
+        for cap_name, entries in capability_index.items():
+            agent_infos = [
+                {
                     "agent_id": agent.agent_id,
                     "name": agent.name,
                     "protocol": agent.protocol.value,
                     "status": agent.status.value
-                })
-                capabilities[cap.name]["protocols"].add(agent.protocol.value)
-                capabilities[cap.name]["total_agents"] += 1
+                }
+                for _, agent in entries
+            ]
+            capabilities[cap_name] = {
+                "description": entries[0][0].description,
+                "agents": agent_infos,
+                "protocols": sorted({info["protocol"] for info in agent_infos}),
+                "total_agents": len(agent_infos)
+            }
         
-        # Convert sets to lists for JSON serialization
-        for cap_name in capabilities:
-            capabilities[cap_name]["protocols"] = list(capabilities[cap_name]["protocols"])
+        timestamp = _timestamp()
         
-        return {
+        # Large aggregates are streamed chunk by chunk instead of encoded in one piece
+        if len(capabilities) > _AGENT_STREAM_CHUNK_SIZE:
+            _capabilities_cache = (
+                discovery, registry_version, now + _CAPABILITIES_TTL_SECONDS, capabilities, timestamp, None
+            )
+            return StreamingResponse(
+                _stream_capabilities(capabilities, timestamp),
+                media_type="application/json"
+            )
+        
+        payload = to_json({
             "capabilities": capabilities,
             "total_capabilities": len(capabilities),
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": timestamp
+        })
+        _capabilities_cache = (
+            discovery, registry_version, now + _CAPABILITIES_TTL_SECONDS, capabilities, timestamp, payload
+        )
+        
+        return Response(content=payload, media_type="application/json")
         
     except Exception as e:
         logger.error("Failed to list capabilities", error=str(e))
@@ -503,7 +695,7 @@ async def http_exception_handler(request, exc: HTTPException):
                 "type": "http_error",
                 "message": exc.detail,
                 "status_code": exc.status_code,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _timestamp()
             }
         }
     )
@@ -520,34 +712,37 @@ async def general_exception_handler(request, exc: Exception):
             "error": {
                 "type": "internal_error",
                 "message": "An internal error occurred",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _timestamp()
             }
         }
     )
 
 
 # Root endpoint
+# Everything but the timestamp is fixed for the lifetime of the process
+_ROOT_INFO: Dict[str, Any] = {
+    "service": settings.app_name,
+    "version": settings.app_version,
+    "description": "Multi-Protocol Agent Orchestrator - Intelligent routing across agent protocols",
+    "endpoints": {
+        "health": "/health",
+        "status": "/status", 
+        "agents": "/agents",
+        "route": "/route",
+        "process": "/process",
+        "metrics": "/metrics",
+        "protocols": "/protocols",
+        "capabilities": "/capabilities",
+        "docs": "/docs"
+    },
+    "protocols_supported": ["ACP", "A2A", "MCP", "CUSTOM"]
+}
+
+
 @app.get("/")
 async def root():
     """Root endpoint with basic information"""
-    return {
-        "service": settings.app_name,
-        "version": settings.app_version,
-        "description": "Multi-Protocol Agent Orchestrator - Intelligent routing across agent protocols",
-        "endpoints": {
-            "health": "/health",
-            "status": "/status", 
-            "agents": "/agents",
-            "route": "/route",
-            "process": "/process",
-            "metrics": "/metrics",
-            "protocols": "/protocols",
-            "capabilities": "/capabilities",
-            "docs": "/docs"
-        },
-        "protocols_supported": ["ACP", "A2A", "MCP", "CUSTOM"],
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    return {**_ROOT_INFO, "timestamp": _timestamp()}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,132 @@
+"""Micro-batching of concurrent routing requests into shared LLM calls"""
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+import structlog
+
+from .models import RoutingDecision, RoutingRequest
+
+logger = structlog.get_logger(__name__)
+
+RouteOne = Callable[[RoutingRequest], Awaitable[RoutingDecision]]
+RouteMany = Callable[[List[RoutingRequest]], Awaitable[List[RoutingDecision]]]
+
+
+class RoutingBatcher:
+    """Coalesces routing requests that arrive together into one LLM call
+
+    An isolated request is dispatched straight away through ``route_one`` so it
+    pays no batching delay. When more requests are already queued behind it,
+    the batcher keeps collecting for up to ``window_ms`` (or ``max_batch``
+    requests) and hands the group to ``route_many``.
+    """
+
+    def __init__(
+        self,
+        route_one: RouteOne,
+        route_many: RouteMany,
+        max_batch: int = 8,
+        window_ms: float = 20.0
+    ):
+        self._route_one = route_one
+        self._route_many = route_many
+        self.max_batch = max_batch
+        self.window_seconds = window_ms / 1000.0
+        self._queue: "asyncio.Queue[Tuple[RoutingRequest, asyncio.Future]]" = asyncio.Queue()
+        self._worker_task: Optional[asyncio.Task] = None
+        self._dispatch_tasks: Set[asyncio.Task] = set()
+
+    async def start(self):
+        """Start the batching worker"""
+        if self._worker_task is None:
+            self._worker_task = asyncio.create_task(self._run())
+            logger.info(
+                "Routing batcher started",
+                max_batch=self.max_batch,
+                window_ms=self.window_seconds * 1000
+            )
+
+    async def stop(self):
+        """Stop the worker, let in-flight batches finish and fail queued requests"""
+        if self._worker_task is None:
+            return
+
+        self._worker_task.cancel()
+        try:
+            await self._worker_task
+        except asyncio.CancelledError:
+            pass
+        self._worker_task = None
+
+        if self._dispatch_tasks:
+            await asyncio.gather(*self._dispatch_tasks, return_exceptions=True)
+
+        while not self._queue.empty():
+            self._reject([self._queue.get_nowait()])
+
+        logger.info("Routing batcher stopped")
+
+    async def submit(self, request: RoutingRequest) -> RoutingDecision:
+        """Queue a request and wait for its routing decision"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request, future))
+        return await future
+
+    async def _run(self):
+        """Drain the queue into batches and dispatch each one as its own task"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+
+            try:
+                # Let requests submitted in the same tick land before deciding
+                await asyncio.sleep(0)
+
+                if not self._queue.empty():
+                    deadline = loop.time() + self.window_seconds
+                    while len(batch) < self.max_batch:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                        except asyncio.TimeoutError:
+                            break
+            except asyncio.CancelledError:
+                # The partly collected batch has already left the queue, so
+                # stop() cannot drain it; fail it here instead
+                self._reject(batch)
+                raise
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatch_tasks.add(task)
+            task.add_done_callback(self._dispatch_tasks.discard)
+
+    @staticmethod
+    def _reject(batch: List[Tuple[RoutingRequest, asyncio.Future]]):
+        """Fail the waiting futures of requests that will never be dispatched"""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError("Routing batcher stopped"))
+
+    async def _dispatch(self, batch: List[Tuple[RoutingRequest, asyncio.Future]]):
+        """Route one batch and resolve the waiting futures"""
+        requests = [request for request, _ in batch]
+
+        try:
+            if len(requests) == 1:
+                decisions = [await self._route_one(requests[0])]
+            else:
+                decisions = await self._route_many(requests)
+        except Exception as e:
+            logger.error("Batched routing dispatch failed", batch_size=len(batch), error=str(e))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), decision in zip(batch, decisions):
+            if not future.done():
+                future.set_result(decision)
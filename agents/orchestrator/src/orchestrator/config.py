@@ -1,7 +1,8 @@
 """Configuration management for the Multi-Protocol Agent Orchestrator"""
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional, Literal, List
+from typing import Dict, Optional, Literal, List
 from functools import lru_cache
 import os
 
@@ -47,13 +48,31 @@ class Settings(BaseSettings):
     
     # Discovery settings
     discovery_interval_seconds: int = 30
+    discovery_max_interval_seconds: int = 300
     discovery_timeout_seconds: int = 5
+    agent_descriptor_ttl_seconds: float = 120.0
+    health_cache_ttl_seconds: float = 60.0
+    cleanup_interval_seconds: int = 300
+    max_parallel_probes: int = 16
+    
+    # Agent endpoints probed by HTTP discovery; endpoints sharing a protocol
+    # and name are tried in this order (container DNS, then host fallback)
+    agent_endpoints: List[Dict[str, str]] = [
+        {"url": "http://acp-hello-world-agent:8000", "protocol": "acp", "name": "hello-world"},
+        {"url": "http://localhost:8000", "protocol": "acp", "name": "hello-world"},
+        {"url": "http://a2a-math-agent:8002", "protocol": "a2a", "name": "math"},
+        {"url": "http://localhost:8002", "protocol": "a2a", "name": "math"},
+    ]
     
     # Routing settings
     routing_timeout_seconds: float = 30.0
     max_retries: int = 3
     retry_delay_seconds: float = 1.0
     enable_fallback_routing: bool = True
+    # Opt-in: batching adds up to the batch window of latency per request
+    enable_routing_batching: bool = False
+    routing_batch_max_size: int = 8
+    routing_batch_window_ms: float = 20.0
     
     # Monitoring and metrics
     enable_metrics: bool = True
@@ -66,11 +85,8 @@ class Settings(BaseSettings):
     cors_methods: List[str] = ["GET", "POST", "PUT", "DELETE"]
     cors_headers: List[str] = ["*"]
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self._validate_settings()
-    
-    def _validate_settings(self) -> None:
+    @model_validator(mode="after")
+    def _validate_settings(self) -> "Settings":
         """Validate settings and ensure required configurations are present"""
         
         # Validate LLM provider configuration
@@ -88,8 +104,13 @@ class Settings(BaseSettings):
         if self.discovery_interval_seconds < 10:
             raise ValueError("Discovery interval must be at least 10 seconds")
         
+        if self.max_parallel_probes < 1:
+            raise ValueError("Max parallel probes must be at least 1")
+        
         if self.max_retries < 0:
             raise ValueError("Max retries cannot be negative")
+        
+        return self
     
     @property
     def has_openai_config(self) -> bool:
@@ -1,10 +1,16 @@
 """Unified discovery service that orchestrates protocol-specific strategies"""
 
 import asyncio
+import logging
+import time
+import aiohttp
+import httpx
 import structlog
-from typing import Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 
+from pydantic_core import from_json, to_json
+
 from .models import (
     DiscoveredAgent, 
     AgentRegistryEntry, 
@@ -13,30 +19,151 @@ from .models import (
     ProtocolType,
     AgentCapability
 )
-from .protocols import get_discovery_strategy
+from .protocols import DiscoveryStrategy, get_discovery_strategy
 from .config import get_settings
 
 logger = structlog.get_logger()
 
+# The stdlib logger structlog writes through once main.py configures it; left
+# unconfigured (library and test use) it sits at WARNING
+_stdlib_logger = logging.getLogger(__name__)
+
+
+def _debug_enabled() -> bool:
+    """Check, at call time, whether per-probe debug lines would be emitted
+    
+    Guarding the calls skips building their arguments (URL strings, metadata
+    and agent dumps) and structlog's processor chain when debug is off.
+    """
+    return _stdlib_logger.isEnabledFor(logging.DEBUG)
+
+
+# Plain dict lookup for endpoint protocol strings, skipping Enum.__call__
+_PROTOCOLS_BY_VALUE: Dict[str, ProtocolType] = {p.value: p for p in ProtocolType}
+
+
+def agent_tool_payload(agent: DiscoveredAgent) -> Dict[str, Any]:
+    """Describe an agent in the shape returned to the LLM by the orchestrator tools"""
+    return {
+        "agent_id": agent.agent_id,
+        "name": agent.name,
+        "protocol": agent.protocol.value,
+        "capabilities": [
+            {
+                "name": cap.name,
+                "description": cap.description,
+                "tags": cap.tags
+            }
+            for cap in agent.capabilities
+        ],
+        "status": agent.status.value,
+        "endpoint": agent.endpoint,
+        "metadata": agent.metadata
+    }
+
+
+# Fields refreshed on every probe even when the agent itself is unchanged
+_VOLATILE_AGENT_FIELDS = {"status", "discovered_at", "last_health_check"}
+
+
+def _same_agent(current: DiscoveredAgent, discovered: DiscoveredAgent) -> bool:
+    """Whether a rediscovered agent matches the registry's record apart from probe bookkeeping"""
+    return (
+        current.model_dump(exclude=_VOLATILE_AGENT_FIELDS)
+        == discovered.model_dump(exclude=_VOLATILE_AGENT_FIELDS)
+    )
+
+
+def create_http_session() -> aiohttp.ClientSession:
+    """Create a pooled HTTP session for probing agents, reusing keep-alive connections"""
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=5),
+        connector=aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=60,
+            keepalive_timeout=30
+        )
+    )
+
 
 class UnifiedDiscoveryService:
     """Unified discovery service that orchestrates protocol-specific strategies"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.settings = get_settings()
         self.agent_registry: AgentRegistry = {}
         self._discovery_task: Optional[asyncio.Task] = None
+        self._cleanup_task: Optional[asyncio.Task] = None
         self._running = False
         
+        # When a discovery pass last found any agent; while probing is failing
+        # altogether, age-based eviction is held off
+        self._last_successful_discovery: Optional[datetime] = None
+        
+        # HTTP session shared by all probes; created in start() unless injected
+        self._session = session
+        self._owns_session = False
+        
+        # Known endpoints grouped per agent, each paired with its probe URL
+        self._probe_groups = self._build_probe_groups(self.settings.agent_endpoints)
+        
+        # Caps outbound probes (discovery GETs and health checks) in flight at once
+        self._probe_slots = asyncio.Semaphore(self.settings.max_parallel_probes)
+        
+        # Pooled client handed to the protocol strategies for health checks
+        self._strategy_client: Optional[httpx.AsyncClient] = None
+        # Strategies hold no per-call state, so one per protocol is reused
+        # for as long as the client they were built on stays open
+        self._strategies: Dict[str, DiscoveryStrategy] = {}
+        
+        # Bumped on every registry change; derived views below are rebuilt
+        # lazily after it moves
+        self._registry_version = 0
+        self._healthy_agents: Optional[List[DiscoveredAgent]] = None
+        self._healthy_agents_payload: Optional[List[Dict[str, Any]]] = None
+        self._healthy_agents_payload_json: Optional[str] = None
+        self._capability_index: Optional[
+            Dict[str, List[Tuple[AgentCapability, DiscoveredAgent]]]
+        ] = None
+        self._protocol_index: Optional[Dict[ProtocolType, List[DiscoveredAgent]]] = None
+        self._capability_matches: Dict[str, List[DiscoveredAgent]] = {}
+        self._registry_stats: Optional[Dict[str, Any]] = None
+        
+        # Descriptor documents (ACP capabilities, A2A agent cards) by URL,
+        # stored with the monotonic time they were fetched
+        self._descriptor_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        
+        # Recent health check results by endpoint, and the checks still running
+        # so overlapping refreshes share one probe per agent
+        self._health_cache: Dict[str, Tuple[float, AgentStatus]] = {}
+        self._health_checks_in_flight: Dict[str, asyncio.Task] = {}
+        
     async def start(self):
-        """Start the discovery service"""
+        """Start the discovery service (a no-op if it is already running)"""
+        if self._running:
+            return
+        
         logger.info("Starting unified discovery service")
         
         self._running = True
         
+        if self._session is None:
+            self._session = create_http_session()
+            self._owns_session = True
+        
+        self._strategies.clear()
+        self._strategy_client = httpx.AsyncClient(
+            timeout=self.settings.discovery_timeout_seconds,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        
         # Start discovery loop
         self._discovery_task = asyncio.create_task(self._discovery_loop())
         
+        # Stale-entry cleanup runs on its own, slower cadence
+        self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        
         # Do initial discovery
         await self.refresh()
         
@@ -48,28 +175,76 @@ class UnifiedDiscoveryService:
         
         self._running = False
         
-        if self._discovery_task:
-            self._discovery_task.cancel()
-            try:
-                await self._discovery_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._discovery_task, self._cleanup_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._owns_session = False
+        
+        if self._strategy_client is not None:
+            await self._strategy_client.aclose()
+            self._strategy_client = None
+        self._strategies.clear()
         
         logger.info("Discovery service stopped")
     
     async def _discovery_loop(self):
-        """Continuous discovery loop"""
+        """Continuous discovery loop
+        
+        The interval doubles after each refresh that leaves the registry
+        unchanged, up to discovery_max_interval_seconds, and drops back to
+        discovery_interval_seconds as soon as anything changes.
+        """
+        interval = self.settings.discovery_interval_seconds
         while self._running:
             try:
-                await asyncio.sleep(self.settings.discovery_interval_seconds)
+                await asyncio.sleep(interval)
                 if self._running:  # Check again after sleep
+                    fingerprint = self._registry_fingerprint()
                     await self.refresh()
+                    
+                    if self._registry_fingerprint() == fingerprint:
+                        interval = min(
+                            interval * 2,
+                            max(
+                                self.settings.discovery_max_interval_seconds,
+                                self.settings.discovery_interval_seconds
+                            )
+                        )
+                    else:
+                        interval = self.settings.discovery_interval_seconds
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error("Discovery loop error", error=str(e))
                 # Continue running even if discovery fails
     
+    async def _cleanup_loop(self):
+        """Periodically drop stale registry entries, independent of discovery refreshes"""
+        while self._running:
+            try:
+                await asyncio.sleep(self.settings.cleanup_interval_seconds)
+                if self._running:
+                    self._cleanup_registry()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("Registry cleanup error", error=str(e))
+    
+    def _registry_fingerprint(self) -> FrozenSet[Tuple[str, AgentStatus, Optional[str]]]:
+        """Summarize the registry contents that matter for change detection"""
+        return frozenset(
+            (agent_id, entry.agent.status, entry.agent.version)
+            for agent_id, entry in self.agent_registry.items()
+        )
+    
     async def refresh(self):
         """Refresh the agent registry by discovering all available agents"""
         logger.debug("Starting agent discovery refresh")
@@ -82,13 +257,10 @@ class UnifiedDiscoveryService:
             # Update registry with health checks
             await self._update_registry(discovered_agents)
             
-            # Clean up old/failed agents
-            self._cleanup_registry()
-            
             logger.info(
                 "Discovery refresh complete",
                 agents_found=len(self.agent_registry),
-                healthy_agents=len(await self.get_healthy_agents()),
+                healthy_agents=self.get_registry_stats()["healthy_agents"],
                 discovery_method="http"
             )
             
@@ -97,75 +269,159 @@ class UnifiedDiscoveryService:
     
     async def _discover_agents_http(self) -> List[DiscoveredAgent]:
         """HTTP-based agent discovery using known endpoints"""
-        import aiohttp
-        discovered_agents = []
-        
-        # Known agent endpoints to try
-        known_endpoints = [
-            {"url": "http://acp-hello-world-agent:8000", "protocol": "acp", "name": "hello-world"},
-            {"url": "http://localhost:8000", "protocol": "acp", "name": "hello-world"},  # fallback for host networking
-            {"url": "http://a2a-math-agent:8002", "protocol": "a2a", "name": "math"},
-            {"url": "http://localhost:8002", "protocol": "a2a", "name": "math"},  # fallback for host networking
-        ]
+        if self._session is not None:
+            return await self._probe_known_endpoints(self._session)
         
+        # Not started (e.g. a one-off refresh): use a short-lived session
         async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
-            # Group endpoints by agent to handle localhost fallback properly
-            agents_tried = set()
-            
-            for endpoint in known_endpoints:
-                agent_key = f"{endpoint['protocol']}-{endpoint['name']}"
-                
-                # Skip if we already successfully discovered this agent
-                if agent_key in agents_tried:
-                    continue
-                    
-                try:
+            return await self._probe_known_endpoints(session)
+    
+    @staticmethod
+    def _build_probe_groups(
+        endpoints: List[Dict[str, str]]
+    ) -> List[Tuple[str, List[Tuple[Dict[str, str], Optional[str], Optional[str]]]]]:
+        """Group endpoints by agent and resolve each one's probe and descriptor URLs up front
+        
+        A None probe URL means the descriptor fetch itself is the liveness probe.
+        """
+        groups: Dict[str, List[Tuple[Dict[str, str], Optional[str], Optional[str]]]] = {}
+        for endpoint in endpoints:
+            agent_key = f"{endpoint['protocol']}-{endpoint['name']}"
+            health_url: Optional[str] = None
+            descriptor_url: Optional[str] = None
+            if endpoint['protocol'] == 'a2a':
+                # A2A agents have no /health; their agent card doubles as the probe
+                descriptor_url = f"{endpoint['url']}/.well-known/agent-card.json"
+            else:
+                health_url = f"{endpoint['url']}/health"
+                if endpoint['protocol'] == 'acp':
+                    descriptor_url = f"{endpoint['url']}/capabilities"
+            groups.setdefault(agent_key, []).append((endpoint, health_url, descriptor_url))
+        return list(groups.items())
+    
+    async def _probe_known_endpoints(self, session: aiohttp.ClientSession) -> List[DiscoveredAgent]:
+        """Probe the known agent endpoints over the given session
+        
+        Different agents are probed concurrently; each agent's candidate URLs
+        are still tried in order, so the localhost fallback only runs when the
+        container URL fails. Agents confirmed healthy within the health cache
+        TTL are carried over without being probed.
+        """
+        discovered_agents: List[DiscoveredAgent] = []
+        probes = []
+        for agent_key, group in self._probe_groups:
+            entry = self.agent_registry.get(agent_key)
+            if (
+                entry is not None
+                and entry.consecutive_failures == 0
+                and self._recently_healthy(entry.agent.endpoint)
+            ):
+                # Confirmed healthy moments ago: keep it without probing again
+                discovered_agents.append(entry.agent)
+            else:
+                probes.append(self._probe_endpoint_group(group, session))
+        
+        results = await asyncio.gather(*probes)
+        discovered_agents.extend(agent for agent in results if agent is not None)
+        return discovered_agents
+    
+    async def _probe_endpoint_group(
+        self,
+        group: List[Tuple[Dict[str, str], Optional[str], Optional[str]]],
+        session: aiohttp.ClientSession
+    ) -> Optional[DiscoveredAgent]:
+        """Try one agent's candidate endpoints in order, stopping at the first that answers"""
+        for endpoint, health_url, descriptor_url in group:
+            try:
+                if _debug_enabled():
                     logger.debug("Trying HTTP discovery endpoint", url=endpoint['url'])
+                
+                # Bound the probe and agent construction together so one slow
+                # agent cannot hold the refresh past the discovery timeout
+                async with asyncio.timeout(self.settings.discovery_timeout_seconds):
+                    # Fetch the descriptor alongside the liveness probe; it lands in
+                    # the descriptor cache, where agent construction picks it up
+                    if health_url is None:
+                        # The descriptor is the probe: one request answers both
+                        health_status = await self._probe_descriptor(session, descriptor_url)
+                    else:
+                        probes = [self._probe_status(session, health_url)]
+                        if descriptor_url is not None:
+                            probes.append(self._fetch_descriptor(session, descriptor_url))
+                        health_status, *_ = await asyncio.gather(*probes, return_exceptions=True)
+                        if isinstance(health_status, BaseException):
+                            raise health_status
                     
-                    # Use appropriate health check endpoint based on protocol
-                    health_url = f"{endpoint['url']}/health"
-                    if endpoint['protocol'] == 'a2a':
-                        health_url = f"{endpoint['url']}/.well-known/agent-card.json"
-                    
-                    # Try to get agent info via health endpoint
-                    async with session.get(health_url) as response:
-                        logger.debug(
-                            "Health endpoint response", 
-                            url=endpoint['url'], 
-                            health_url=health_url,
-                            status=response.status
-                        )
-                        if response.status == 200:
-                            # Construct a discovered agent based on the endpoint
-                            agent = await self._create_agent_from_endpoint(endpoint, session)
-                            if agent:
-                                discovered_agents.append(agent)
-                                agents_tried.add(agent_key)
-                                logger.info(
-                                    "Discovered agent via HTTP",
-                                    agent_id=agent.agent_id,
-                                    url=endpoint['url'],
-                                    protocol=agent.protocol
-                                )
-                                # Continue to next agent, don't break entire loop
-                            else:
-                                logger.warning("Failed to create agent from endpoint", url=endpoint['url'])
-                                
-                except Exception as e:
-                    logger.warning(
-                        "HTTP discovery failed for endpoint",
-                        url=endpoint['url'],
-                        error=str(e),
-                        error_type=type(e).__name__
-                    )
-                    continue
+                    if health_status == 200:
+                        # Construct a discovered agent based on the endpoint
+                        agent = await self._create_agent_from_endpoint(endpoint, session)
+                        if agent:
+                            logger.info(
+                                "Discovered agent via HTTP",
+                                agent_id=agent.agent_id,
+                                url=endpoint['url'],
+                                protocol=agent.protocol
+                            )
+                            return agent
+                        else:
+                            logger.warning("Failed to create agent from endpoint", url=endpoint['url'])
+                            
+            except Exception as e:
+                logger.warning(
+                    "HTTP discovery failed for endpoint",
+                    url=endpoint['url'],
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+                continue
         
-        return discovered_agents
+        return None
+    
+    async def _probe_status(self, session: aiohttp.ClientSession, url: str) -> int:
+        """GET a liveness probe URL and return its status code"""
+        async with self._probe_slots, session.get(url) as response:
+            if _debug_enabled():
+                logger.debug("Health endpoint response", health_url=url, status=response.status)
+            return response.status
+    
+    async def _fetch_descriptor(self, session, url: str) -> Optional[Dict[str, Any]]:
+        """Fetch an agent descriptor document, reusing it for a short TTL
+        
+        Capability lists and agent cards only change when an agent is
+        redeployed, so refresh cycles inside the TTL skip the extra request.
+        Returns None when the agent does not serve the document.
+        """
+        cached = self._descriptor_cache.get(url)
+        if cached is not None and time.monotonic() - cached[0] < self.settings.agent_descriptor_ttl_seconds:
+            return cached[1]
+        
+        if await self._probe_descriptor(session, url) != 200:
+            return None
+        return self._descriptor_cache[url][1]
+    
+    async def _probe_descriptor(self, session, url: str) -> int:
+        """GET a descriptor document, caching it on success, and return the status code
+        
+        Always goes to the network, so it can serve as the liveness probe for
+        agents whose descriptor is their only well-known endpoint.
+        """
+        now = time.monotonic()
+        async with self._probe_slots, session.get(url) as response:
+            if _debug_enabled():
+                logger.debug("Agent descriptor response", url=url, status=response.status)
+            if response.status != 200:
+                return response.status
+            # pydantic_core's Rust parser is faster than stdlib json on these payloads
+            descriptor = await response.json(loads=from_json)
+        
+        self._descriptor_cache[url] = (now, descriptor)
+        return 200
     
     async def _create_agent_from_endpoint(self, endpoint: dict, session) -> Optional[DiscoveredAgent]:
         """Create a DiscoveredAgent from an HTTP endpoint"""
         try:
-            logger.debug("Creating agent from endpoint", endpoint=endpoint)
+            if _debug_enabled():
+                logger.debug("Creating agent from endpoint", endpoint=endpoint)
             
             # Try to get more detailed info from agent-specific endpoints
             capabilities = []
@@ -174,30 +430,30 @@ class UnifiedDiscoveryService:
             if endpoint['protocol'] == 'acp':
                 # Try to get ACP capabilities
                 try:
-                    logger.debug("Trying to get ACP capabilities", url=f"{endpoint['url']}/capabilities")
-                    async with session.get(f"{endpoint['url']}/capabilities") as response:
-                        logger.debug("ACP capabilities response", status=response.status)
-                        if response.status == 200:
-                            capabilities_data = await response.json()
-                            raw_capabilities = capabilities_data.get('capabilities', [])
-                            metadata = {
-                                'agent_id': capabilities_data.get('agent_id'),
-                                'agent_name': capabilities_data.get('agent_name'),
-                                'version': capabilities_data.get('version'),
-                                'description': capabilities_data.get('description'),
-                                'supported_languages': capabilities_data.get('supported_languages', [])
-                            }
-                            
-                            # Convert capability strings to AgentCapability objects
-                            for cap in raw_capabilities:
-                                if isinstance(cap, str):
-                                    capabilities.append(AgentCapability(
-                                        name=cap,
-                                        description=f"Agent capability: {cap}"
-                                    ))
-                                elif isinstance(cap, dict):
-                                    capabilities.append(AgentCapability(**cap))
-                            
+                    if _debug_enabled():
+                        logger.debug("Trying to get ACP capabilities", url=f"{endpoint['url']}/capabilities")
+                    capabilities_data = await self._fetch_descriptor(session, f"{endpoint['url']}/capabilities")
+                    if capabilities_data is not None:
+                        raw_capabilities = capabilities_data.get('capabilities', [])
+                        metadata = {
+                            'agent_id': capabilities_data.get('agent_id'),
+                            'agent_name': capabilities_data.get('agent_name'),
+                            'version': capabilities_data.get('version'),
+                            'description': capabilities_data.get('description'),
+                            'supported_languages': capabilities_data.get('supported_languages', [])
+                        }
+                        
+                        # Convert capability strings to AgentCapability objects
+                        for cap in raw_capabilities:
+                            if isinstance(cap, str):
+                                capabilities.append(AgentCapability(
+                                    name=cap,
+                                    description=f"Agent capability: {cap}"
+                                ))
+                            elif isinstance(cap, dict):
+                                capabilities.append(AgentCapability(**cap))
+                        
+                        if _debug_enabled():
                             logger.debug("Got ACP capabilities", capabilities=len(capabilities), metadata=metadata)
                 except Exception as e:
                     logger.debug("Failed to get ACP capabilities", error=str(e))
@@ -206,27 +462,27 @@ class UnifiedDiscoveryService:
             elif endpoint['protocol'] == 'a2a':
                 # Try to get A2A agent card
                 try:
-                    logger.debug("Trying to get A2A agent card", url=f"{endpoint['url']}/.well-known/agent-card.json")
-                    async with session.get(f"{endpoint['url']}/.well-known/agent-card.json") as response:
-                        logger.debug("A2A agent card response", status=response.status)
-                        if response.status == 200:
-                            agent_card = await response.json()
-                            metadata = {
-                                'version': agent_card.get('version'),
-                                'protocolVersion': agent_card.get('protocolVersion'),
-                                'description': agent_card.get('description'),
-                                'preferredTransport': agent_card.get('preferredTransport')
-                            }
-                            
-                            # Convert skills to capabilities
-                            skills = agent_card.get('skills', [])
-                            for skill in skills:
-                                capabilities.append(AgentCapability(
-                                    name=skill.get('name', skill.get('id', 'unknown')),
-                                    description=skill.get('description', f"A2A skill: {skill.get('name', 'unknown')}"),
-                                    tags=skill.get('tags', [])  # Include tags from A2A skills
-                                ))
-                                
+                    if _debug_enabled():
+                        logger.debug("Trying to get A2A agent card", url=f"{endpoint['url']}/.well-known/agent-card.json")
+                    agent_card = await self._fetch_descriptor(session, f"{endpoint['url']}/.well-known/agent-card.json")
+                    if agent_card is not None:
+                        metadata = {
+                            'version': agent_card.get('version'),
+                            'protocolVersion': agent_card.get('protocolVersion'),
+                            'description': agent_card.get('description'),
+                            'preferredTransport': agent_card.get('preferredTransport')
+                        }
+                        
+                        # Convert skills to capabilities
+                        skills = agent_card.get('skills', [])
+                        for skill in skills:
+                            capabilities.append(AgentCapability(
+                                name=skill.get('name', skill.get('id', 'unknown')),
+                                description=skill.get('description', f"A2A skill: {skill.get('name', 'unknown')}"),
+                                tags=skill.get('tags', [])  # Include tags from A2A skills
+                            ))
+                        
+                        if _debug_enabled():
                             logger.debug("Got A2A agent card", capabilities=len(capabilities), metadata=metadata)
                 except Exception as e:
                     logger.debug("Failed to get A2A agent card", error=str(e))
@@ -249,12 +505,13 @@ class UnifiedDiscoveryService:
                 "last_health_check": datetime.utcnow()
             }
             
-            logger.debug("Creating DiscoveredAgent with data", data=agent_data)
+            if _debug_enabled():
+                logger.debug("Creating DiscoveredAgent with data", data=agent_data)
             
             agent = DiscoveredAgent(
                 agent_id=agent_data["agent_id"],
                 name=agent_data["name"],
-                protocol=ProtocolType(agent_data["protocol"]),
+                protocol=_PROTOCOLS_BY_VALUE[agent_data["protocol"]],
                 endpoint=agent_data["endpoint"],
                 capabilities=agent_data["capabilities"],
                 metadata=agent_data["metadata"],
@@ -262,7 +519,8 @@ class UnifiedDiscoveryService:
                 last_health_check=agent_data["last_health_check"]
             )
             
-            logger.debug("Successfully created agent", agent_id=agent.agent_id)
+            if _debug_enabled():
+                logger.debug("Successfully created agent", agent_id=agent.agent_id)
             return agent
             
         except Exception as e:
@@ -277,79 +535,198 @@ class UnifiedDiscoveryService:
     
     async def _update_registry(self, discovered_agents: List[DiscoveredAgent]):
         """Update the agent registry with discovered agents and health checks"""
-        new_registry: AgentRegistry = {}
+        if not discovered_agents and self.agent_registry:
+            # Nothing answered at all, which is far more likely a network blip on
+            # our side than every agent vanishing at once. Keep the last-known
+            # entries without counting failures against them, but stop routing
+            # to them until a probe confirms they are back.
+            unconfirmed = False
+            for entry in self.agent_registry.values():
+                if entry.agent.status != AgentStatus.UNKNOWN:
+                    entry.agent.status = AgentStatus.UNKNOWN
+                    unconfirmed = True
+            
+            logger.warning(
+                "Empty discovery result, keeping last-known registry",
+                agents=len(self.agent_registry),
+                last_successful_discovery=self._last_successful_discovery
+            )
+            if unconfirmed:
+                self._invalidate_registry_caches()
+            return
         
-        # Process discovered agents
+        seen: Set[str] = set()
+        # One wall-clock read stamps every agent seen in this pass
+        seen_at = datetime.utcnow()
+        if discovered_agents:
+            self._last_successful_discovery = seen_at
+        # Derived views are only rebuilt when membership, status or an agent's
+        # description actually changes, not on every refresh
+        changed = False
+        
+        # Resolve registry entries first so the health checks can run concurrently
+        entries: List[AgentRegistryEntry] = []
         for agent in discovered_agents:
             # Get existing registry entry or create new one
             existing_entry = self.agent_registry.get(agent.agent_id)
             
             if existing_entry:
-                # Update existing entry
+                # Update existing entry, keeping the registered agent object
+                # when nothing about it changed so cached views stay valid
                 entry = existing_entry
-                entry.agent = agent
-                entry.mark_success()  # Reset failure count
+                if not _same_agent(entry.agent, agent):
+                    entry.agent = agent
+                    changed = True
+                entry.mark_success(seen_at)  # Reset failure count
             else:
                 # Create new entry
-                entry = AgentRegistryEntry(agent=agent)
+                entry = AgentRegistryEntry(agent=agent, last_seen=seen_at)
+                changed = True
             
-            # Check agent health
-            try:
-                strategy = get_discovery_strategy(agent.protocol.value)
-                health_status = await strategy.health_check(agent)
+            entries.append(entry)
+        
+        # Check agent health; wall time is the slowest probe, not their sum
+        health_results = await asyncio.gather(
+            *(self._check_agent_health(agent) for agent in discovered_agents),
+            return_exceptions=True
+        )
+        
+        # One wall-clock read per cycle rather than one per agent
+        checked_at = datetime.utcnow()
+        failed_checks: Dict[str, str] = {}
+        
+        for entry, health_status in zip(entries, health_results):
+            agent = entry.agent
+            previous_status = agent.status
+            
+            if isinstance(health_status, Exception):
+                failed_checks[agent.agent_id] = str(health_status)
+                agent.status = AgentStatus.UNKNOWN
+                entry.mark_failure()
+            else:
                 agent.status = health_status
-                agent.last_health_check = datetime.utcnow()
+                agent.last_health_check = checked_at
                 
                 if health_status == AgentStatus.HEALTHY:
-                    entry.mark_success()
+                    entry.mark_success(checked_at)
                 else:
                     entry.mark_failure()
-                    
-            except Exception as e:
-                logger.debug(
-                    "Health check failed",
-                    agent_id=agent.agent_id,
-                    error=str(e)
-                )
-                agent.status = AgentStatus.UNKNOWN
-                entry.mark_failure()
             
-            new_registry[agent.agent_id] = entry
+            if agent.status != previous_status:
+                changed = True
+            
+            self.agent_registry[agent.agent_id] = entry
+            seen.add(agent.agent_id)
         
-        # Preserve agents that weren't discovered this time but are still valid
-        for agent_id, entry in self.agent_registry.items():
-            if agent_id not in new_registry:
-                # Mark as not seen in this discovery cycle
-                entry.mark_failure()
-                
-                # Keep if not exceeded max failures
-                if not entry.should_remove():
-                    new_registry[agent_id] = entry
-                else:
-                    logger.info(
-                        "Removing failed agent from registry",
-                        agent_id=agent_id,
-                        failures=entry.consecutive_failures
-                    )
+        if failed_checks:
+            logger.debug("Health checks failed", errors=failed_checks)
+        
+        # Age out agents that weren't discovered this time, dropping them
+        # once they exceed max failures
+        removed: List[str] = []
+        for agent_id in [agent_id for agent_id in self.agent_registry if agent_id not in seen]:
+            entry = self.agent_registry[agent_id]
+            # Mark as not seen in this discovery cycle
+            entry.mark_failure()
+            
+            if entry.should_remove():
+                removed.append(agent_id)
+                del self.agent_registry[agent_id]
         
-        self.agent_registry = new_registry
+        if removed:
+            logger.info("Removed failed agents from registry", agent_ids=removed)
+            changed = True
+        
+        if changed:
+            self._invalidate_registry_caches()
+    
+    async def _check_agent_health(self, agent: DiscoveredAgent) -> AgentStatus:
+        """Health-check one agent, reusing a recent healthy result"""
+        endpoint = agent.endpoint
+        if self._recently_healthy(endpoint):
+            return AgentStatus.HEALTHY
+        
+        task = self._health_checks_in_flight.get(endpoint)
+        if task is None:
+            task = asyncio.create_task(self._run_health_check(agent))
+            self._health_checks_in_flight[endpoint] = task
+            task.add_done_callback(lambda _: self._health_checks_in_flight.pop(endpoint, None))
+        
+        # Shield the shared probe so one cancelled caller does not abort it for the rest
+        return await asyncio.shield(task)
+    
+    def _recently_healthy(self, endpoint: str) -> bool:
+        """Whether a real probe found the endpoint healthy within the health cache TTL
+        
+        Only healthy results are reused, so agents that are failing or degraded
+        are re-probed on every cycle.
+        """
+        cached = self._health_cache.get(endpoint)
+        if cached is None:
+            return False
+        checked_at, health_status = cached
+        return (
+            health_status == AgentStatus.HEALTHY
+            and time.monotonic() - checked_at < self.settings.health_cache_ttl_seconds
+        )
+    
+    def _strategy_for(self, protocol: str) -> DiscoveryStrategy:
+        """Get the cached discovery strategy for a protocol, built on the current client"""
+        strategy = self._strategies.get(protocol)
+        if strategy is None:
+            strategy = get_discovery_strategy(protocol, self._strategy_client)
+            self._strategies[protocol] = strategy
+        return strategy
+    
+    async def _run_health_check(self, agent: DiscoveredAgent) -> AgentStatus:
+        """Run the protocol-specific health check and remember its result"""
+        strategy = self._strategy_for(agent.protocol.value)
+        async with self._probe_slots:
+            health_status = await strategy.health_check(agent)
+        self._health_cache[agent.endpoint] = (time.monotonic(), health_status)
+        return health_status
     
     def _cleanup_registry(self):
         """Clean up old or failed agents from registry"""
         cutoff_time = datetime.utcnow() - timedelta(hours=1)
+        # If nothing has been discovered since the cutoff, every last_seen is
+        # stale because probing is down, not because the agents are gone
+        probing_down = (
+            self._last_successful_discovery is not None
+            and self._last_successful_discovery < cutoff_time
+        )
         to_remove = []
         
         for agent_id, entry in self.agent_registry.items():
             # Remove very old agents
-            if entry.last_seen < cutoff_time:
+            if entry.last_seen < cutoff_time and not probing_down:
                 to_remove.append(agent_id)
             # Remove agents with too many failures
             elif entry.should_remove():
                 to_remove.append(agent_id)
         
         for agent_id in to_remove:
-            logger.info("Removing stale agent from registry", agent_id=agent_id)
             del self.agent_registry[agent_id]
+        
+        if to_remove:
+            logger.info("Removed stale agents from registry", agent_ids=to_remove)
+            self._invalidate_registry_caches()
+    
+    def _invalidate_registry_caches(self):
+        """Drop derived registry views so they are rebuilt on next access"""
+        self._registry_version += 1
+        self._healthy_agents = None
+        self._healthy_agents_payload = None
+        self._healthy_agents_payload_json = None
+        self._capability_index = None
+        self._protocol_index = None
+        self._capability_matches = {}
+        self._registry_stats = None
+    
+    @property
+    def registry_version(self) -> int:
+        """Counter that changes whenever the registry contents change"""
+        return self._registry_version
     
     # Public API methods
     
@@ -358,11 +735,53 @@ class UnifiedDiscoveryService:
         return [entry.agent for entry in self.agent_registry.values()]
     
     async def get_healthy_agents(self) -> List[DiscoveredAgent]:
-        """Get only healthy agents"""
-        return [
-            entry.agent for entry in self.agent_registry.values()
-            if entry.agent.status == AgentStatus.HEALTHY
-        ]
+        """Get only healthy agents (filtered once per registry version)"""
+        if self._healthy_agents is None:
+            self._healthy_agents = [
+                entry.agent for entry in self.agent_registry.values()
+                if entry.agent.status == AgentStatus.HEALTHY
+            ]
+        return list(self._healthy_agents)
+    
+    async def get_healthy_agents_payload(self) -> List[Dict[str, Any]]:
+        """Get tool payloads for healthy agents (cached until the registry changes)
+        
+        The returned list is shared between callers and must not be mutated.
+        """
+        if self._healthy_agents_payload is None:
+            self._healthy_agents_payload = [
+                agent_tool_payload(agent) for agent in await self.get_healthy_agents()
+            ]
+        return self._healthy_agents_payload
+    
+    async def get_healthy_agents_payload_json(self) -> str:
+        """Get the healthy agent tool payload pre-serialized to JSON
+        
+        Serialized once per registry version, so tool calls hand the LLM a
+        ready string instead of re-encoding the roster on every call.
+        """
+        if self._healthy_agents_payload_json is None:
+            self._healthy_agents_payload_json = to_json(
+                await self.get_healthy_agents_payload()
+            ).decode()
+        return self._healthy_agents_payload_json
+    
+    async def get_capability_index(
+        self
+    ) -> Dict[str, List[Tuple[AgentCapability, DiscoveredAgent]]]:
+        """Get agents grouped by capability name (cached until the registry changes)
+        
+        Each entry pairs the agent with its own capability object so callers
+        can read descriptions without rescanning. The returned mapping is
+        shared between callers and must not be mutated.
+        """
+        if self._capability_index is None:
+            index: Dict[str, List[Tuple[AgentCapability, DiscoveredAgent]]] = {}
+            for entry in self.agent_registry.values():
+                for cap in entry.agent.capabilities:
+                    index.setdefault(cap.name, []).append((cap, entry.agent))
+            self._capability_index = index
+        return self._capability_index
     
     async def get_agent(self, agent_id: str) -> Optional[DiscoveredAgent]:
         """Get specific agent by ID"""
@@ -373,26 +792,48 @@ class UnifiedDiscoveryService:
         """Get specific agent by ID (alias for get_agent)"""
         return await self.get_agent(agent_id)
     
-    async def get_agents_by_protocol(
+    async def get_agents(
         self,
-        protocol: ProtocolType
+        protocol: Optional[ProtocolType] = None,
+        capability: Optional[str] = None,
+        status: Optional[AgentStatus] = None
     ) -> List[DiscoveredAgent]:
-        """Get agents using specific protocol"""
+        """Get agents matching all of the given filters in a single registry pass"""
         return [
             entry.agent for entry in self.agent_registry.values()
-            if entry.agent.protocol == protocol
+            if (protocol is None or entry.agent.protocol == protocol)
+            and (status is None or entry.agent.status == status)
+            and (capability is None or entry.agent.has_capability(capability))
         ]
     
+    async def get_agents_by_protocol(
+        self,
+        protocol: ProtocolType
+    ) -> List[DiscoveredAgent]:
+        """Get agents using specific protocol"""
+        if self._protocol_index is None:
+            index: Dict[ProtocolType, List[DiscoveredAgent]] = {}
+            for entry in self.agent_registry.values():
+                index.setdefault(entry.agent.protocol, []).append(entry.agent)
+            self._protocol_index = index
+        return list(self._protocol_index.get(protocol, ()))
+    
     async def get_agents_by_capability(
         self,
         capability_name: str
     ) -> List[DiscoveredAgent]:
-        """Get agents that have a specific capability"""
-        agents = []
-        for entry in self.agent_registry.values():
-            if entry.agent.has_capability(capability_name):
-                agents.append(entry.agent)
-        return agents
+        """Get agents that have a specific capability (by name or tag)
+        
+        Matches are remembered per lowercased name until the registry changes.
+        """
+        key = capability_name.lower()
+        agents = self._capability_matches.get(key)
+        if agents is None:
+            agents = self._capability_matches[key] = [
+                entry.agent for entry in self.agent_registry.values()
+                if entry.agent.has_capability(key)
+            ]
+        return list(agents)
     
     async def mark_agent_request(self, agent_id: str):
         """Mark that a request was made to an agent"""
@@ -407,29 +848,25 @@ class UnifiedDiscoveryService:
             len(self.agent_registry) >= 0  # At least discovery is working
         )
     
-    def get_registry_stats(self) -> Dict[str, int]:
-        """Get statistics about the agent registry"""
-        total_agents = len(self.agent_registry)
-        healthy_agents = sum(
-            1 for entry in self.agent_registry.values()
-            if entry.agent.status == AgentStatus.HEALTHY
-        )
+    def get_registry_stats(self) -> Dict[str, Any]:
+        """Get statistics about the agent registry (cached until the registry changes)
         
-        protocol_counts = {}
-        for entry in self.agent_registry.values():
-            protocol = entry.agent.protocol.value
-            protocol_counts[protocol] = protocol_counts.get(protocol, 0) + 1
-        
-        return {
-            "total_agents": total_agents,
-            "healthy_agents": healthy_agents,
-            "degraded_agents": sum(
-                1 for entry in self.agent_registry.values()
-                if entry.agent.status == AgentStatus.DEGRADED
-            ),
-            "unhealthy_agents": sum(
-                1 for entry in self.agent_registry.values()
-                if entry.agent.status == AgentStatus.UNHEALTHY
-            ),
-            "by_protocol": protocol_counts
-        }
\ No newline at end of file
+        The returned mapping is shared between callers and must not be mutated.
+        """
+        if self._registry_stats is None:
+            status_counts: Dict[AgentStatus, int] = {}
+            protocol_counts: Dict[str, int] = {}
+            for entry in self.agent_registry.values():
+                agent = entry.agent
+                status_counts[agent.status] = status_counts.get(agent.status, 0) + 1
+                protocol = agent.protocol.value
+                protocol_counts[protocol] = protocol_counts.get(protocol, 0) + 1
+            
+            self._registry_stats = {
+                "total_agents": len(self.agent_registry),
+                "healthy_agents": status_counts.get(AgentStatus.HEALTHY, 0),
+                "degraded_agents": status_counts.get(AgentStatus.DEGRADED, 0),
+                "unhealthy_agents": status_counts.get(AgentStatus.UNHEALTHY, 0),
+                "by_protocol": protocol_counts
+            }
+        return self._registry_stats
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Data models for the Multi-Protocol Agent Orchestrator"""
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
-from typing import Optional, Dict, Any, List, Literal, Union
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, field_validator
+from typing import Optional, Dict, Any, FrozenSet, List, Literal, Union
 from datetime import datetime
 from enum import Enum
 import uuid
@@ -79,6 +79,9 @@ class DiscoveredAgent(BaseModel):
     container_id: Optional[str] = Field(None, description="Docker container ID")
     version: Optional[str] = Field(None, description="Agent version")
     
+    # Capability names and lowercased tags, built on first has_capability call
+    _capability_keys: Optional[FrozenSet[str]] = PrivateAttr(default=None)
+    
     @field_validator('agent_id')
     @classmethod
     def validate_agent_id(cls, v):
@@ -98,19 +101,20 @@ class DiscoveredAgent(BaseModel):
         return [cap.name for cap in self.capabilities]
     
     def has_capability(self, capability_name: str) -> bool:
-        """Check if agent has a specific capability by name or tag"""
-        capability_name = capability_name.lower()
+        """Check if agent has a specific capability by name or tag
+        
+        Capabilities are treated as fixed once the agent is built, so names and
+        tags are collected into one set and later lookups are a membership test.
+        """
+        if self._capability_keys is None:
+            keys = set()
+            for cap in self.capabilities:
+                keys.add(cap.name)
+                # Also match capability tags for more flexible matching
+                keys.update(tag.lower() for tag in cap.tags)
+            self._capability_keys = frozenset(keys)
         
-        # Check exact capability name matches first
-        if capability_name in self.get_capability_names():
-            return True
-            
-        # Also check capability tags for more flexible matching
-        for cap in self.capabilities:
-            if capability_name in [tag.lower() for tag in cap.tags]:
-                return True
-                
-        return False
+        return capability_name.lower() in self._capability_keys
     
     def is_healthy(self) -> bool:
         """Check if agent is in healthy state"""
@@ -290,10 +294,10 @@ class AgentRegistryEntry(BaseModel):
         """Mark a health check failure"""
         self.consecutive_failures += 1
     
-    def mark_success(self) -> None:
-        """Mark a successful health check"""
+    def mark_success(self, seen_at: Optional[datetime] = None) -> None:
+        """Mark a successful health check, optionally at a caller-supplied time"""
         self.consecutive_failures = 0
-        self.last_seen = datetime.utcnow()
+        self.last_seen = seen_at or datetime.utcnow()
     
     def should_remove(self, max_failures: int = 5) -> bool:
         """Check if agent should be removed from registry"""
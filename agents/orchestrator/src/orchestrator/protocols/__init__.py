@@ -1,5 +1,9 @@
 """Protocol client implementations for multi-protocol agent communication"""
 
+from typing import Optional
+
+import httpx
+
 from .base import ProtocolClient, DiscoveryStrategy
 from .acp_discovery import ACPDiscoveryStrategy
 from .a2a_discovery import A2ADiscoveryStrategy
@@ -14,8 +18,15 @@ __all__ = [
 ]
 
 
-def get_discovery_strategy(protocol: str) -> DiscoveryStrategy:
-    """Get appropriate discovery strategy for protocol"""
+def get_discovery_strategy(
+    protocol: str,
+    client: Optional[httpx.AsyncClient] = None
+) -> DiscoveryStrategy:
+    """Get appropriate discovery strategy for protocol
+    
+    Pass the discovery service's pooled client to reuse its connections
+    for probes.
+    """
     from ..models import ProtocolType
     
     strategy_map = {
@@ -28,10 +39,10 @@ def get_discovery_strategy(protocol: str) -> DiscoveryStrategy:
         protocol_type = ProtocolType(protocol.lower())
         strategy_class = strategy_map.get(protocol_type)
         if strategy_class:
-            return strategy_class()
+            return strategy_class(client=client)
     except ValueError:
         pass
     
     # Fallback to generic strategy
     from .base import GenericDiscoveryStrategy
-    return GenericDiscoveryStrategy()
\ No newline at end of file
+    return GenericDiscoveryStrategy(client=client)
\ No newline at end of file
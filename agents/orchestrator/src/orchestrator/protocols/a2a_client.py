@@ -1,20 +1,71 @@
 """A2A Protocol Client for communicating with A2A agents"""
 
+import asyncio
+import time
 import httpx
 import structlog
-from typing import Dict, Any, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, Optional, Tuple
 from uuid import uuid4
 import json
 
+from pydantic_core import to_json
+
 logger = structlog.get_logger(__name__)
 
+# JSON-RPC message/send envelope; only the query text and message id vary
+_MESSAGE_SEND_TEMPLATE = (
+    b'{"jsonrpc":"2.0","method":"message/send","params":{"message":'
+    b'{"role":"user","parts":[{"kind":"text","text":%b}],"messageId":"%b"}},'
+    b'"id":"%b"}'
+)
+
+_JSON_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+}
+
+
+def _message_send_body(query: str, message_id: str) -> bytes:
+    """Encode an A2A message/send request without building the payload dict"""
+    encoded_id = message_id.encode()
+    return _MESSAGE_SEND_TEMPLATE % (to_json(query), encoded_id, encoded_id)
+
 
 class A2AProtocolClient:
     """Client for communicating with A2A protocol agents"""
     
-    def __init__(self, timeout: float = 5.0):
-        """Initialize A2A client with timeout settings"""
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        client: Optional[httpx.AsyncClient] = None,
+        card_ttl_seconds: float = 300.0
+    ):
+        """Initialize A2A client with timeout settings
+        
+        Args:
+            timeout: Timeout applied to every request, including those sent
+                through an injected client
+            client: Pooled client owned by the caller; None means each query
+                opens its own short-lived client
+            card_ttl_seconds: How long a fetched agent card is reused per endpoint
+        """
         self.timeout = timeout
+        self._client = client
+        self.card_ttl_seconds = card_ttl_seconds
+        # Agent cards by endpoint, stored with the monotonic time they were fetched
+        self._card_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # One fetch per endpoint at a time, so concurrent cache misses share it
+        self._card_locks: Dict[str, asyncio.Lock] = {}
+    
+    @asynccontextmanager
+    async def _http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared client if one was injected, else a short-lived one"""
+        if self._client is not None:
+            yield self._client
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                yield client
         
     async def send_query(self, endpoint: str, query: str) -> Dict[str, Any]:
         """
@@ -28,19 +79,11 @@ class A2AProtocolClient:
             Dictionary containing the agent's response
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client() as client:
                 # First, get the agent card to understand the agent's capabilities
-                agent_card_url = f"{endpoint}/.well-known/agent-card.json"
-                
-                logger.debug(
-                    "Fetching A2A agent card",
-                    url=agent_card_url
-                )
-                
                 try:
-                    card_response = await client.get(agent_card_url)
-                    if card_response.status_code == 200:
-                        agent_card = card_response.json()
+                    agent_card = await self._get_agent_card(client, endpoint)
+                    if agent_card is not None:
                         logger.debug(
                             "Got A2A agent card",
                             agent_name=agent_card.get('name'),
@@ -54,23 +97,7 @@ class A2AProtocolClient:
                 
                 # Prepare the message payload according to A2A protocol
                 message_id = uuid4().hex
-                message_payload = {
-                    "jsonrpc": "2.0",
-                    "method": "message/send",
-                    "params": {
-                        "message": {
-                            "role": "user",
-                            "parts": [
-                                {
-                                    "kind": "text",
-                                    "text": query
-                                }
-                            ],
-                            "messageId": message_id
-                        }
-                    },
-                    "id": message_id
-                }
+                message_body = _message_send_body(query, message_id)
                 
                 logger.debug(
                     "Sending A2A message",
@@ -82,11 +109,9 @@ class A2AProtocolClient:
                 # Send the message to the A2A agent
                 response = await client.post(
                     f"{endpoint}/",  # A2A agents use root endpoint for JSON-RPC
-                    json=message_payload,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Accept": "application/json"
-                    }
+                    content=message_body,
+                    headers=_JSON_HEADERS,
+                    timeout=self.timeout
                 )
                 
                 if response.status_code != 200:
@@ -205,6 +230,50 @@ class A2AProtocolClient:
                 "text": f"Unexpected error: {str(e)}"
             }
     
+    async def _get_agent_card(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return the endpoint's agent card, fetching it at most once per TTL
+        
+        Cards only change when an agent is redeployed, so queries inside the
+        TTL skip the extra round-trip. Only successful fetches are cached, so
+        an agent that was briefly unavailable is asked again on the next query.
+        Concurrent misses for one endpoint wait for a single fetch.
+        """
+        cached = self._fresh_card(endpoint)
+        if cached is not None:
+            return cached
+        
+        lock = self._card_locks.setdefault(endpoint, asyncio.Lock())
+        async with lock:
+            # Another query may have fetched the card while this one waited
+            cached = self._fresh_card(endpoint)
+            if cached is not None:
+                return cached
+            
+            agent_card_url = f"{endpoint}/.well-known/agent-card.json"
+            logger.debug(
+                "Fetching A2A agent card",
+                url=agent_card_url
+            )
+            
+            fetched_at = time.monotonic()
+            card_response = await client.get(agent_card_url, timeout=self.timeout)
+            if card_response.status_code != 200:
+                return None
+            agent_card = card_response.json()
+            self._card_cache[endpoint] = (fetched_at, agent_card)
+            return agent_card
+    
+    def _fresh_card(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Return the endpoint's cached agent card if it is still within the TTL"""
+        cached = self._card_cache.get(endpoint)
+        if cached is not None and time.monotonic() - cached[0] < self.card_ttl_seconds:
+            return cached[1]
+        return None
+    
     def _extract_text_from_message(self, message: Dict[str, Any]) -> str:
         """
         Extract text content from an A2A message structure
@@ -13,7 +13,12 @@ logger = structlog.get_logger()
 class A2ADiscoveryStrategy(DiscoveryStrategy):
     """Discovery strategy for A2A (Agent-to-Agent) protocol agents"""
     
-    def __init__(self, registry_endpoint: Optional[str] = None):
+    def __init__(
+        self,
+        registry_endpoint: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        super().__init__(client)
         self.registry_endpoint = registry_endpoint
         # In a real implementation, this might connect to an A2A registry
         
@@ -67,10 +72,13 @@ class A2ADiscoveryStrategy(DiscoveryStrategy):
     async def health_check(self, agent: DiscoveredAgent) -> AgentStatus:
         """Check A2A agent health using agent card endpoint"""
         try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
+            async with self._http_client(timeout=self._HEALTH_CHECK_TIMEOUT) as client:
                 # For A2A SDK v0.3.0, use the agent card endpoint as health check
                 try:
-                    response = await client.get(f"{agent.endpoint}/.well-known/agent-card.json")
+                    response = await client.get(
+                        f"{agent.endpoint}/.well-known/agent-card.json",
+                        timeout=self._HEALTH_CHECK_TIMEOUT
+                    )
                     
                     if response.status_code == 200:
                         # If we can successfully get the agent card, agent is healthy
@@ -91,7 +99,8 @@ class A2ADiscoveryStrategy(DiscoveryStrategy):
                         
                         response = await client.post(
                             f"{agent.endpoint}/ping", 
-                            json=ping_payload
+                            json=ping_payload,
+                            timeout=self._HEALTH_CHECK_TIMEOUT
                         )
                         
                         if response.status_code == 200:
@@ -110,7 +119,7 @@ class A2ADiscoveryStrategy(DiscoveryStrategy):
                     except httpx.RequestError:
                         # Final fallback to standard health endpoint
                         try:
-                            response = await client.get(f"{agent.endpoint}/health")
+                            response = await client.get(f"{agent.endpoint}/health", timeout=self._HEALTH_CHECK_TIMEOUT)
                             if response.status_code == 200:
                                 return AgentStatus.HEALTHY
                         except httpx.RequestError:
@@ -129,11 +138,11 @@ class A2ADiscoveryStrategy(DiscoveryStrategy):
     async def _query_a2a_agent(self, endpoint: str) -> Optional[Dict[str, Any]]:
         """Query A2A agent for its information using various discovery methods"""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self._http_client(timeout=self._DISCOVERY_TIMEOUT) as client:
                 
                 # Method 1: Try A2A discovery endpoint
                 try:
-                    response = await client.get(f"{endpoint}/agent-info")
+                    response = await client.get(f"{endpoint}/agent-info", timeout=self._DISCOVERY_TIMEOUT)
                     if response.status_code == 200:
                         return response.json()
                 except httpx.RequestError:
@@ -143,7 +152,8 @@ class A2ADiscoveryStrategy(DiscoveryStrategy):
                 try:
                     response = await client.post(
                         f"{endpoint}/query",
-                        json={"action": "describe_agent"}
+                        json={"action": "describe_agent"},
+                        timeout=self._DISCOVERY_TIMEOUT
                     )
                     if response.status_code == 200:
                         return response.json()
@@ -152,7 +162,7 @@ class A2ADiscoveryStrategy(DiscoveryStrategy):
                     
                 # Method 3: Try A2A capabilities endpoint
                 try:
-                    response = await client.get(f"{endpoint}/capabilities")
+                    response = await client.get(f"{endpoint}/capabilities", timeout=self._DISCOVERY_TIMEOUT)
                     if response.status_code == 200:
                         return response.json()
                 except httpx.RequestError:
@@ -160,7 +170,7 @@ class A2ADiscoveryStrategy(DiscoveryStrategy):
                 
                 # Method 4: Try root endpoint for agent info
                 try:
-                    response = await client.get(endpoint)
+                    response = await client.get(endpoint, timeout=self._DISCOVERY_TIMEOUT)
                     if response.status_code == 200:
                         data = response.json()
                         # Check if it looks like A2A agent info
@@ -27,12 +27,12 @@ class ACPDiscoveryStrategy(DiscoveryStrategy):
         endpoint = self._build_endpoint_url(base_info)
         
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self._http_client(timeout=self._DISCOVERY_TIMEOUT) as client:
                 # Try to fetch capabilities (ACP standard endpoint)
-                capabilities_data = await self._fetch_capabilities(client, endpoint)
+                capabilities_data = await self._fetch_capabilities(client, endpoint, self._DISCOVERY_TIMEOUT)
                 
                 # Try to fetch schema for more details
-                schema_data = await self._fetch_schema(client, endpoint)
+                schema_data = await self._fetch_schema(client, endpoint, self._DISCOVERY_TIMEOUT)
                 
                 # Parse capabilities
                 capabilities = self._parse_acp_capabilities(
@@ -75,8 +75,8 @@ class ACPDiscoveryStrategy(DiscoveryStrategy):
     async def health_check(self, agent: DiscoveredAgent) -> AgentStatus:
         """Check ACP agent health using standard health endpoint"""
         try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
-                response = await client.get(f"{agent.endpoint}/health")
+            async with self._http_client(timeout=self._HEALTH_CHECK_TIMEOUT) as client:
+                response = await client.get(f"{agent.endpoint}/health", timeout=self._HEALTH_CHECK_TIMEOUT)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -103,10 +103,15 @@ class ACPDiscoveryStrategy(DiscoveryStrategy):
             )
             return AgentStatus.UNKNOWN
     
-    async def _fetch_capabilities(self, client: httpx.AsyncClient, endpoint: str) -> Dict[str, Any]:
+    async def _fetch_capabilities(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        timeout: float
+    ) -> Dict[str, Any]:
         """Fetch capabilities from ACP agent"""
         try:
-            response = await client.get(f"{endpoint}/capabilities")
+            response = await client.get(f"{endpoint}/capabilities", timeout=timeout)
             if response.status_code == 200:
                 return response.json()
         except Exception as e:
@@ -114,10 +119,15 @@ class ACPDiscoveryStrategy(DiscoveryStrategy):
         
         return {}
     
-    async def _fetch_schema(self, client: httpx.AsyncClient, endpoint: str) -> Dict[str, Any]:
+    async def _fetch_schema(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        timeout: float
+    ) -> Dict[str, Any]:
         """Fetch schema from ACP agent"""
         try:
-            response = await client.get(f"{endpoint}/schema")
+            response = await client.get(f"{endpoint}/schema", timeout=timeout)
             if response.status_code == 200:
                 return response.json()
         except Exception as e:
@@ -1,7 +1,8 @@
 """Base interfaces for protocol clients and discovery strategies"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, Optional, List
 import httpx
 import structlog
 from datetime import datetime
@@ -14,6 +15,16 @@ logger = structlog.get_logger()
 class DiscoveryStrategy(ABC):
     """Base class for protocol-specific discovery strategies"""
     
+    # Per-request timeouts; passed on each call so they also bound requests
+    # made through the shared client, whose own default is the discovery timeout
+    _HEALTH_CHECK_TIMEOUT = 3.0
+    _DISCOVERY_TIMEOUT = 5.0
+    
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Pooled client shared by the discovery service; None means each
+        # probe opens its own short-lived client
+        self._client = client
+    
     @abstractmethod
     async def discover(self, container_info: Dict[str, Any]) -> Optional[DiscoveredAgent]:
         """Discover agent capabilities using protocol-specific methods"""
@@ -24,6 +35,19 @@ class DiscoveryStrategy(ABC):
         """Check agent health using protocol-specific methods"""
         pass
     
+    @asynccontextmanager
+    async def _http_client(self, timeout: float) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared client if one was injected, else a short-lived one
+        
+        The shared client keeps its own default timeout, so callers pass
+        ``timeout`` on each request as well.
+        """
+        if self._client is not None:
+            yield self._client
+        else:
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                yield client
+    
     async def extract_base_info(self, container_info: Dict[str, Any]) -> Dict[str, Any]:
         """Extract common information from container"""
         labels = container_info.get("Config", {}).get("Labels", {})
@@ -123,8 +147,8 @@ class GenericDiscoveryStrategy(DiscoveryStrategy):
         
         # Try basic HTTP endpoint to see if service is responsive
         try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
-                response = await client.get(endpoint)
+            async with self._http_client(timeout=self._HEALTH_CHECK_TIMEOUT) as client:
+                response = await client.get(endpoint, timeout=self._HEALTH_CHECK_TIMEOUT)
                 if response.status_code == 200:
                     
                     # Try to extract capabilities from container labels
@@ -156,17 +180,17 @@ class GenericDiscoveryStrategy(DiscoveryStrategy):
     async def health_check(self, agent: DiscoveredAgent) -> AgentStatus:
         """Basic HTTP health check"""
         try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
+            async with self._http_client(timeout=self._HEALTH_CHECK_TIMEOUT) as client:
                 # Try standard health endpoint
                 try:
-                    response = await client.get(f"{agent.endpoint}/health")
+                    response = await client.get(f"{agent.endpoint}/health", timeout=self._HEALTH_CHECK_TIMEOUT)
                     if response.status_code == 200:
                         return AgentStatus.HEALTHY
                 except httpx.RequestError:
                     pass
                 
                 # Fallback to root endpoint
-                response = await client.get(agent.endpoint)
+                response = await client.get(agent.endpoint, timeout=self._HEALTH_CHECK_TIMEOUT)
                 if response.status_code == 200:
                     return AgentStatus.HEALTHY
                     
@@ -27,13 +27,13 @@ class MCPDiscoveryStrategy(DiscoveryStrategy):
         endpoint = self._build_endpoint_url(base_info)
         
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self._http_client(timeout=self._DISCOVERY_TIMEOUT) as client:
                 # MCP exposes tools and resources
-                tools = await self._fetch_tools(client, endpoint)
-                resources = await self._fetch_resources(client, endpoint)
+                tools = await self._fetch_tools(client, endpoint, self._DISCOVERY_TIMEOUT)
+                resources = await self._fetch_resources(client, endpoint, self._DISCOVERY_TIMEOUT)
                 
                 # Get server info
-                server_info = await self._fetch_server_info(client, endpoint)
+                server_info = await self._fetch_server_info(client, endpoint, self._DISCOVERY_TIMEOUT)
                 
                 capabilities = self._parse_mcp_capabilities(tools, resources)
                 
@@ -71,10 +71,10 @@ class MCPDiscoveryStrategy(DiscoveryStrategy):
     async def health_check(self, agent: DiscoveredAgent) -> AgentStatus:
         """Check MCP agent health"""
         try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
+            async with self._http_client(timeout=self._HEALTH_CHECK_TIMEOUT) as client:
                 # Try MCP-specific health endpoint
                 try:
-                    response = await client.get(f"{agent.endpoint}/health")
+                    response = await client.get(f"{agent.endpoint}/health", timeout=self._HEALTH_CHECK_TIMEOUT)
                     if response.status_code == 200:
                         data = response.json()
                         status = data.get("status", "").lower()
@@ -93,14 +93,14 @@ class MCPDiscoveryStrategy(DiscoveryStrategy):
                 
                 # Fallback: check if tools endpoint is accessible
                 try:
-                    response = await client.get(f"{agent.endpoint}/tools")
+                    response = await client.get(f"{agent.endpoint}/tools", timeout=self._HEALTH_CHECK_TIMEOUT)
                     if response.status_code == 200:
                         return AgentStatus.HEALTHY
                 except httpx.RequestError:
                     pass
                 
                 # Final fallback: check root endpoint
-                response = await client.get(agent.endpoint)
+                response = await client.get(agent.endpoint, timeout=self._HEALTH_CHECK_TIMEOUT)
                 if response.status_code == 200:
                     return AgentStatus.HEALTHY
                     
@@ -113,10 +113,15 @@ class MCPDiscoveryStrategy(DiscoveryStrategy):
             )
             return AgentStatus.UNKNOWN
     
-    async def _fetch_tools(self, client: httpx.AsyncClient, endpoint: str) -> List[Dict[str, Any]]:
+    async def _fetch_tools(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        timeout: float
+    ) -> List[Dict[str, Any]]:
         """Fetch available tools from MCP agent"""
         try:
-            response = await client.get(f"{endpoint}/tools")
+            response = await client.get(f"{endpoint}/tools", timeout=timeout)
             if response.status_code == 200:
                 data = response.json()
                 # Handle both direct array and wrapped response
@@ -129,10 +134,15 @@ class MCPDiscoveryStrategy(DiscoveryStrategy):
         
         return []
     
-    async def _fetch_resources(self, client: httpx.AsyncClient, endpoint: str) -> List[Dict[str, Any]]:
+    async def _fetch_resources(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        timeout: float
+    ) -> List[Dict[str, Any]]:
         """Fetch available resources from MCP agent"""
         try:
-            response = await client.get(f"{endpoint}/resources")
+            response = await client.get(f"{endpoint}/resources", timeout=timeout)
             if response.status_code == 200:
                 data = response.json()
                 # Handle both direct array and wrapped response
@@ -145,10 +155,15 @@ class MCPDiscoveryStrategy(DiscoveryStrategy):
         
         return []
     
-    async def _fetch_server_info(self, client: httpx.AsyncClient, endpoint: str) -> Dict[str, Any]:
+    async def _fetch_server_info(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        timeout: float
+    ) -> Dict[str, Any]:
         """Fetch server information from MCP agent"""
         try:
-            response = await client.get(f"{endpoint}/")
+            response = await client.get(f"{endpoint}/", timeout=timeout)
             if response.status_code == 200:
                 return response.json()
         except Exception as e:
@@ -200,10 +200,10 @@ def mock_pydantic_ai_agent():
     # Mock successful run
     mock_result = AsyncMock()
     mock_result.data = {
-        "selected_agent": "acp-hello-world",
+        "selected_agent_id": "acp-hello-world",
         "reasoning": "This agent can handle greeting requests",
         "confidence": 0.9,
-        "alternative_agents": []
+        "alternative_agent_ids": []
     }
     
     mock_agent.run.return_value = mock_result
@@ -3,9 +3,10 @@
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 import httpx
+import asyncio
 import json
 
-from orchestrator.protocols.a2a_client import A2AProtocolClient
+from orchestrator.protocols.a2a_client import A2AProtocolClient, _message_send_body
 
 
 class TestA2AProtocolClient:
@@ -62,6 +63,11 @@ class TestA2AProtocolClient:
             assert "🧮 Calc: 2.0 + 2.0 = 4.0" in result["text"]
             assert "message_id" in result
             assert result["role"] == "agent"
+            
+            # The JSON-RPC body is sent pre-encoded
+            sent = json.loads(mock_client.post.call_args.kwargs["content"])
+            assert sent["method"] == "message/send"
+            assert sent["params"]["message"]["parts"][0]["text"] == query
 
     @pytest.mark.asyncio
     async def test_send_query_http_error(self):
@@ -173,6 +179,103 @@ class TestA2AProtocolClient:
             assert "Invalid Request" in result["error"]
             assert "text" in result
 
+    @pytest.mark.asyncio
+    async def test_send_query_uses_injected_client(self):
+        """Test an injected pooled client is reused and no per-call client is opened."""
+        shared_client = AsyncMock()
+        shared_client.get.return_value = Mock(status_code=200, json=lambda: {})
+        mock_post_response = Mock()
+        mock_post_response.status_code = 200
+        mock_post_response.json.return_value = {"jsonrpc": "2.0", "result": "ok", "id": "test_id"}
+        shared_client.post.return_value = mock_post_response
+        client = A2AProtocolClient(timeout=5.0, client=shared_client)
+        
+        with patch('httpx.AsyncClient') as mock_client_class:
+            first = await client.send_query("http://test-agent:8002", "one")
+            second = await client.send_query("http://test-agent:8002", "two")
+        
+        assert first["text"] == second["text"] == "ok"
+        assert shared_client.post.await_count == 2
+        # The client's own timeout applies even though the pool is shared
+        assert shared_client.post.call_args.kwargs["timeout"] == 5.0
+        assert shared_client.get.call_args.kwargs["timeout"] == 5.0
+        mock_client_class.assert_not_called()
+        shared_client.aclose.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_agent_card_cached_per_endpoint(self):
+        """Test the agent card is fetched once per endpoint within the TTL."""
+        shared_client = AsyncMock()
+        shared_client.get.return_value = Mock(status_code=200, json=lambda: {"name": "Math"})
+        mock_post_response = Mock()
+        mock_post_response.status_code = 200
+        mock_post_response.json.return_value = {"jsonrpc": "2.0", "result": "ok", "id": "test_id"}
+        shared_client.post.return_value = mock_post_response
+        client = A2AProtocolClient(timeout=5.0, client=shared_client)
+        
+        await client.send_query("http://test-agent:8002", "one")
+        await client.send_query("http://test-agent:8002", "two")
+        assert shared_client.get.await_count == 1
+        
+        await client.send_query("http://other-agent:8002", "three")
+        assert shared_client.get.await_count == 2
+        
+        client.card_ttl_seconds = 0
+        await client.send_query("http://test-agent:8002", "four")
+        assert shared_client.get.await_count == 3
+        assert shared_client.post.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_agent_card_failures_not_cached(self):
+        """Test a failed card fetch is retried on the next query instead of cached."""
+        shared_client = AsyncMock()
+        shared_client.get.side_effect = [
+            Mock(status_code=503, json=lambda: {}),
+            Mock(status_code=200, json=lambda: {"name": "Math"}),
+        ]
+        client = A2AProtocolClient(timeout=5.0, client=shared_client)
+        
+        assert await client._get_agent_card(shared_client, "http://test-agent:8002") is None
+        assert await client._get_agent_card(shared_client, "http://test-agent:8002") == {"name": "Math"}
+        assert await client._get_agent_card(shared_client, "http://test-agent:8002") == {"name": "Math"}
+        assert shared_client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_agent_card_concurrent_misses_share_fetch(self):
+        """Test concurrent queries for an uncached endpoint fetch its card once."""
+        async def slow_get(url, **kwargs):
+            await asyncio.sleep(0.01)
+            return Mock(status_code=200, json=lambda: {"name": "Math"})
+        
+        shared_client = AsyncMock()
+        shared_client.get.side_effect = slow_get
+        client = A2AProtocolClient(timeout=5.0, client=shared_client)
+        
+        cards = await asyncio.gather(*(
+            client._get_agent_card(shared_client, "http://test-agent:8002") for _ in range(5)
+        ))
+        
+        assert cards == [{"name": "Math"}] * 5
+        assert shared_client.get.await_count == 1
+
+    def test_message_send_body(self):
+        """Test the pre-encoded JSON-RPC body matches the A2A message/send shape."""
+        query = 'Say "hi" \\ 🧮\nnow'
+        body = json.loads(_message_send_body(query, "abc123"))
+        
+        assert body == {
+            "jsonrpc": "2.0",
+            "method": "message/send",
+            "params": {
+                "message": {
+                    "role": "user",
+                    "parts": [{"kind": "text", "text": query}],
+                    "messageId": "abc123"
+                }
+            },
+            "id": "abc123"
+        }
+
     def test_extract_text_from_message(self):
         """Test text extraction from A2A message structure."""
         client = A2AProtocolClient()
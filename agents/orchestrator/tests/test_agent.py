@@ -1,7 +1,7 @@
 """Tests for orchestrator agent"""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 from datetime import datetime
 
 from orchestrator.agent import OrchestratorAgent, OrchestratorContext
@@ -49,6 +49,8 @@ class TestOrchestratorAgent:
         ]
         
         service.get_healthy_agents.return_value = test_agents
+        agents_by_id = {agent.agent_id: agent for agent in test_agents}
+        service.get_agent_by_id.side_effect = agents_by_id.get
         service.get_agents_by_capability.return_value = []
         service.get_agents_by_protocol.return_value = []
         service.mark_agent_request.return_value = None
@@ -63,17 +65,19 @@ class TestOrchestratorAgent:
         settings.llm_provider = LLMProvider.OPENAI
         settings.openai_api_key = "test-openai-key"
         settings.anthropic_api_key = None
+        settings.routing_timeout_seconds = 30.0
+        settings.enable_fallback_routing = True
         return settings
     
     @pytest.fixture
     def orchestrator_agent(self, mock_discovery_service, mock_settings):
         """Create orchestrator agent with mocked dependencies"""
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model') as mock_infer_model:
+             patch('orchestrator.agent.OpenAIModel') as mock_openai_model:
             
             # Mock the inferred model
             mock_model = MagicMock()
-            mock_infer_model.return_value = mock_model
+            mock_openai_model.return_value = mock_model
             
             agent = OrchestratorAgent(mock_discovery_service)
             
@@ -90,7 +94,7 @@ class TestOrchestratorAgent:
         assert context.discovery_service == mock_discovery_service
         assert context.request == request
         assert context.available_agents == []
-        assert isinstance(context.routing_start_time, datetime)
+        assert isinstance(context.routing_start_time, float)
     
     def test_model_creation_openai(self, mock_discovery_service):
         """Test OpenAI model creation"""
@@ -100,14 +104,14 @@ class TestOrchestratorAgent:
         mock_settings.anthropic_api_key = None
         
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model') as mock_infer_model:
+             patch('orchestrator.agent.OpenAIModel') as mock_openai_model:
             
             mock_model = MagicMock()
-            mock_infer_model.return_value = mock_model
+            mock_openai_model.return_value = mock_model
             
             agent = OrchestratorAgent(mock_discovery_service)
             
-            mock_infer_model.assert_called_once_with('openai:gpt-4o')
+            mock_openai_model.assert_called_once_with('gpt-4o', provider=ANY)
             assert agent.model == mock_model
     
     def test_model_creation_anthropic(self, mock_discovery_service):
@@ -118,14 +122,14 @@ class TestOrchestratorAgent:
         mock_settings.anthropic_api_key = "test-anthropic-key"
         
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model') as mock_infer_model:
+             patch('orchestrator.agent._PromptCachingAnthropicModel') as mock_anthropic_model:
             
             mock_model = MagicMock()
-            mock_infer_model.return_value = mock_model
+            mock_anthropic_model.return_value = mock_model
             
             agent = OrchestratorAgent(mock_discovery_service)
             
-            mock_infer_model.assert_called_once_with('anthropic:claude-3-5-sonnet-20241022')
+            mock_anthropic_model.assert_called_once_with('claude-3-5-sonnet-20241022', provider=ANY)
             assert agent.model == mock_model
     
     
@@ -157,13 +161,12 @@ class TestOrchestratorAgent:
             capabilities=[AgentCapability(name="greeting", description="Generate greetings")],
             status=AgentStatus.HEALTHY
         )
-        mock_result.data = RoutingDecision(
-            request_id="test-request-123",
-            selected_agent=mock_agent,
-            confidence=0.95,
-            reasoning="This is a greeting request, perfect for the greeting agent",
-            alternative_agents=[]
-        )
+        mock_result.data = {
+            "selected_agent_id": mock_agent.agent_id,
+            "confidence": 0.95,
+            "reasoning": "This is a greeting request, perfect for the greeting agent",
+            "alternative_agent_ids": []
+        }
         
         orchestrator_agent.agent.run.return_value = mock_result
         
@@ -320,9 +323,9 @@ class TestOrchestratorAgent:
     def test_get_metrics(self, orchestrator_agent):
         """Test metrics retrieval"""
         # Modify some metrics
-        orchestrator_agent.metrics.total_requests = 10
-        orchestrator_agent.metrics.successful_requests = 8
-        orchestrator_agent.metrics.failed_requests = 2
+        orchestrator_agent._metrics.total_requests = 10
+        orchestrator_agent._metrics.successful_requests = 8
+        orchestrator_agent._metrics.failed_requests = 2
         
         metrics = orchestrator_agent.get_metrics()
         
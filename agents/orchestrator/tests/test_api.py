@@ -55,6 +55,21 @@ class TestFastAPIApplication:
             )
         ]
         
+        async def get_agents(protocol=None, capability=None, status=None):
+            return [
+                agent for agent in test_agents
+                if (protocol is None or agent.protocol == protocol)
+                and (capability is None or agent.has_capability(capability))
+                and (status is None or agent.status == status)
+            ]
+        
+        service.get_agents.side_effect = get_agents
+        
+        capability_index = {}
+        for agent in test_agents:
+            for cap in agent.capabilities:
+                capability_index.setdefault(cap.name, []).append((cap, agent))
+        service.get_capability_index.return_value = capability_index
         service.get_all_agents.return_value = test_agents
         service.get_healthy_agents.return_value = test_agents
         service.get_agent_by_id.return_value = test_agents[0]
@@ -62,6 +77,7 @@ class TestFastAPIApplication:
         service.get_agents_by_protocol.return_value = [test_agents[0]]
         service.is_healthy.return_value = True
         service.refresh.return_value = None
+        service.registry_version = 1
         
         return service
     
@@ -279,6 +295,47 @@ class TestFastAPIApplication:
         data = response.json()
         assert "Invalid protocol" in data["error"]["message"]
     
+    def test_list_agents_combined_filters(self, client, mock_discovery_service):
+        """Test protocol, capability and status filters are applied together"""
+        response = client.get("/agents?protocol=a2a&capability=greeting&status_filter=healthy")
+        
+        assert response.status_code == 200
+        assert response.json() == []
+        mock_discovery_service.get_agents.assert_awaited_once_with(
+            protocol=ProtocolType.A2A,
+            capability="greeting",
+            status=AgentStatus.HEALTHY
+        )
+    
+    def test_list_agents_streams_large_registry(self, client, mock_discovery_service):
+        """Test a large agent list is streamed as one valid JSON array"""
+        agents = [
+            DiscoveredAgent(
+                agent_id=f"agent-{i}",
+                name=f"Agent {i}",
+                protocol=ProtocolType.ACP,
+                endpoint=f"http://agent-{i}:8000",
+                status=AgentStatus.HEALTHY
+            )
+            for i in range(600)
+        ]
+        mock_discovery_service.get_agents.side_effect = None
+        mock_discovery_service.get_agents.return_value = agents
+        
+        response = client.get("/agents")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [agent["agent_id"] for agent in data] == [agent.agent_id for agent in agents]
+    
+    def test_list_agents_unknown_status(self, client, mock_discovery_service):
+        """Test an unknown status filter matches no agents"""
+        response = client.get("/agents?status_filter=sleepy")
+        
+        assert response.status_code == 200
+        assert response.json() == []
+        mock_discovery_service.get_agents.assert_not_awaited()
+    
     def test_get_agent_by_id(self, client):
         """Test getting specific agent by ID"""
         response = client.get("/agents/acp-greeting-agent")
@@ -348,6 +405,13 @@ class TestFastAPIApplication:
         
         assert response.status_code == 422  # Validation error
     
+    def test_route_request_invalid_protocol(self, client, mock_orchestrator_agent):
+        """Test an unknown preferred protocol is rejected before routing"""
+        response = client.post("/route", json={"query": "Hello", "preferred_protocol": "smtp"})
+        
+        assert response.status_code == 422
+        mock_orchestrator_agent.route_request.assert_not_called()
+    
     def test_process_request(self, client):
         """Test complete request processing"""
         request_data = {
@@ -416,6 +480,46 @@ class TestFastAPIApplication:
             assert "protocols" in greeting_cap
             assert "total_agents" in greeting_cap
     
+    def test_list_capabilities_cached_per_registry_version(self, client, mock_discovery_service):
+        """Test capabilities are re-aggregated only when the registry changes"""
+        first = client.get("/capabilities").json()
+        second = client.get("/capabilities").json()
+        
+        assert second == first
+        assert mock_discovery_service.get_capability_index.await_count == 1
+        
+        mock_discovery_service.registry_version = 2
+        client.get("/capabilities")
+        
+        assert mock_discovery_service.get_capability_index.await_count == 2
+    
+    def test_list_capabilities_streams_large_index(self, client, mock_discovery_service):
+        """Test a large capability aggregate is streamed as one valid JSON object"""
+        agent = DiscoveredAgent(
+            agent_id="many-skills",
+            name="Many Skills",
+            protocol=ProtocolType.A2A,
+            endpoint="http://many-skills:8002",
+            status=AgentStatus.HEALTHY
+        )
+        capability_index = {
+            f"skill-{i}": [(AgentCapability(name=f"skill-{i}", description=f"Skill {i}"), agent)]
+            for i in range(600)
+        }
+        mock_discovery_service.get_capability_index.return_value = capability_index
+        mock_discovery_service.registry_version = 3
+        
+        for _ in range(2):  # Fresh aggregate, then the cached one
+            response = client.get("/capabilities")
+            
+            assert response.status_code == 200
+            data = response.json()
+            assert list(data["capabilities"]) == list(capability_index)
+            assert data["total_capabilities"] == 600
+            assert data["capabilities"]["skill-7"]["agents"][0]["agent_id"] == "many-skills"
+        
+        assert mock_discovery_service.get_capability_index.await_count == 1
+    
     def test_cors_headers(self, client):
         """Test CORS headers are present"""
         response = client.options("/", headers={"Origin": "http://localhost:3000"})
@@ -511,6 +615,15 @@ class TestFastAPIApplication:
         assert "redoc" in response.text.lower()
 
 
+def test_healthz_liveness_probe():
+    """Test the bare liveness probe answers without the service stack"""
+    response = TestClient(app).get("/healthz")
+    
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    assert "/healthz" not in app.openapi()["paths"]
+
+
 class TestAPIIntegration:
     """Integration tests for API - additional class for organization"""
     pass  # Integration tests moved to TestFastAPIApplication class
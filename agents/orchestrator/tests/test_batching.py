@@ -0,0 +1,101 @@
+"""Tests for routing request micro-batching."""
+
+import asyncio
+
+import pytest
+
+from orchestrator.batching import RoutingBatcher
+from orchestrator.models import RoutingDecision, RoutingRequest
+
+
+def make_decision(request: RoutingRequest) -> RoutingDecision:
+    """Build a minimal decision for a request."""
+    return RoutingDecision(
+        request_id=request.request_id,
+        confidence=0.5,
+        reasoning=f"Routed {request.query}"
+    )
+
+
+class TestRoutingBatcher:
+    """Test suite for RoutingBatcher."""
+
+    @pytest.fixture
+    def calls(self):
+        """Record of route_one/route_many invocations."""
+        return []
+
+    @pytest.fixture
+    def batcher(self, calls):
+        """Batcher whose route functions record how they were called."""
+        async def route_one(request):
+            calls.append(("one", [request.request_id]))
+            await asyncio.sleep(0.01)
+            return make_decision(request)
+
+        async def route_many(requests):
+            calls.append(("many", [request.request_id for request in requests]))
+            await asyncio.sleep(0.01)
+            return [make_decision(request) for request in requests]
+
+        return RoutingBatcher(route_one, route_many, max_batch=3, window_ms=20)
+
+    @pytest.mark.asyncio
+    async def test_isolated_request_is_routed_alone(self, batcher, calls):
+        """Test a lone request skips batching."""
+        await batcher.start()
+        try:
+            request = RoutingRequest(request_id="solo", query="Hello")
+            decision = await batcher.submit(request)
+        finally:
+            await batcher.stop()
+
+        assert decision.request_id == "solo"
+        assert calls == [("one", ["solo"])]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_batched(self, batcher, calls):
+        """Test concurrent requests are grouped up to max_batch."""
+        await batcher.start()
+        try:
+            requests = [RoutingRequest(request_id=f"r{i}", query=f"Query {i}") for i in range(5)]
+            decisions = await asyncio.gather(*(batcher.submit(request) for request in requests))
+        finally:
+            await batcher.stop()
+
+        assert [decision.request_id for decision in decisions] == ["r0", "r1", "r2", "r3", "r4"]
+        assert calls == [("many", ["r0", "r1", "r2"]), ("many", ["r3", "r4"])]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_error_propagates_to_callers(self):
+        """Test a failing batch call surfaces on every waiting request."""
+        async def route_one(request):
+            raise RuntimeError("LLM unavailable")
+
+        batcher = RoutingBatcher(route_one, route_one)
+        await batcher.start()
+        try:
+            with pytest.raises(RuntimeError, match="LLM unavailable"):
+                await batcher.submit(RoutingRequest(query="Hello"))
+        finally:
+            await batcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_mid_window_fails_collected_requests(self, calls):
+        """Test stopping while a batch is being collected fails its requests instead of hanging."""
+        async def route(requests):
+            calls.append(requests)
+
+        batcher = RoutingBatcher(route, route, max_batch=8, window_ms=1000)
+        await batcher.start()
+        submissions = [
+            asyncio.create_task(batcher.submit(RoutingRequest(request_id=f"r{i}", query=f"Query {i}")))
+            for i in range(2)
+        ]
+        await asyncio.sleep(0.05)  # Both requests are now held in the collection window
+
+        await batcher.stop()
+
+        results = await asyncio.wait_for(asyncio.gather(*submissions, return_exceptions=True), timeout=1)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert calls == []
@@ -25,6 +25,7 @@ class TestSettings:
         assert settings.default_model_temperature == 0.7
         assert settings.discovery_interval_seconds == 30  # Default value
         assert settings.max_retries == 3
+        assert settings.enable_routing_batching is False
     
     def test_environment_variable_override(self):
         """Test that environment variables override defaults"""
@@ -110,6 +111,14 @@ class TestSettings:
                 openai_api_key="test-key",
                 max_retries=-1
             )
+        
+        # Non-positive probe concurrency
+        with pytest.raises(ValueError, match="Max parallel probes must be at least 1"):
+            get_settings_for_testing(
+                llm_provider="openai",
+                openai_api_key="test-key",
+                max_parallel_probes=0
+            )
     
     def test_production_validation(self):
         """Test production environment validation"""
@@ -1,12 +1,16 @@
 """Tests for unified discovery service"""
 
+import json
+import logging
+import time
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
 import aiohttp
+from pydantic_core import from_json
 
-from orchestrator.discovery import UnifiedDiscoveryService
+from orchestrator.discovery import UnifiedDiscoveryService, _debug_enabled
 from orchestrator.models import ProtocolType, AgentStatus, AgentCapability, DiscoveredAgent, AgentRegistryEntry
 
 pytestmark = pytest.mark.asyncio
@@ -20,7 +24,12 @@ class TestUnifiedDiscoveryService:
         """Mock settings for testing"""
         settings = MagicMock()
         settings.discovery_interval_seconds = 60
+        settings.discovery_max_interval_seconds = 240
+        settings.health_cache_ttl_seconds = 60.0
+        settings.max_parallel_probes = 16
+        settings.cleanup_interval_seconds = 300
         settings.discovery_timeout_seconds = 5
+        settings.agent_descriptor_ttl_seconds = 120.0
         return settings
     
     @pytest.fixture
@@ -35,14 +44,247 @@ class TestUnifiedDiscoveryService:
         # Mock refresh to avoid actual HTTP discovery
         with patch.object(discovery_service, 'refresh', new_callable=AsyncMock):
             await discovery_service.start()
+            discovery_task = discovery_service._discovery_task
             
             assert discovery_service._running is True
-            assert discovery_service._discovery_task is not None
+            assert discovery_task is not None
+            
+            # A second start must not spawn another discovery loop
+            await discovery_service.start()
+            assert discovery_service._discovery_task is discovery_task
+            discovery_service.refresh.assert_awaited_once()
             assert len(discovery_service.agent_registry) == 0  # No agents discovered yet
             
             await discovery_service.stop()
             
             assert discovery_service._running is False
+            assert discovery_service._strategy_client is None
+    
+    async def test_strategies_cached_per_service_until_stop(self, discovery_service):
+        """Test strategies are reused while running and rebuilt on a new client after restart"""
+        with patch.object(discovery_service, 'refresh', new_callable=AsyncMock), \
+             patch('orchestrator.discovery.get_discovery_strategy',
+                   side_effect=lambda protocol, client: MagicMock(client=client)) as mock_get_strategy:
+            await discovery_service.start()
+            first = discovery_service._strategy_for("acp")
+            assert discovery_service._strategy_for("acp") is first
+            assert first.client is discovery_service._strategy_client
+            await discovery_service.stop()
+            assert discovery_service._strategies == {}
+            
+            await discovery_service.start()
+            second = discovery_service._strategy_for("acp")
+            assert second is not first
+            assert second.client is discovery_service._strategy_client
+            await discovery_service.stop()
+        
+        assert mock_get_strategy.call_count == 2
+    
+    async def test_discovery_loop_backs_off_while_registry_is_stable(self, discovery_service):
+        """Test the loop doubles its interval when nothing changes and resets on churn"""
+        agent = DiscoveredAgent(
+            agent_id="churning-agent",
+            name="Churning Agent",
+            protocol=ProtocolType.ACP,
+            endpoint="http://localhost:8001",
+            capabilities=[]
+        )
+        sleeps = []
+        
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 5:
+                discovery_service._running = False
+        
+        async def fake_refresh():
+            # The fourth refresh changes the registry
+            if len(sleeps) == 4:
+                discovery_service.agent_registry[agent.agent_id] = AgentRegistryEntry(agent=agent)
+        
+        discovery_service._running = True
+        with patch('orchestrator.discovery.asyncio.sleep', side_effect=fake_sleep), \
+             patch.object(discovery_service, 'refresh', side_effect=fake_refresh):
+            await discovery_service._discovery_loop()
+        
+        assert sleeps == [60, 120, 240, 240, 60]
+    
+    async def test_cleanup_loop_runs_on_its_own_interval(self, discovery_service):
+        """Test registry cleanup runs from its own loop rather than every refresh"""
+        sleeps = []
+        
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 2:
+                discovery_service._running = False
+        
+        discovery_service._running = True
+        with patch('orchestrator.discovery.asyncio.sleep', side_effect=fake_sleep), \
+             patch.object(discovery_service, '_cleanup_registry') as mock_cleanup:
+            await discovery_service._cleanup_loop()
+        
+        assert sleeps == [300, 300]
+        mock_cleanup.assert_called_once()
+        
+        with patch.object(discovery_service, '_discover_agents_http',
+                         new_callable=AsyncMock, return_value=[]), \
+             patch.object(discovery_service, '_cleanup_registry') as mock_cleanup:
+            await discovery_service.refresh()
+        
+        mock_cleanup.assert_not_called()
+    
+    async def test_injected_session_is_shared_and_not_closed(self, mock_settings):
+        """Test an injected HTTP session is used for probes and left open on stop"""
+        session = MagicMock()
+        session.close = AsyncMock()
+        with patch('orchestrator.discovery.get_settings', return_value=mock_settings):
+            service = UnifiedDiscoveryService(session=session)
+        
+        with patch.object(service, 'refresh', new_callable=AsyncMock), \
+             patch.object(service, '_probe_known_endpoints', new_callable=AsyncMock) as mock_probe:
+            await service.start()
+            await service._discover_agents_http()
+            await service.stop()
+        
+        mock_probe.assert_awaited_once_with(session)
+        session.close.assert_not_awaited()
+    
+    async def test_fetch_descriptor_cached_within_ttl(self, discovery_service):
+        """Test agent descriptor documents are fetched once per TTL window"""
+        response = MagicMock()
+        response.status = 200
+        response.json = AsyncMock(return_value={"capabilities": ["greeting"]})
+        session = MagicMock()
+        session.get.return_value.__aenter__ = AsyncMock(return_value=response)
+        session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+        url = "http://localhost:8000/capabilities"
+        
+        first = await discovery_service._fetch_descriptor(session, url)
+        second = await discovery_service._fetch_descriptor(session, url)
+        
+        assert first == {"capabilities": ["greeting"]}
+        assert second is first
+        assert session.get.call_count == 1
+        response.json.assert_awaited_once_with(loads=from_json)
+        
+        discovery_service.settings.agent_descriptor_ttl_seconds = 0
+        await discovery_service._fetch_descriptor(session, url)
+        assert session.get.call_count == 2
+    
+    async def test_probe_endpoint_group_falls_back_in_order(self, discovery_service):
+        """Test an agent's localhost fallback is only probed after its container URL fails"""
+        ok_response = MagicMock()
+        ok_response.status = 200
+        
+        def get(url):
+            context = MagicMock()
+            if url.startswith("http://acp-hello-world-agent"):
+                context.__aenter__ = AsyncMock(side_effect=aiohttp.ClientConnectionError("no route"))
+            else:
+                context.__aenter__ = AsyncMock(return_value=ok_response)
+            context.__aexit__ = AsyncMock(return_value=False)
+            return context
+        
+        session = MagicMock()
+        session.get.side_effect = get
+        endpoints = [
+            {"url": "http://acp-hello-world-agent:8000", "protocol": "acp", "name": "hello-world"},
+            {"url": "http://localhost:8000", "protocol": "acp", "name": "hello-world"},
+            {"url": "http://localhost:9000", "protocol": "acp", "name": "hello-world"},
+        ]
+        agent = DiscoveredAgent(
+            agent_id="acp-hello-world",
+            name="hello-world",
+            protocol=ProtocolType.ACP,
+            endpoint="http://localhost:8000",
+            capabilities=[]
+        )
+        
+        with patch.object(discovery_service, '_create_agent_from_endpoint',
+                         new_callable=AsyncMock, return_value=agent) as mock_create:
+            groups = discovery_service._build_probe_groups(endpoints)
+            result = await discovery_service._probe_endpoint_group(groups[0][1], session)
+        
+        assert result is agent
+        mock_create.assert_awaited_once_with(endpoints[1], session)
+        requested = [call.args[0] for call in session.get.call_args_list]
+        assert [url for url in requested if url.endswith("/health")] == [
+            "http://acp-hello-world-agent:8000/health",
+            "http://localhost:8000/health"
+        ]
+        # Each probe fetches the capabilities document alongside its health check
+        assert "http://localhost:8000/capabilities" in requested
+    
+    async def test_probe_endpoint_group_times_out_slow_agent(self, discovery_service):
+        """Test a hung agent construction is cut off by the discovery timeout"""
+        ok_response = MagicMock()
+        ok_response.status = 200
+        session = MagicMock()
+        session.get.return_value.__aenter__ = AsyncMock(return_value=ok_response)
+        session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+        groups = discovery_service._build_probe_groups([
+            {"url": "http://localhost:8000", "protocol": "acp", "name": "hello-world"}
+        ])
+        
+        async def hang(endpoint, session):
+            await asyncio.sleep(10)
+        
+        discovery_service.settings.discovery_timeout_seconds = 0.01
+        with patch.object(discovery_service, '_create_agent_from_endpoint', side_effect=hang):
+            result = await asyncio.wait_for(
+                discovery_service._probe_endpoint_group(groups[0][1], session), timeout=1
+            )
+        
+        assert result is None
+    
+    def test_debug_guard_follows_live_log_level(self):
+        """Test per-probe debug logging is gated on the logger level at call time"""
+        stdlib_logger = logging.getLogger("orchestrator.discovery")
+        previous = stdlib_logger.level
+        try:
+            stdlib_logger.setLevel(logging.INFO)
+            assert not _debug_enabled()
+            stdlib_logger.setLevel(logging.DEBUG)
+            assert _debug_enabled()
+        finally:
+            stdlib_logger.setLevel(previous)
+    
+    def test_build_probe_groups(self):
+        """Test endpoints are grouped per agent with protocol-specific probe and descriptor URLs"""
+        groups = UnifiedDiscoveryService._build_probe_groups([
+            {"url": "http://acp-agent:8000", "protocol": "acp", "name": "hello"},
+            {"url": "http://a2a-agent:8002", "protocol": "a2a", "name": "math"},
+            {"url": "http://localhost:8000", "protocol": "acp", "name": "hello"},
+        ])
+        
+        assert [agent_key for agent_key, _ in groups] == ["acp-hello", "a2a-math"]
+        assert [[urls for _, *urls in group] for _, group in groups] == [
+            [
+                ["http://acp-agent:8000/health", "http://acp-agent:8000/capabilities"],
+                ["http://localhost:8000/health", "http://localhost:8000/capabilities"]
+            ],
+            [[None, "http://a2a-agent:8002/.well-known/agent-card.json"]]
+        ]
+    
+    async def test_probe_endpoint_group_a2a_fetches_card_once(self, discovery_service):
+        """Test an A2A agent card answers both the liveness probe and the descriptor fetch"""
+        response = MagicMock()
+        response.status = 200
+        response.json = AsyncMock(return_value={"name": "Math", "version": "1.0", "skills": []})
+        session = MagicMock()
+        session.get.return_value.__aenter__ = AsyncMock(return_value=response)
+        session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+        endpoint = {"url": "http://localhost:8002", "protocol": "a2a", "name": "math"}
+        groups = discovery_service._build_probe_groups([endpoint])
+        
+        agent = await discovery_service._probe_endpoint_group(groups[0][1], session)
+        
+        assert agent is not None
+        assert agent.metadata["version"] == "1.0"
+        session.get.assert_called_once_with("http://localhost:8002/.well-known/agent-card.json")
+        
+        # Inside the descriptor TTL the next probe still goes to the network
+        await discovery_service._probe_endpoint_group(groups[0][1], session)
+        assert session.get.call_count == 2
     
     async def test_http_discovery_success(self, discovery_service):
         """Test successful HTTP-based agent discovery"""
@@ -132,6 +374,220 @@ class TestUnifiedDiscoveryService:
         assert registry_entry.last_seen > old_time
         assert registry_entry.agent.name == "Existing Agent Updated"
     
+    async def test_update_registry_identical_refresh_keeps_version(self, discovery_service):
+        """Test a refresh that finds the same agents in the same state keeps derived views"""
+        def discover():
+            return DiscoveredAgent(
+                agent_id="stable-agent",
+                name="Stable Agent",
+                protocol=ProtocolType.ACP,
+                endpoint="http://localhost:8001",
+                capabilities=[AgentCapability(name="greeting", description="Greets")],
+                status=AgentStatus.HEALTHY
+            )
+        
+        with patch('orchestrator.discovery.get_discovery_strategy') as mock_get_strategy:
+            mock_strategy = AsyncMock()
+            mock_strategy.health_check.return_value = AgentStatus.HEALTHY
+            mock_get_strategy.return_value = mock_strategy
+            
+            await discovery_service._update_registry([discover()])
+            version = discovery_service.registry_version
+            registered = discovery_service.agent_registry["stable-agent"].agent
+            payload = await discovery_service.get_healthy_agents_payload()
+            
+            discovery_service._health_cache.clear()
+            await discovery_service._update_registry([discover()])
+            
+            assert discovery_service.registry_version == version
+            assert discovery_service.agent_registry["stable-agent"].agent is registered
+            assert await discovery_service.get_healthy_agents_payload() is payload
+            
+            # A changed description is a real change
+            renamed = discover()
+            renamed.name = "Renamed Agent"
+            await discovery_service._update_registry([renamed])
+            assert discovery_service.registry_version > version
+            assert discovery_service.agent_registry["stable-agent"].agent is renamed
+    
+    async def test_update_registry_keeps_registry_on_empty_discovery(self, discovery_service):
+        """Test an empty discovery pass keeps known agents but stops routing to them"""
+        agent = DiscoveredAgent(
+            agent_id="known-agent",
+            name="Known Agent",
+            protocol=ProtocolType.ACP,
+            endpoint="http://localhost:8001",
+            capabilities=[],
+            status=AgentStatus.HEALTHY
+        )
+        discovery_service.agent_registry["known-agent"] = AgentRegistryEntry(agent=agent)
+        version = discovery_service.registry_version
+        
+        for _ in range(6):
+            await discovery_service._update_registry([])
+        
+        entry = discovery_service.agent_registry["known-agent"]
+        assert entry.consecutive_failures == 0
+        assert entry.agent.status == AgentStatus.UNKNOWN
+        assert await discovery_service.get_healthy_agents() == []
+        # Only the first empty pass changed anything
+        assert discovery_service.registry_version == version + 1
+        
+        # A long outage does not age the entry out while nothing is discoverable
+        entry.last_seen = datetime.utcnow() - timedelta(hours=2)
+        discovery_service._last_successful_discovery = entry.last_seen
+        discovery_service._cleanup_registry()
+        assert "known-agent" in discovery_service.agent_registry
+        
+        # Once probing recovers, a confirmed agent is routable again
+        with patch('orchestrator.discovery.get_discovery_strategy') as mock_get_strategy:
+            mock_strategy = AsyncMock()
+            mock_strategy.health_check.return_value = AgentStatus.HEALTHY
+            mock_get_strategy.return_value = mock_strategy
+            await discovery_service._update_registry([agent])
+        
+        assert entry.agent.status == AgentStatus.HEALTHY
+        assert discovery_service._last_successful_discovery > datetime.utcnow() - timedelta(minutes=1)
+    
+    async def test_update_registry_health_checks_run_concurrently(self, discovery_service):
+        """Test health checks for discovered agents overlap instead of running in sequence"""
+        agents = [
+            DiscoveredAgent(
+                agent_id=f"agent-{i}",
+                name=f"Agent {i}",
+                protocol=ProtocolType.ACP,
+                endpoint=f"http://localhost:800{i}",
+                capabilities=[]
+            )
+            for i in range(3)
+        ]
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def health_check(agent):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if agent.agent_id == "agent-1":
+                raise RuntimeError("probe failed")
+            return AgentStatus.HEALTHY
+        
+        with patch('orchestrator.discovery.get_discovery_strategy') as mock_get_strategy:
+            mock_strategy = AsyncMock()
+            mock_strategy.health_check.side_effect = health_check
+            mock_get_strategy.return_value = mock_strategy
+            await discovery_service._update_registry(agents)
+        
+        assert max_in_flight == 3
+        assert discovery_service.agent_registry["agent-0"].agent.status == AgentStatus.HEALTHY
+        assert discovery_service.agent_registry["agent-1"].agent.status == AgentStatus.UNKNOWN
+        assert discovery_service.agent_registry["agent-1"].consecutive_failures == 1
+    
+    async def test_update_registry_health_checks_bounded(self, discovery_service):
+        """Test health checks never exceed the configured number of parallel probes"""
+        discovery_service._probe_slots = asyncio.Semaphore(2)
+        agents = [
+            DiscoveredAgent(
+                agent_id=f"agent-{i}",
+                name=f"Agent {i}",
+                protocol=ProtocolType.ACP,
+                endpoint=f"http://localhost:800{i}",
+                capabilities=[]
+            )
+            for i in range(5)
+        ]
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def health_check(agent):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return AgentStatus.HEALTHY
+        
+        with patch('orchestrator.discovery.get_discovery_strategy') as mock_get_strategy:
+            mock_strategy = AsyncMock()
+            mock_strategy.health_check.side_effect = health_check
+            mock_get_strategy.return_value = mock_strategy
+            await discovery_service._update_registry(agents)
+        
+        assert max_in_flight == 2
+        assert all(
+            entry.agent.status == AgentStatus.HEALTHY
+            for entry in discovery_service.agent_registry.values()
+        )
+    
+    async def test_health_checks_cached_and_shared(self, discovery_service):
+        """Test overlapping health checks share one probe and recent results are reused"""
+        agent = DiscoveredAgent(
+            agent_id="probed-agent",
+            name="Probed Agent",
+            protocol=ProtocolType.ACP,
+            endpoint="http://localhost:8001",
+            capabilities=[]
+        )
+        
+        async def health_check(agent):
+            await asyncio.sleep(0.01)
+            return AgentStatus.HEALTHY
+        
+        with patch('orchestrator.discovery.get_discovery_strategy') as mock_get_strategy:
+            mock_strategy = AsyncMock()
+            mock_strategy.health_check.side_effect = health_check
+            mock_get_strategy.return_value = mock_strategy
+            
+            results = await asyncio.gather(
+                discovery_service._check_agent_health(agent),
+                discovery_service._check_agent_health(agent)
+            )
+            assert results == [AgentStatus.HEALTHY, AgentStatus.HEALTHY]
+            assert mock_strategy.health_check.await_count == 1
+            
+            assert await discovery_service._check_agent_health(agent) == AgentStatus.HEALTHY
+            assert mock_strategy.health_check.await_count == 1
+            
+            discovery_service.settings.health_cache_ttl_seconds = 0
+            await discovery_service._check_agent_health(agent)
+            assert mock_strategy.health_check.await_count == 2
+            
+            # Unhealthy results are never reused
+            discovery_service.settings.health_cache_ttl_seconds = 60.0
+            mock_strategy.health_check.side_effect = None
+            mock_strategy.health_check.return_value = AgentStatus.UNHEALTHY
+            await discovery_service._check_agent_health(agent)
+            await discovery_service._check_agent_health(agent)
+            assert mock_strategy.health_check.await_count == 4
+    
+    async def test_probe_known_endpoints_skips_recently_healthy_agents(self, discovery_service):
+        """Test agents confirmed healthy within the TTL are carried over without probing"""
+        discovery_service._probe_groups = discovery_service._build_probe_groups([
+            {"url": "http://localhost:8000", "protocol": "acp", "name": "hello-world"},
+            {"url": "http://localhost:8002", "protocol": "a2a", "name": "math"},
+        ])
+        fresh_agent = DiscoveredAgent(
+            agent_id="acp-hello-world",
+            name="hello-world",
+            protocol=ProtocolType.ACP,
+            endpoint="http://localhost:8000",
+            capabilities=[],
+            status=AgentStatus.HEALTHY
+        )
+        discovery_service.agent_registry["acp-hello-world"] = AgentRegistryEntry(agent=fresh_agent)
+        discovery_service._health_cache["http://localhost:8000"] = (time.monotonic(), AgentStatus.HEALTHY)
+        session = MagicMock()
+        
+        with patch.object(discovery_service, '_probe_endpoint_group',
+                         new_callable=AsyncMock, return_value=None) as mock_probe:
+            agents = await discovery_service._probe_known_endpoints(session)
+        
+        assert agents == [fresh_agent]
+        mock_probe.assert_awaited_once()
+        assert mock_probe.await_args.args[0][0][0]["name"] == "math"
+    
     async def test_get_healthy_agents(self, discovery_service):
         """Test getting healthy agents from registry"""
         healthy_agent = DiscoveredAgent(
@@ -161,6 +617,99 @@ class TestUnifiedDiscoveryService:
         
         assert len(healthy_agents) == 1
         assert healthy_agents[0].agent_id == "healthy-agent"
+        
+        # Callers get their own list; the cached view survives until the registry changes
+        healthy_agents.clear()
+        assert len(await discovery_service.get_healthy_agents()) == 1
+        
+        discovery_service.agent_registry["unhealthy-agent"].agent.status = AgentStatus.HEALTHY
+        discovery_service._invalidate_registry_caches()
+        assert len(await discovery_service.get_healthy_agents()) == 2
+    
+    async def test_get_healthy_agents_payload_versioned(self, discovery_service):
+        """Test tool payload is memoized per registry version"""
+        healthy_agent = DiscoveredAgent(
+            agent_id="healthy-agent",
+            name="Healthy Agent",
+            protocol=ProtocolType.ACP,
+            endpoint="http://localhost:8001",
+            capabilities=[AgentCapability(name="greeting", description="Greets", tags=["hello"])],
+            status=AgentStatus.HEALTHY
+        )
+        discovery_service.agent_registry["healthy-agent"] = AgentRegistryEntry(agent=healthy_agent)
+        
+        payload = await discovery_service.get_healthy_agents_payload()
+        
+        assert payload == [{
+            "agent_id": "healthy-agent",
+            "name": "Healthy Agent",
+            "protocol": "acp",
+            "capabilities": [{"name": "greeting", "description": "Greets", "tags": ["hello"]}],
+            "status": "healthy",
+            "endpoint": "http://localhost:8001",
+            "metadata": {}
+        }]
+        assert await discovery_service.get_healthy_agents_payload() is payload
+        
+        version = discovery_service.registry_version
+        with patch('orchestrator.discovery.get_discovery_strategy') as mock_get_strategy:
+            mock_strategy = AsyncMock()
+            mock_strategy.health_check.return_value = AgentStatus.UNHEALTHY
+            mock_get_strategy.return_value = mock_strategy
+            await discovery_service._update_registry([healthy_agent])
+        
+        assert discovery_service.registry_version > version
+        assert await discovery_service.get_healthy_agents_payload() == []
+    
+    async def test_get_healthy_agents_payload_json(self, discovery_service):
+        """Test the JSON tool payload is serialized once per registry version"""
+        healthy_agent = DiscoveredAgent(
+            agent_id="healthy-agent",
+            name="Healthy Agent",
+            protocol=ProtocolType.ACP,
+            endpoint="http://localhost:8001",
+            capabilities=[],
+            status=AgentStatus.HEALTHY
+        )
+        discovery_service.agent_registry["healthy-agent"] = AgentRegistryEntry(agent=healthy_agent)
+        
+        payload_json = await discovery_service.get_healthy_agents_payload_json()
+        
+        assert json.loads(payload_json) == await discovery_service.get_healthy_agents_payload()
+        assert await discovery_service.get_healthy_agents_payload_json() is payload_json
+        
+        discovery_service._invalidate_registry_caches()
+        assert await discovery_service.get_healthy_agents_payload_json() is not payload_json
+    
+    async def test_get_capability_index(self, discovery_service):
+        """Test agents are indexed by capability once per registry version"""
+        greeting = AgentCapability(name="greeting", description="Say hello")
+        first_agent = DiscoveredAgent(
+            agent_id="first-agent",
+            name="First Agent",
+            protocol=ProtocolType.ACP,
+            endpoint="http://localhost:8001",
+            capabilities=[greeting]
+        )
+        second_agent = DiscoveredAgent(
+            agent_id="second-agent",
+            name="Second Agent",
+            protocol=ProtocolType.A2A,
+            endpoint="http://localhost:8002",
+            capabilities=[greeting, AgentCapability(name="math", description="Do math")]
+        )
+        discovery_service.agent_registry["first-agent"] = AgentRegistryEntry(agent=first_agent)
+        discovery_service.agent_registry["second-agent"] = AgentRegistryEntry(agent=second_agent)
+        
+        index = await discovery_service.get_capability_index()
+        
+        assert [agent.agent_id for _, agent in index["greeting"]] == ["first-agent", "second-agent"]
+        assert [agent.agent_id for _, agent in index["math"]] == ["second-agent"]
+        assert index["greeting"][0][0].description == "Say hello"
+        assert await discovery_service.get_capability_index() is index
+        
+        discovery_service._invalidate_registry_caches()
+        assert await discovery_service.get_capability_index() is not index
     
     async def test_get_agents_by_protocol(self, discovery_service):
         """Test filtering agents by protocol"""
@@ -192,6 +741,36 @@ class TestUnifiedDiscoveryService:
         assert len(acp_agents) == 1
         assert acp_agents[0].agent_id == "acp-agent"
     
+    async def test_get_agents_combined_filters(self, discovery_service):
+        """Test protocol, capability and status filters applied together"""
+        agents = [
+            DiscoveredAgent(
+                agent_id=agent_id,
+                name=agent_id,
+                protocol=protocol,
+                endpoint="http://localhost:8001",
+                capabilities=[AgentCapability(name=capability, description=capability)],
+                status=agent_status
+            )
+            for agent_id, protocol, capability, agent_status in [
+                ("acp-greeting", ProtocolType.ACP, "greeting", AgentStatus.HEALTHY),
+                ("acp-greeting-down", ProtocolType.ACP, "greeting", AgentStatus.UNHEALTHY),
+                ("acp-math", ProtocolType.ACP, "math", AgentStatus.HEALTHY),
+                ("a2a-greeting", ProtocolType.A2A, "greeting", AgentStatus.HEALTHY),
+            ]
+        ]
+        for agent in agents:
+            discovery_service.agent_registry[agent.agent_id] = AgentRegistryEntry(agent=agent)
+        
+        matches = await discovery_service.get_agents(
+            protocol=ProtocolType.ACP,
+            capability="greeting",
+            status=AgentStatus.HEALTHY
+        )
+        
+        assert [agent.agent_id for agent in matches] == ["acp-greeting"]
+        assert len(await discovery_service.get_agents()) == 4
+    
     async def test_get_agents_by_capability(self, discovery_service):
         """Test filtering agents by capability"""
         agent_with_greeting = DiscoveredAgent(
@@ -226,6 +805,12 @@ class TestUnifiedDiscoveryService:
         
         assert len(greeting_agents) == 1
         assert greeting_agents[0].agent_id == "greeting-agent"
+        
+        # Matches are remembered until the registry changes
+        del discovery_service.agent_registry["greeting-agent"]
+        assert len(await discovery_service.get_agents_by_capability("GREETING")) == 1
+        discovery_service._invalidate_registry_caches()
+        assert await discovery_service.get_agents_by_capability("greeting") == []
     
     async def test_cleanup_registry(self, discovery_service):
         """Test cleanup of stale agents"""
@@ -330,4 +915,8 @@ class TestUnifiedDiscoveryService:
         assert stats["total_agents"] == 2
         assert stats["healthy_agents"] == 1
         assert stats["by_protocol"]["acp"] == 1
-        assert stats["by_protocol"]["mcp"] == 1
\ No newline at end of file
+        assert stats["by_protocol"]["mcp"] == 1
+        assert discovery_service.get_registry_stats() is stats
+        
+        discovery_service._invalidate_registry_caches()
+        assert discovery_service.get_registry_stats() is not stats
\ No newline at end of file
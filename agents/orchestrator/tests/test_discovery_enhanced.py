@@ -20,6 +20,10 @@ class TestEnhancedDiscoveryService:
         with patch('orchestrator.discovery.get_settings') as mock_get_settings:
             mock_settings = MagicMock()
             mock_settings.discovery_interval_seconds = 30
+            mock_settings.agent_descriptor_ttl_seconds = 120.0
+            mock_settings.health_cache_ttl_seconds = 60.0
+            mock_settings.max_parallel_probes = 16
+            mock_settings.cleanup_interval_seconds = 300
             mock_get_settings.return_value = mock_settings
             return UnifiedDiscoveryService()
 
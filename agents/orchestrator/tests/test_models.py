@@ -178,7 +178,7 @@ class TestDiscoveredAgent:
     def test_agent_methods(self):
         """Test agent utility methods"""
         capability1 = AgentCapability(name="greeting", description="Test")
-        capability2 = AgentCapability(name="math", description="Test")
+        capability2 = AgentCapability(name="math", description="Test", tags=["Arithmetic"])
         
         agent = DiscoveredAgent(
             agent_id="test",
@@ -199,6 +199,7 @@ class TestDiscoveredAgent:
         assert agent.has_capability("greeting") is True
         assert agent.has_capability("GREETING") is True  # Case insensitive
         assert agent.has_capability("nonexistent") is False
+        assert agent.has_capability("arithmetic") is True  # Matches tags too
         
         # Test is_healthy
         assert agent.is_healthy() is True
@@ -517,6 +518,11 @@ class TestAgentRegistryEntry:
         entry.mark_success()
         assert entry.consecutive_failures == 0
         assert isinstance(entry.last_seen, datetime)
+        
+        # An explicit timestamp is used as-is
+        seen_at = datetime(2024, 1, 1, 12, 0, 0)
+        entry.mark_success(seen_at)
+        assert entry.last_seen == seen_at
     
     def test_should_remove(self, sample_discovered_agent):
         """Test should_remove logic"""
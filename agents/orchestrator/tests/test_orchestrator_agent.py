@@ -1,10 +1,20 @@
 """Tests for the orchestrator agent functionality."""
 
+import asyncio
+import inspect
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 from datetime import datetime
 
-from orchestrator.agent import OrchestratorAgent, OrchestratorContext
+from pydantic_ai.models.anthropic import AnthropicModel
+
+from orchestrator.agent import (
+    _AGENT_CACHE,
+    _AGENT_CACHE_SIZE,
+    OrchestratorAgent,
+    OrchestratorContext,
+    _PromptCachingAnthropicModel,
+)
 from orchestrator.models import (
     RoutingRequest, DiscoveredAgent, AgentCapability, 
     ProtocolType, AgentStatus, LLMProvider, RoutingDecision
@@ -19,6 +29,7 @@ class TestOrchestratorAgent:
         """Create mock discovery service."""
         service = AsyncMock()
         service.get_healthy_agents.return_value = []
+        service.get_agent_by_id.return_value = None
         service.get_agents_by_capability.return_value = []
         service.mark_agent_request.return_value = None
         service.is_healthy.return_value = True
@@ -31,6 +42,8 @@ class TestOrchestratorAgent:
         settings.llm_provider = LLMProvider.OPENAI
         settings.openai_api_key = "test-openai-key"
         settings.anthropic_api_key = None
+        settings.routing_timeout_seconds = 30.0
+        settings.enable_fallback_routing = True
         return settings
 
     def test_orchestrator_context_creation(self, mock_discovery_service):
@@ -41,7 +54,7 @@ class TestOrchestratorAgent:
         assert context.discovery_service == mock_discovery_service
         assert context.request == request
         assert context.available_agents == []
-        assert isinstance(context.routing_start_time, datetime)
+        assert isinstance(context.routing_start_time, float)
 
     def test_orchestrator_context_available_agents_property(self, mock_discovery_service):
         """Test OrchestratorContext available_agents property."""
@@ -73,7 +86,7 @@ class TestOrchestratorAgent:
         # Test that all properties are accessible
         assert context.discovery_service == mock_discovery_service
         assert context.request.query == "Test query with context"
-        assert isinstance(context.routing_start_time, datetime)
+        assert isinstance(context.routing_start_time, float)
         assert isinstance(context.available_agents, list)
 
     def test_orchestrator_context_timing(self, mock_discovery_service):
@@ -81,7 +94,7 @@ class TestOrchestratorAgent:
         import time
         
         request = RoutingRequest(query="Timing test query")
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
         # Small delay to ensure different timestamps
         time.sleep(0.001)
@@ -91,14 +104,23 @@ class TestOrchestratorAgent:
         # routing_start_time should be after our start_time
         assert context.routing_start_time > start_time
 
+    def test_orchestrator_context_has_no_instance_dict(self, mock_discovery_service):
+        """Test OrchestratorContext uses slots and rejects unknown attributes."""
+        request = RoutingRequest(query="Test query")
+        context = OrchestratorContext(mock_discovery_service, request)
+        
+        assert not hasattr(context, "__dict__")
+        with pytest.raises(AttributeError):
+            context.unexpected_attribute = True
+
     def test_orchestrator_agent_initialization_openai(self, mock_discovery_service, mock_settings):
         """Test OrchestratorAgent initialization with OpenAI."""
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model') as mock_infer_model, \
+             patch('orchestrator.agent.OpenAIModel') as mock_openai_model, \
              patch('orchestrator.agent.Agent') as mock_agent_class:
             
             mock_model = MagicMock()
-            mock_infer_model.return_value = mock_model
+            mock_openai_model.return_value = mock_model
             mock_agent_instance = MagicMock()
             mock_agent_class.return_value = mock_agent_instance
             
@@ -108,7 +130,63 @@ class TestOrchestratorAgent:
             assert orchestrator.model == mock_model
             assert orchestrator.agent == mock_agent_instance
             
-            mock_infer_model.assert_called_once_with('openai:gpt-4o')
+            mock_openai_model.assert_called_once_with('gpt-4o', provider=ANY)
+
+    def test_orchestrator_agent_reuses_cached_agent(self, mock_discovery_service, mock_settings):
+        """Test instances with the same provider share one model and Pydantic AI agent."""
+        with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
+             patch('orchestrator.agent.OpenAIModel') as mock_openai_model, \
+             patch('orchestrator.agent.Agent') as mock_agent_class:
+            
+            first = OrchestratorAgent(mock_discovery_service)
+            second = OrchestratorAgent(mock_discovery_service)
+            
+            assert second.agent is first.agent
+            assert second.model is first.model
+            mock_openai_model.assert_called_once()
+            mock_agent_class.assert_called_once()
+
+    def test_orchestrator_agent_cache_keyed_by_credentials(self, mock_discovery_service, mock_settings):
+        """Test a changed API key or missing key never reuses another instance's agent."""
+        with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
+             patch('orchestrator.agent.OpenAIModel') as mock_openai_model, \
+             patch('orchestrator.agent.Agent'):
+            first = OrchestratorAgent(mock_discovery_service)
+            
+            mock_settings.openai_api_key = "rotated-openai-key"
+            rotated = OrchestratorAgent(mock_discovery_service)
+            assert rotated.agent is not first.agent
+            assert mock_openai_model.call_count == 2
+            
+            mock_settings.openai_api_key = None
+            with pytest.raises(ValueError, match="OpenAI API key is required"):
+                OrchestratorAgent(mock_discovery_service)
+        
+        other_settings = MagicMock()
+        other_settings.llm_provider = LLMProvider.OPENAI
+        other_settings.openai_api_key = "test-openai-key"
+        with patch('orchestrator.agent.get_settings', return_value=other_settings), \
+             patch('orchestrator.agent.OpenAIModel'), \
+             patch('orchestrator.agent.Agent'):
+            assert OrchestratorAgent(mock_discovery_service).agent is not first.agent
+
+    def test_orchestrator_agent_cache_is_bounded(self, mock_discovery_service):
+        """Test replaced settings instances are evicted from the shared agent cache."""
+        settings_instances = []
+        for index in range(_AGENT_CACHE_SIZE + 2):
+            settings = MagicMock()
+            settings.llm_provider = LLMProvider.OPENAI
+            settings.openai_api_key = f"test-openai-key-{index}"
+            settings_instances.append(settings)
+            with patch('orchestrator.agent.get_settings', return_value=settings), \
+                 patch('orchestrator.agent.OpenAIModel'), \
+                 patch('orchestrator.agent.Agent'):
+                OrchestratorAgent(mock_discovery_service)
+        
+        assert len(_AGENT_CACHE) <= _AGENT_CACHE_SIZE
+        cached_settings = [entry[0] for entry in _AGENT_CACHE.values()]
+        assert all(settings not in cached_settings for settings in settings_instances[:2])
+        assert settings_instances[-1] in cached_settings
 
     def test_orchestrator_agent_initialization_anthropic(self, mock_discovery_service):
         """Test OrchestratorAgent initialization with Anthropic."""
@@ -118,17 +196,39 @@ class TestOrchestratorAgent:
         mock_settings.anthropic_api_key = "test-anthropic-key"
         
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model') as mock_infer_model, \
+             patch('orchestrator.agent._PromptCachingAnthropicModel') as mock_anthropic_model, \
              patch('orchestrator.agent.Agent') as mock_agent_class:
             
             mock_model = MagicMock()
-            mock_infer_model.return_value = mock_model
+            mock_anthropic_model.return_value = mock_model
             mock_agent_instance = MagicMock()
             mock_agent_class.return_value = mock_agent_instance
             
             orchestrator = OrchestratorAgent(mock_discovery_service)
             
-            mock_infer_model.assert_called_once_with('anthropic:claude-3-5-sonnet-20241022')
+            mock_anthropic_model.assert_called_once_with('claude-3-5-sonnet-20241022', provider=ANY)
+
+    def test_prompt_caching_model_matches_upstream_hook(self):
+        """Test the private AnthropicModel hook the caching override wraps keeps its signature."""
+        hook = AnthropicModel._map_message
+        
+        assert inspect.iscoroutinefunction(hook)
+        assert list(inspect.signature(hook).parameters) == ["self", "messages"]
+
+    @pytest.mark.asyncio
+    async def test_prompt_caching_model_marks_system_prompt(self):
+        """Test the system prompt is sent as a cacheable text block."""
+        model = object.__new__(_PromptCachingAnthropicModel)
+        messages = [{"role": "user", "content": "Hello"}]
+        
+        with patch.object(AnthropicModel, '_map_message',
+                          new_callable=AsyncMock, return_value=("Route requests", messages)):
+            system_prompt, mapped = await model._map_message([])
+        
+        assert system_prompt == [
+            {"type": "text", "text": "Route requests", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert mapped is messages
 
     def test_orchestrator_agent_missing_api_key(self, mock_discovery_service):
         """Test OrchestratorAgent initialization fails with missing API key."""
@@ -155,11 +255,11 @@ class TestOrchestratorAgent:
     def test_get_system_prompt(self, mock_discovery_service, mock_settings):
         """Test system prompt generation."""
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model') as mock_infer_model, \
+             patch('orchestrator.agent.OpenAIModel') as mock_openai_model, \
              patch('orchestrator.agent.Agent'):
             
             mock_model = MagicMock()
-            mock_infer_model.return_value = mock_model
+            mock_openai_model.return_value = mock_model
             
             orchestrator = OrchestratorAgent(mock_discovery_service)
             prompt = orchestrator._get_system_prompt()
@@ -175,11 +275,11 @@ class TestOrchestratorAgent:
     async def test_route_request_success(self, mock_discovery_service, mock_settings):
         """Test successful request routing."""
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model') as mock_infer_model, \
+             patch('orchestrator.agent.OpenAIModel') as mock_openai_model, \
              patch('orchestrator.agent.Agent') as mock_agent_class:
             
             mock_model = MagicMock()
-            mock_infer_model.return_value = mock_model
+            mock_openai_model.return_value = mock_model
             mock_agent_instance = AsyncMock()
             mock_agent_class.return_value = mock_agent_instance
             
@@ -194,14 +294,21 @@ class TestOrchestratorAgent:
             
             # Mock AI agent response
             mock_result = MagicMock()
-            mock_result.data = RoutingDecision(
-                request_id="test-request-123",
-                selected_agent=test_agent,
-                confidence=0.9,
-                reasoning="This is a greeting request",
-                alternative_agents=[]
-            )
+            mock_result.data = {
+                "selected_agent_id": "greeting-agent",
+                "confidence": 0.9,
+                "reasoning": "This is a greeting request",
+                "alternative_agent_ids": []
+            }
             mock_agent_instance.run.return_value = mock_result
+            other_agent = DiscoveredAgent(
+                agent_id="math-agent",
+                name="Math Agent",
+                protocol=ProtocolType.A2A,
+                endpoint="http://math:8000",
+                capabilities=[AgentCapability(name="arithmetic", description="Do math")]
+            )
+            mock_discovery_service.get_healthy_agents.return_value = [test_agent, other_agent]
             
             orchestrator = OrchestratorAgent(mock_discovery_service)
             request = RoutingRequest(query="Hello there!")
@@ -215,15 +322,100 @@ class TestOrchestratorAgent:
             # Verify agent was marked as used
             mock_discovery_service.mark_agent_request.assert_called_once_with("greeting-agent")
 
+    @pytest.mark.asyncio
+    async def test_route_request_reuses_decision_for_identical_query(self, mock_discovery_service, mock_settings):
+        """Test identical queries share one LLM call, concurrently and from the cache."""
+        with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
+             patch('orchestrator.agent.OpenAIModel'), \
+             patch('orchestrator.agent.Agent') as mock_agent_class:
+            
+            mock_agent_instance = AsyncMock()
+            mock_agent_class.return_value = mock_agent_instance
+            
+            agents = [
+                DiscoveredAgent(
+                    agent_id=agent_id,
+                    name=agent_id,
+                    protocol=ProtocolType.ACP,
+                    endpoint=f"http://{agent_id}:8000",
+                    capabilities=[]
+                )
+                for agent_id in ("greeting-agent", "math-agent")
+            ]
+            mock_discovery_service.get_healthy_agents.return_value = agents
+            mock_discovery_service.registry_version = 1
+            
+            mock_result = MagicMock()
+            mock_result.data = {
+                "selected_agent_id": "greeting-agent",
+                "confidence": 0.9,
+                "reasoning": "Greeting request"
+            }
+            mock_agent_instance.run.return_value = mock_result
+            
+            orchestrator = OrchestratorAgent(mock_discovery_service)
+            requests = [RoutingRequest(query=query) for query in ("Hello", "hello ", "  HELLO")]
+            
+            with patch('orchestrator.agent.logger') as mock_logger:
+                first, second = await asyncio.gather(
+                    orchestrator.route_request(requests[0]),
+                    orchestrator.route_request(requests[1])
+                )
+                third = await orchestrator.route_request(requests[2])
+            
+            # Reused decisions are logged as cache hits, not as fast-path decisions
+            routed = [
+                call.kwargs for call in mock_logger.info.call_args_list
+                if call.args == ("Request routed successfully",)
+            ]
+            assert [entry["cached"] for entry in routed] == [False, True, True]
+            assert not any(entry["fast_path"] for entry in routed)
+            
+            assert mock_agent_instance.run.call_count == 1
+            assert [d.request_id for d in (first, second, third)] == [r.request_id for r in requests]
+            assert all(d.selected_agent == agents[0] for d in (first, second, third))
+            
+            mock_discovery_service.registry_version = 2
+            await orchestrator.route_request(RoutingRequest(query="Hello"))
+            
+            assert mock_agent_instance.run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_route_request_unknown_agent_id(self, mock_discovery_service, mock_settings):
+        """Test an agent ID missing from discovery yields an unsuccessful decision."""
+        with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
+             patch('orchestrator.agent.OpenAIModel'), \
+             patch('orchestrator.agent.Agent') as mock_agent_class:
+            
+            mock_agent_instance = AsyncMock()
+            mock_agent_class.return_value = mock_agent_instance
+            
+            mock_result = MagicMock()
+            mock_result.data = {
+                "selected_agent_id": "made-up-agent",
+                "confidence": 0.6,
+                "reasoning": "Looks right"
+            }
+            mock_agent_instance.run.return_value = mock_result
+            
+            orchestrator = OrchestratorAgent(mock_discovery_service)
+            decision = await orchestrator.route_request(RoutingRequest(query="Hello"))
+            
+            assert decision.selected_agent is None
+            assert decision.error == "Selected agent made-up-agent is not registered"
+            assert decision.is_successful() is False
+            mock_discovery_service.get_agent_by_id.assert_awaited_once_with("made-up-agent")
+            mock_discovery_service.mark_agent_request.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_route_request_failure(self, mock_discovery_service, mock_settings):
         """Test request routing failure handling."""
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model') as mock_infer_model, \
+             patch('orchestrator.agent.OpenAIModel') as mock_openai_model, \
              patch('orchestrator.agent.Agent') as mock_agent_class:
             
             mock_model = MagicMock()
-            mock_infer_model.return_value = mock_model
+            mock_openai_model.return_value = mock_model
             mock_agent_instance = AsyncMock()
             mock_agent_class.return_value = mock_agent_instance
             
@@ -240,11 +432,216 @@ class TestOrchestratorAgent:
             assert decision.confidence == 0.0
             assert "Routing failed due to error" in decision.reasoning
 
+    @pytest.mark.asyncio
+    async def test_route_request_timeout_falls_back(self, mock_discovery_service, mock_settings):
+        """Test a stalled LLM call falls back to the first healthy agent of the preferred protocol."""
+        mock_settings.routing_timeout_seconds = 0.01
+        
+        with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
+             patch('orchestrator.agent.OpenAIModel'), \
+             patch('orchestrator.agent.Agent') as mock_agent_class:
+            
+            mock_agent_instance = AsyncMock()
+            mock_agent_class.return_value = mock_agent_instance
+            
+            async def stalled_run(*args, **kwargs):
+                await asyncio.sleep(1)
+            
+            mock_agent_instance.run.side_effect = stalled_run
+            
+            agents = [
+                DiscoveredAgent(
+                    agent_id=f"{protocol.value}-agent-{i}",
+                    name=f"Agent {i}",
+                    protocol=protocol,
+                    endpoint=f"http://agent-{i}:8000",
+                    capabilities=[]
+                )
+                for i, protocol in enumerate([ProtocolType.ACP, ProtocolType.A2A, ProtocolType.A2A])
+            ]
+            mock_discovery_service.get_healthy_agents.return_value = agents
+            
+            orchestrator = OrchestratorAgent(mock_discovery_service)
+            decision = await orchestrator.route_request(
+                RoutingRequest(query="2 + 2", preferred_protocol=ProtocolType.A2A)
+            )
+            
+            assert decision.selected_agent == agents[1]
+            assert decision.confidence == 0.0
+            assert "timed out" in decision.reasoning
+
+    @pytest.mark.asyncio
+    async def test_route_request_inlines_healthy_agents(self, mock_discovery_service, mock_settings):
+        """Test the healthy agent roster is embedded in the LLM prompt."""
+        with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
+             patch('orchestrator.agent.OpenAIModel'), \
+             patch('orchestrator.agent.Agent') as mock_agent_class:
+            
+            mock_agent_instance = AsyncMock()
+            mock_agent_class.return_value = mock_agent_instance
+            
+            test_agent = DiscoveredAgent(
+                agent_id="greeting-agent",
+                name="Greeting Agent",
+                protocol=ProtocolType.ACP,
+                endpoint="http://greeting:8000",
+                capabilities=[AgentCapability(name="greeting", description="Generate greetings")],
+                status=AgentStatus.HEALTHY
+            )
+            other_agent = DiscoveredAgent(
+                agent_id="math-agent",
+                name="Math Agent",
+                protocol=ProtocolType.A2A,
+                endpoint="http://math:8000",
+                capabilities=[AgentCapability(name="arithmetic", description="Do math")],
+                status=AgentStatus.HEALTHY
+            )
+            mock_discovery_service.get_healthy_agents.return_value = [test_agent, other_agent]
+            
+            mock_result = MagicMock()
+            mock_result.data = {
+                "selected_agent_id": "greeting-agent",
+                "confidence": 0.9,
+                "reasoning": "Greeting request"
+            }
+            mock_agent_instance.run.return_value = mock_result
+            
+            orchestrator = OrchestratorAgent(mock_discovery_service)
+            await orchestrator.route_request(RoutingRequest(query="Hello"))
+            
+            query, = mock_agent_instance.run.call_args.args
+            context = mock_agent_instance.run.call_args.kwargs["deps"]
+            
+            assert "greeting-agent | Greeting Agent | acp | http://greeting:8000 | greeting" in query
+            assert context.agents_in_prompt is True
+            assert context.available_agents == [test_agent, other_agent]
+
+    def test_describe_request_omits_unset_fields(self):
+        """Test unset request fields are left out of the prompt instead of rendered as None."""
+        bare = OrchestratorAgent._describe_request(RoutingRequest(query="Hello"))
+        full = OrchestratorAgent._describe_request(RoutingRequest(
+            query="Hello",
+            context={"lang": "en"},
+            preferred_protocol=ProtocolType.A2A,
+            preferred_agent="greeting-agent"
+        ))
+        
+        assert bare == 'User Query: "Hello"'
+        assert "None" not in bare
+        assert "Context: {'lang': 'en'}" in full
+        assert "Preferred Protocol: a2a" in full
+        assert "Preferred Agent: greeting-agent" in full
+
+    @pytest.mark.asyncio
+    async def test_route_request_fast_path(self, mock_discovery_service, mock_settings):
+        """Test routing skips the LLM when the roster determines the agent."""
+        with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
+             patch('orchestrator.agent.OpenAIModel'), \
+             patch('orchestrator.agent.Agent') as mock_agent_class:
+            
+            mock_agent_instance = AsyncMock()
+            mock_agent_class.return_value = mock_agent_instance
+            
+            greeting_agent = DiscoveredAgent(
+                agent_id="greeting-agent",
+                name="Greeting Agent",
+                protocol=ProtocolType.ACP,
+                endpoint="http://greeting:8000",
+                capabilities=[AgentCapability(name="greeting", description="Generate greetings")]
+            )
+            math_agent = DiscoveredAgent(
+                agent_id="math-agent",
+                name="Math Agent",
+                protocol=ProtocolType.A2A,
+                endpoint="http://math:8000",
+                capabilities=[AgentCapability(name="arithmetic", description="Do math")]
+            )
+            mock_discovery_service.get_healthy_agents.return_value = [greeting_agent, math_agent]
+            
+            orchestrator = OrchestratorAgent(mock_discovery_service)
+            
+            preferred = await orchestrator.route_request(
+                RoutingRequest(query="Greeting for Bob", preferred_agent="greeting-agent")
+            )
+            by_protocol = await orchestrator.route_request(
+                RoutingRequest(query="Do arithmetic: 2 + 2", preferred_protocol=ProtocolType.A2A)
+            )
+            
+            assert preferred.selected_agent == greeting_agent
+            assert preferred.confidence == 1.0
+            assert by_protocol.selected_agent == math_agent
+            assert by_protocol.confidence == 0.9
+            mock_agent_instance.run.assert_not_called()
+            assert orchestrator.get_metrics().successful_requests == 2
+            assert mock_discovery_service.get_healthy_agents.await_count == 2
+            
+            # A sole agent the query does not ask for is left to the LLM,
+            # which gets the roster fetched for the fast path
+            mock_result = MagicMock()
+            mock_result.data = {"selected_agent_id": "math-agent", "confidence": 0.4, "reasoning": "Best guess"}
+            mock_agent_instance.run.return_value = mock_result
+            unmatched = await orchestrator.route_request(
+                RoutingRequest(query="Write a poem", preferred_protocol=ProtocolType.A2A)
+            )
+            
+            assert unmatched.confidence == 0.4
+            mock_agent_instance.run.assert_awaited_once()
+            assert "math-agent" in mock_agent_instance.run.call_args.args[0]
+            assert mock_discovery_service.get_healthy_agents.await_count == 3
+            
+            # A preferred agent that cannot handle the query is only a hint to the LLM
+            mock_result.data = {"selected_agent_id": "math-agent", "confidence": 0.8, "reasoning": "Math query"}
+            overridden = await orchestrator.route_request(
+                RoutingRequest(query="Do arithmetic: 3 + 4", preferred_agent="greeting-agent")
+            )
+            
+            assert overridden.selected_agent == math_agent
+            assert overridden.confidence == 0.8
+            assert mock_agent_instance.run.await_count == 2
+            assert "Preferred Agent: greeting-agent" in mock_agent_instance.run.call_args.args[0]
+            
+            # Unchanged roster reuses the rendered table
+            assert orchestrator._render_agent_table([test_agent]) is orchestrator._agent_table_cache[1]
+
+    @pytest.mark.asyncio
+    async def test_route_many_single_llm_call(self, mock_discovery_service, mock_settings):
+        """Test batched routing maps decisions back and re-routes omitted requests."""
+        with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
+             patch('orchestrator.agent.OpenAIModel'), \
+             patch('orchestrator.agent.Agent') as mock_agent_class:
+            
+            mock_agent_instance = AsyncMock()
+            mock_agent_class.return_value = mock_agent_instance
+            
+            mock_result = MagicMock()
+            mock_result.data = [
+                {"request_id": "second", "selected_agent_id": None, "confidence": 0.7, "reasoning": "Batched"}
+            ]
+            mock_agent_instance.run.return_value = mock_result
+            
+            orchestrator = OrchestratorAgent(mock_discovery_service)
+            orchestrator._route_single = AsyncMock(side_effect=lambda request: RoutingDecision(
+                request_id=request.request_id, confidence=0.1, reasoning="Single"
+            ))
+            
+            decisions = await orchestrator._route_many([
+                RoutingRequest(request_id="first", query="Hello"),
+                RoutingRequest(request_id="second", query="What is 2+2?"),
+            ])
+            
+            assert [decision.request_id for decision in decisions] == ["first", "second"]
+            assert decisions[0].reasoning == "Single"
+            assert decisions[1].reasoning == "Batched"
+            assert decisions[1].llm_provider == LLMProvider.OPENAI
+            mock_agent_instance.run.assert_awaited_once()
+            query = mock_agent_instance.run.call_args.args[0]
+            assert "Request ID: first" in query and "Request ID: second" in query
+
     @pytest.mark.asyncio
     async def test_execute_on_agent_acp(self, mock_discovery_service, mock_settings):
         """Test execution on ACP agent."""
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model'), \
+             patch('orchestrator.agent.OpenAIModel'), \
              patch('orchestrator.agent.Agent'):
             
             orchestrator = OrchestratorAgent(mock_discovery_service)
@@ -267,11 +664,36 @@ class TestOrchestratorAgent:
             assert response_data["protocol"] == "acp"
             assert response_data["simulated"] is True
 
+    @pytest.mark.asyncio
+    async def test_execute_on_agent_mcp(self, mock_discovery_service, mock_settings):
+        """Test execution on MCP agent goes through the simulated executor."""
+        with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
+             patch('orchestrator.agent.OpenAIModel'), \
+             patch('orchestrator.agent.Agent'):
+            
+            orchestrator = OrchestratorAgent(mock_discovery_service)
+            
+            agent = DiscoveredAgent(
+                agent_id="test-mcp-agent",
+                name="Test MCP Agent",
+                protocol=ProtocolType.MCP,
+                endpoint="http://test:8003",
+                capabilities=[]
+            )
+            
+            request = RoutingRequest(query="Test query")
+            
+            response_data = await orchestrator._execute_on_agent(agent, request)
+            
+            assert response_data["message"] == "Response from Test MCP Agent (MCP protocol)"
+            assert response_data["protocol"] == "mcp"
+            assert response_data["simulated"] is True
+
     @pytest.mark.asyncio
     async def test_execute_on_agent_a2a(self, mock_discovery_service, mock_settings):
         """Test execution on A2A agent."""
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model'), \
+             patch('orchestrator.agent.OpenAIModel'), \
              patch('orchestrator.agent.Agent'), \
              patch('orchestrator.protocols.a2a_client.A2AProtocolClient') as mock_a2a_client:
             
@@ -310,7 +732,7 @@ class TestOrchestratorAgent:
     async def test_process_request_success(self, mock_discovery_service, mock_settings):
         """Test complete request processing."""
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model'), \
+             patch('orchestrator.agent.OpenAIModel'), \
              patch('orchestrator.agent.Agent'):
             
             orchestrator = OrchestratorAgent(mock_discovery_service)
@@ -335,6 +757,7 @@ class TestOrchestratorAgent:
             
             # Mock that the agent is available in healthy agents list
             mock_discovery_service.get_healthy_agents.return_value = [test_agent]
+            mock_discovery_service.get_agent_by_id.return_value = test_agent
             
             orchestrator.route_request = AsyncMock(return_value=routing_decision)
             
@@ -346,11 +769,44 @@ class TestOrchestratorAgent:
             assert response.error is None
             assert "routing_decision" in response.metadata
 
+    @pytest.mark.asyncio
+    async def test_process_request_executes_registry_agent(self, mock_discovery_service, mock_settings):
+        """Test execution uses the registry record rather than the LLM's copy."""
+        with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
+             patch('orchestrator.agent.OpenAIModel'), \
+             patch('orchestrator.agent.Agent'):
+            
+            orchestrator = OrchestratorAgent(mock_discovery_service)
+            
+            registered_agent = DiscoveredAgent(
+                agent_id="test-agent",
+                name="Test Agent",
+                protocol=ProtocolType.ACP,
+                endpoint="http://test:8000",
+                status=AgentStatus.HEALTHY
+            )
+            echoed_agent = registered_agent.model_copy(update={"endpoint": "http://wrong:9999"})
+            
+            mock_discovery_service.get_agent_by_id.return_value = registered_agent
+            orchestrator.route_request = AsyncMock(return_value=RoutingDecision(
+                request_id="test-request-123",
+                selected_agent=echoed_agent,
+                confidence=0.8,
+                reasoning="Good match"
+            ))
+            orchestrator._execute_on_agent = AsyncMock(return_value={"message": "ok"})
+            
+            response = await orchestrator.process_request(RoutingRequest(query="Test query"))
+            
+            assert response.success is True
+            mock_discovery_service.get_agent_by_id.assert_awaited_once_with("test-agent")
+            assert orchestrator._execute_on_agent.call_args.args[0] is registered_agent
+
     @pytest.mark.asyncio
     async def test_process_request_no_agent_selected(self, mock_discovery_service, mock_settings):
         """Test request processing when no agent is selected."""
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model'), \
+             patch('orchestrator.agent.OpenAIModel'), \
              patch('orchestrator.agent.Agent'):
             
             orchestrator = OrchestratorAgent(mock_discovery_service)
@@ -373,11 +829,64 @@ class TestOrchestratorAgent:
             assert response.agent_id == "none"
             assert "No suitable agent found" in response.error
 
+    @pytest.mark.asyncio
+    async def test_route_batch_resumes_from_checkpoint(self, mock_discovery_service, mock_settings, tmp_path):
+        """Test batch routing skips requests already completed in the checkpoint."""
+        with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
+             patch('orchestrator.agent.OpenAIModel'), \
+             patch('orchestrator.agent.Agent'):
+            
+            orchestrator = OrchestratorAgent(mock_discovery_service)
+            
+            async def fake_route(request):
+                return RoutingDecision(
+                    request_id=request.request_id,
+                    selected_agent=None,
+                    confidence=0.5,
+                    reasoning="Batch decision"
+                )
+            
+            orchestrator.route_request = AsyncMock(side_effect=fake_route)
+            
+            output = tmp_path / "decisions.jsonl"
+            output.write_text(
+                '{"request_id": "done", "error": null}\n'
+                '{"request_id": "failed", "error": "timeout"}\n'
+                '{"request_id": "trunc'
+            )
+            
+            requests = [
+                RoutingRequest(request_id="done", query="Already routed"),
+                RoutingRequest(request_id="failed", query="Retry me"),
+                RoutingRequest(request_id="new", query="Route me"),
+            ]
+            
+            await orchestrator.route_batch(requests, str(output), concurrency=2)
+            
+            routed_ids = {call.args[0].request_id for call in orchestrator.route_request.call_args_list}
+            assert routed_ids == {"failed", "new"}
+            assert OrchestratorAgent._read_batch_checkpoint(str(output)) == {"done", "failed", "new"}
+
+    def test_read_batch_checkpoint_last_line_wins(self, tmp_path):
+        """Test checkpoint reading skips non-object lines and keeps each request's last result."""
+        output = tmp_path / "decisions.jsonl"
+        output.write_text(
+            '[1, 2]\n'
+            '"stray"\n'
+            '{"error": null}\n'
+            '{"request_id": "retried", "error": "timeout"}\n'
+            '{"request_id": "regressed", "error": null}\n'
+            '{"request_id": "retried", "error": null}\n'
+            '{"request_id": "regressed", "error": "timeout"}\n'
+        )
+        
+        assert OrchestratorAgent._read_batch_checkpoint(str(output)) == {"retried"}
+
     @pytest.mark.asyncio
     async def test_health_check(self, mock_discovery_service, mock_settings):
         """Test orchestrator health check."""
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model'), \
+             patch('orchestrator.agent.OpenAIModel'), \
              patch('orchestrator.agent.Agent'):
             
             orchestrator = OrchestratorAgent(mock_discovery_service)
@@ -397,19 +906,23 @@ class TestOrchestratorAgent:
     def test_get_metrics(self, mock_discovery_service, mock_settings):
         """Test metrics retrieval."""
         with patch('orchestrator.agent.get_settings', return_value=mock_settings), \
-             patch('orchestrator.agent.infer_model'), \
+             patch('orchestrator.agent.OpenAIModel'), \
              patch('orchestrator.agent.Agent'):
             
             orchestrator = OrchestratorAgent(mock_discovery_service)
             
             # Modify some metrics
-            orchestrator.metrics.total_requests = 5
-            orchestrator.metrics.successful_requests = 4
-            orchestrator.metrics.failed_requests = 1
+            orchestrator._metrics.total_requests = 5
+            orchestrator._metrics.successful_requests = 4
+            orchestrator._metrics.failed_requests = 1
             
             metrics = orchestrator.get_metrics()
             
             assert metrics.total_requests == 5
             assert metrics.successful_requests == 4
             assert metrics.failed_requests == 1
-            assert metrics.success_rate == 80.0
\ No newline at end of file
+            assert metrics.success_rate == 80.0
+            
+            # get_metrics returns a snapshot, not the live counters
+            orchestrator._metrics.total_requests += 1
+            assert metrics.total_requests == 5
\ No newline at end of file
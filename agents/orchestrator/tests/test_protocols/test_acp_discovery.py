@@ -45,7 +45,7 @@ class TestACPDiscoveryStrategy:
         schema_response.json.return_value = schema_data
         
         # Create async mock for get method
-        async def mock_get_func(url):
+        async def mock_get_func(url, **kwargs):
             if "capabilities" in url:
                 return capabilities_response
             elif "schema" in url:
@@ -201,6 +201,51 @@ class TestACPDiscoveryStrategy:
         
         assert status == AgentStatus.UNKNOWN
     
+    async def test_health_check_uses_injected_client(self):
+        """Test health checks reuse an injected client instead of opening one per call"""
+        from orchestrator.models import DiscoveredAgent
+        
+        agent = DiscoveredAgent(
+            agent_id="test-agent",
+            name="Test Agent",
+            protocol=ProtocolType.ACP,
+            endpoint="http://test:8000",
+            capabilities=[]
+        )
+        
+        health_response = MagicMock()
+        health_response.status_code = 200
+        health_response.json.return_value = create_health_response("healthy")
+        
+        shared_client = AsyncMock()
+        shared_client.get = AsyncMock(return_value=health_response)
+        strategy = ACPDiscoveryStrategy(client=shared_client)
+        
+        with patch('orchestrator.protocols.acp_discovery.httpx.AsyncClient') as mock_client_class:
+            assert await strategy.health_check(agent) == AgentStatus.HEALTHY
+            assert await strategy.health_check(agent) == AgentStatus.HEALTHY
+        
+        mock_client_class.assert_not_called()
+        assert shared_client.get.await_count == 2
+        # The health check timeout reaches the shared client on each request
+        assert shared_client.get.call_args.kwargs["timeout"] == 3.0
+        shared_client.aclose.assert_not_awaited()
+    
+    async def test_discovery_passes_timeout_to_injected_client(self):
+        """Test discovery requests carry the discovery timeout through an injected client"""
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = create_acp_capabilities_response()
+        
+        shared_client = AsyncMock()
+        shared_client.get = AsyncMock(return_value=response)
+        strategy = ACPDiscoveryStrategy(client=shared_client)
+        
+        agent = await strategy.discover(create_container_info())
+        
+        assert agent is not None
+        assert [call.kwargs["timeout"] for call in shared_client.get.call_args_list] == [5.0, 5.0]
+    
     async def test_parse_acp_capabilities_with_mixed_types(self, strategy):
         """Test parsing capabilities with mixed dict/string types"""
         capabilities_data = {